@@ -0,0 +1,56 @@
+"""In-memory TTL cache for idempotent Schwab read responses."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable
+from typing import Any
+
+_DEFAULT_MAX_ENTRIES: int = 256
+
+MISSING: Any = object()
+
+
+class ResponseCache:
+    """Bounded key/value cache whose entries expire after a per-entry TTL.
+
+    Cached payloads are shared between callers and must be treated as
+    read-only. When full, the oldest entry is evicted first.
+    """
+
+    __slots__ = ("_entries", "_max_entries")
+
+    _entries: dict[Hashable, tuple[float, Any]]
+    _max_entries: int
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._entries = {}
+        self._max_entries = max_entries
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for *key*, or ``MISSING`` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return MISSING
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store *value* under *key* for *ttl* seconds."""
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["MISSING", "ResponseCache"]
@@ -1,7 +1,9 @@
 """Click CLI commands for schwab-mcp: auth, server, save-credentials."""
 
+import importlib.util
 import os
 import sys
+from typing import Any
 
 import anyio
 import click
@@ -19,6 +21,13 @@ APP_NAME = "schwab-mcp"
 TOKEN_MAX_AGE_SECONDS = schwab_auth.DEFAULT_MAX_TOKEN_AGE_SECONDS
 
 
+def _asyncio_backend_options() -> dict[str, Any]:
+    """Run the server on uvloop when it is installed (non-Windows only)."""
+    if sys.platform == "win32" or importlib.util.find_spec("uvloop") is None:
+        return {}
+    return {"use_uvloop": True}
+
+
 @click.group()
 def cli():
     """Schwab Model Context Protocol CLI."""
@@ -322,7 +331,7 @@ def server(
             enable_technical_tools=not no_technical_tools,
             use_json=json_output,
         )
-        anyio.run(server.run, backend="asyncio")
+        anyio.run(server.run, backend="asyncio", backend_options=_asyncio_backend_options())
         return 0
     except Exception as e:
         send_error_response(f"Error running server: {str(e)}", code=500, details={"error": str(e)})
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, cast
 
 from mcp.server.fastmcp import Context as MCPContext
 from schwab.client import AsyncClient
 
 from schwab_mcp.approvals import ApprovalManager
+from schwab_mcp.cache import ResponseCache
 from schwab_mcp.previews import PreviewStore
 
 if TYPE_CHECKING:
@@ -21,6 +24,7 @@ if TYPE_CHECKING:
         ToolsClient,
         TransactionsClient,
     )
+    from schwab_mcp.tools.utils import RateLimiter
 else:  # pragma: no cover - runtime only
     AccountClient = OptionsClient = OrdersClient = PriceHistoryClient = QuotesClient = ToolsClient = (
         TransactionsClient
@@ -41,6 +45,10 @@ class SchwabServerContext:
     quotes: QuotesClient = field(init=False)
     transactions: TransactionsClient = field(init=False)
     preview_store: PreviewStore = field(default_factory=PreviewStore)
+    rate_limiter: RateLimiter | None = None
+    response_cache: ResponseCache = field(default_factory=ResponseCache, init=False)
+    account_numbers: tuple[float, Any] | None = field(default=None, init=False)
+    price_history_fetchers: dict[str, Callable[..., Awaitable[Any]]] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
         self.tools = cast(ToolsClient, self.client)
@@ -52,13 +60,17 @@ class SchwabServerContext:
         self.transactions = cast(TransactionsClient, self.client)
 
 
+# Resolved in C; every facade property goes through this on each tool call.
+_lifespan_context = attrgetter("request_context.lifespan_context")
+
+
 class SchwabContext(MCPContext[Any, SchwabServerContext, Any]):
     """FastMCP context with typed accessors for Schwab APIs."""
 
     @property
     def schwab(self) -> SchwabServerContext:
         """Return the lifespan-scoped server context."""
-        context = self.request_context.lifespan_context
+        context = _lifespan_context(self)
         if context is None:
             raise RuntimeError("Schwab context is unavailable outside a request")
         return context
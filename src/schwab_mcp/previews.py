@@ -65,6 +65,15 @@ class PreviewStore:
         )
         return preview_id
 
+    def _validated(self, preview_id: str, account_hash: str) -> PreviewEntry:
+        entry = self._entries.get(preview_id)
+        if entry is None or entry.created_at + self._ttl < time.monotonic():
+            self._entries.pop(preview_id, None)
+            raise ValueError(f"Preview '{preview_id}' not found or expired.")
+        if entry.account_hash != account_hash:
+            raise ValueError("Account hash mismatch: preview was created for a different account.")
+        return entry
+
     def pop(self, preview_id: str, account_hash: str) -> PreviewEntry:
         """Retrieve and remove a preview entry, validating id and account_hash.
 
@@ -72,14 +81,26 @@ class PreviewStore:
             ValueError: If the id is unknown or the entry has expired.
             ValueError: If the account_hash does not match the stored entry.
         """
-        entry = self._entries.get(preview_id)
-        if entry is None or entry.created_at + self._ttl < time.monotonic():
-            self._entries.pop(preview_id, None)
-            raise ValueError(f"Preview '{preview_id}' not found or expired.")
-        if entry.account_hash != account_hash:
-            raise ValueError("Account hash mismatch: preview was created for a different account.")
+        entry = self._validated(preview_id, account_hash)
         del self._entries[preview_id]
         return entry
 
+    def pop_many(self, preview_ids: list[str], account_hash: str) -> list[PreviewEntry]:
+        """Retrieve and remove several preview entries, all or nothing.
+
+        Every id is validated before any entry is removed, so one bad id
+        leaves the other previews available.
+
+        Raises:
+            ValueError: If any id is unknown, expired, or repeated, or any
+                entry belongs to a different account.
+        """
+        if len(set(preview_ids)) != len(preview_ids):
+            raise ValueError("Preview IDs must not repeat.")
+        entries = [self._validated(preview_id, account_hash) for preview_id in preview_ids]
+        for preview_id in preview_ids:
+            del self._entries[preview_id]
+        return entries
+
 
 __all__ = ["PreviewEntry", "PreviewStore"]
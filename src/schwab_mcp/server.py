@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import sys
 from collections.abc import AsyncGenerator, Callable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any
 
+import httpx
 import mcp.types as types
 from mcp.server.fastmcp import FastMCP
 from schwab.client import AsyncClient
@@ -16,10 +18,47 @@ from schwab_mcp.approvals import ApprovalManager
 from schwab_mcp.context import SchwabServerContext
 from schwab_mcp.resources import register_resources
 from schwab_mcp.tools import register_tools
-from schwab_mcp.tools.utils import strip_noise
+from schwab_mcp.tools.utils import RateLimiter, encode_json, strip_noise
 
 logger = logging.getLogger(__name__)
 
+# Agents often space tool calls further apart than httpx's 5 s default
+# keep-alive, which would otherwise cost a fresh TLS handshake per call.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=30.0,
+)
+
+
+def _http_transport() -> httpx.AsyncHTTPTransport:
+    """Return a pooled transport, negotiating HTTP/2 when ``h2`` is installed."""
+    return httpx.AsyncHTTPTransport(
+        limits=_HTTP_LIMITS,
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+
+
+async def _tune_connection_pool(client: AsyncClient) -> None:
+    """Swap the Schwab session's default transport for a tuned connection pool.
+
+    schwab-py builds its OAuth session internally without exposing httpx
+    options, so the transport is replaced after construction. That relies on
+    httpx's private ``_transport`` attribute; if a future httpx drops it, the
+    session keeps its default pool and a warning is logged. Proxy mounts are
+    left untouched.
+    """
+    session = getattr(client, "session", None)
+    if not isinstance(session, httpx.AsyncClient):
+        logger.debug("Schwab client has no httpx session; keeping its connection pool.")
+        return
+    if not hasattr(session, "_transport"):
+        logger.warning("httpx.AsyncClient no longer exposes _transport; keeping the default connection pool.")
+        return
+    previous = session._transport
+    session._transport = _http_transport()
+    await previous.aclose()
+
 
 def _client_lifespan(
     client: AsyncClient,
@@ -29,8 +68,14 @@ def _client_lifespan(
 
     @asynccontextmanager
     async def lifespan(_: FastMCP) -> AsyncGenerator[SchwabServerContext, None]:
+        await _tune_connection_pool(client)
         await approval_manager.start()
-        context = SchwabServerContext(client=client, approval_manager=approval_manager)
+        context = SchwabServerContext(
+            client=client,
+            approval_manager=approval_manager,
+            # Schwab's trader API allows 120 requests per minute per application.
+            rate_limiter=RateLimiter(max_rate=120, time_period=60.0),
+        )
         try:
             yield context
         finally:
@@ -78,7 +123,16 @@ class SchwabMCPServer:
             def _json_strip_transform(payload: Any) -> Any:
                 if isinstance(payload, str):
                     return payload
-                return strip_noise(payload)
+                stripped = strip_noise(payload)
+                # Hand FastMCP a finished result: every tool returns JSONType,
+                # which its output schema wraps under "result" and accepts
+                # unconditionally. Returning the payload instead would pay for
+                # a pydantic round-trip, an indented re-encode, and a
+                # per-value jsonschema check on every large response.
+                return types.CallToolResult(
+                    content=[types.TextContent(type="text", text=encode_json(stripped))],
+                    structuredContent={"result": stripped},
+                )
 
             result_transform = _json_strip_transform
 
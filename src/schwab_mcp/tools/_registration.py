@@ -76,26 +76,30 @@ def _ensure_schwab_context(func: ToolFn) -> ToolFn:
     signature, ctx_params = _resolve_context_parameters(func)
     if not ctx_params:
         return func
+    is_coroutine = inspect.iscoroutinefunction(func)
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        bound = signature.bind_partial(*args, **kwargs)
+        # FastMCP passes every argument by keyword, so the per-call
+        # signature bind is only needed for direct positional calls.
+        bound = signature.bind_partial(*args, **kwargs) if args else None
+        arguments = bound.arguments if bound is not None else kwargs
         for name in ctx_params:
-            if name not in bound.arguments:
+            if name not in arguments:
                 continue
-            value = bound.arguments[name]
+            value = arguments[name]
             if isinstance(value, SchwabContext):
                 continue
             if isinstance(value, MCPContext):
-                bound.arguments[name] = SchwabContext.model_construct(
+                arguments[name] = SchwabContext.model_construct(
                     _request_context=value.request_context,
                     _fastmcp=getattr(value, "_fastmcp", None),
                 )
             else:
                 raise TypeError(f"Argument '{name}' must be an MCP context, got {type(value)!r}")
 
-        result = func(*bound.args, **bound.kwargs)
-        if inspect.isawaitable(result):
+        result = func(*bound.args, **bound.kwargs) if bound is not None else func(**kwargs)
+        if is_coroutine or inspect.isawaitable(result):
             return await result
         return result
 
@@ -146,17 +150,21 @@ def _wrap_with_approval(func: ToolFn) -> ToolFn:
     signature, ctx_params = _resolve_context_parameters(func)
     if not ctx_params:
         raise TypeError(f"Write tool '{func.__name__}' must accept a SchwabContext parameter for approval gating.")
+    is_coroutine = inspect.iscoroutinefunction(func)
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        bound = signature.bind_partial(*args, **kwargs)
+        # As in _ensure_schwab_context, FastMCP passes keywords only, so the
+        # signature bind is reserved for direct positional calls.
+        bound = signature.bind_partial(*args, **kwargs) if args else None
+        call_arguments = bound.arguments if bound is not None else kwargs
         context: SchwabContext | None = None
 
         for name in ctx_params:
-            if name not in bound.arguments:
+            if name not in call_arguments:
                 continue
 
-            value = bound.arguments[name]
+            value = call_arguments[name]
 
             if isinstance(value, SchwabContext):
                 context = value
@@ -167,14 +175,14 @@ def _wrap_with_approval(func: ToolFn) -> ToolFn:
                     _request_context=value.request_context,
                     _fastmcp=getattr(value, "_fastmcp", None),
                 )
-                bound.arguments[name] = converted
+                call_arguments[name] = converted
                 context = converted
                 continue
 
         if context is None:
             raise RuntimeError(f"Write tool '{func.__name__}' missing SchwabContext during invocation.")
 
-        arguments = {name: _format_argument(arg) for name, arg in bound.arguments.items() if name not in ctx_params}
+        arguments = {name: _format_argument(arg) for name, arg in call_arguments.items() if name not in ctx_params}
 
         request = ApprovalRequest(
             id=str(uuid.uuid4()),
@@ -194,8 +202,8 @@ def _wrap_with_approval(func: ToolFn) -> ToolFn:
             request.request_id,
         )
         if decision is ApprovalDecision.APPROVED:
-            result = func(*bound.args, **bound.kwargs)
-            if inspect.isawaitable(result):
+            result = func(*bound.args, **bound.kwargs) if bound is not None else func(**kwargs)
+            if is_coroutine or inspect.isawaitable(result):
                 return await result
             return result
 
@@ -269,10 +277,13 @@ def _has_progress_token(context: SchwabContext) -> bool:
 
 
 def _wrap_result_transform(func: ToolFn, transform: Callable[[Any], Any]) -> ToolFn:
+    # Decided once at registration so the per-call path skips isawaitable().
+    is_coroutine = inspect.iscoroutinefunction(func)
+
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
         result = func(*args, **kwargs)
-        if inspect.isawaitable(result):
+        if is_coroutine or inspect.isawaitable(result):
             result = await result
         return transform(result)
 
@@ -296,7 +307,15 @@ def register_tool(
     annotations: ToolAnnotations | None = None,
     result_transform: Callable[[Any], Any] | None = None,
 ) -> None:
-    """Register a Schwab tool using FastMCP's decorator plumbing."""
+    """Register a Schwab tool using FastMCP's decorator plumbing.
+
+    Raises:
+        ValueError: If a tool with the same name is already registered.
+            FastMCP would otherwise build the schema, log a warning, and
+            silently keep the first definition.
+    """
+    if server._tool_manager.get_tool(func.__name__) is not None:
+        raise ValueError(f"Tool '{func.__name__}' is already registered")
     func = _ensure_schwab_context(func)
     if write:
         func = _wrap_with_approval(func)
@@ -1,8 +1,11 @@
 """Account and user-preference tools for the Schwab MCP server."""
 
+import asyncio
+import functools
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeAlias
 
 from mcp.server.fastmcp import FastMCP
 
@@ -10,6 +13,10 @@ from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
 from schwab_mcp.tools.utils import JSONType, SchwabAPIError, call
 
+# Account number -> hash mappings only change when accounts are linked or
+# unlinked, so they are reused across requests for this long.
+_ACCOUNT_NUMBERS_TTL: float = 3600.0
+
 _COMPACT_ACCOUNT_FIELDS = frozenset({"type", "accountNumber", "roundTrips", "isDayTrader"})
 
 _COMPACT_BALANCE_FIELDS = frozenset(
@@ -23,6 +30,14 @@ _COMPACT_BALANCE_FIELDS = frozenset(
 )
 
 
+AccountHash: TypeAlias = Annotated[str, "Account hash for the Schwab account (from get_accounts)"]
+
+Verbose: TypeAlias = Annotated[
+    bool,
+    "Return the full raw payload (all balance types, and full position fields if include_positions=True) instead of the compact default.",
+]
+
+
 @dataclass(frozen=True, slots=True)
 class AccountIdentity:
     """Minimal account identifier returned by account-listing helpers."""
@@ -32,6 +47,16 @@ class AccountIdentity:
     is_default: bool
 
 
+@functools.cache
+def _positions_fields(fields: Any) -> tuple[Any, ...]:
+    """Return the immutable ``fields=`` argument requesting positions.
+
+    Keyed on the client's ``Account.Fields`` enum so the tuple is built once
+    per client class rather than allocated on every tool invocation.
+    """
+    return (fields.POSITIONS,)
+
+
 def _prune_position(position: dict[str, Any]) -> dict[str, Any]:
     result: dict[str, Any] = {}
     instrument = position.get("instrument")
@@ -90,6 +115,22 @@ def _prune_account_response(payload: JSONType) -> JSONType:
     return payload
 
 
+async def _get_account_numbers(ctx: SchwabContext) -> JSONType:
+    """Return the account number/hash payload, cached on the server context."""
+    schwab = ctx.schwab
+    cached = schwab.account_numbers
+    if cached is not None and time.monotonic() - cached[0] < _ACCOUNT_NUMBERS_TTL:
+        return cached[1]
+    payload = await call(schwab.accounts.get_account_numbers, rate_limiter=schwab.rate_limiter)
+    schwab.account_numbers = (time.monotonic(), payload)
+    return payload
+
+
+def invalidate_account_numbers(ctx: SchwabContext) -> None:
+    """Drop the cached account number/hash payload so the next lookup refetches."""
+    ctx.schwab.account_numbers = None
+
+
 async def _get_identity_map(ctx: SchwabContext) -> dict[str, AccountIdentity]:
     """Build accountNumber -> AccountIdentity from account numbers and user preferences.
 
@@ -98,8 +139,10 @@ async def _get_identity_map(ctx: SchwabContext) -> dict[str, AccountIdentity]:
     accountHash/nickname/isDefault enrichment (an empty map is returned).
     """
     try:
-        numbers_payload = await call(ctx.accounts.get_account_numbers)
-        prefs_payload = await call(ctx.accounts.get_user_preferences)
+        numbers_payload, prefs_payload = await asyncio.gather(
+            _get_account_numbers(ctx),
+            call(ctx.accounts.get_user_preferences, rate_limiter=ctx.schwab.rate_limiter),
+        )
     except SchwabAPIError:
         return {}
 
@@ -172,45 +215,51 @@ async def get_accounts(
         bool,
         "Request holdings/positions for each account. In compact mode (default) positions are pruned to symbol, quantity, marketValue, averagePrice, unrealizedPL; verbose=True returns the raw, unpruned position fields instead.",
     ] = False,
-    verbose: Annotated[
-        bool,
-        "Return the full raw payload (all balance types, and full position fields if include_positions=True) instead of the compact default.",
-    ] = False,
+    verbose: Verbose = False,
 ) -> JSONType:
     """Returns balances/info for all linked accounts (funds, cash, margin); pass include_positions=True to also include holdings.
     Includes each account's accountHash (required for account-specific calls like get_account, orders, transactions), nickname, and isDefault (the account marked as primary in Schwab user preferences).
     By default returns compact fields only (account type/number, equity/buyingPower/cashBalance/cashAvailableForTrading/liquidationValue from currentBalances; initialBalances and projectedBalances are dropped; positions if included are reduced to symbol, net quantity (positive=long/negative=short), marketValue, averagePrice, unrealizedPL); pass verbose=True for the full raw payload (positions unpruned if include_positions=True).
     """
-    identity_map = await _get_identity_map(ctx)
+    client = ctx.accounts
     kwargs: dict[str, Any] = {}
     if include_positions:
-        kwargs["fields"] = [ctx.accounts.Account.Fields.POSITIONS]
-    result = await call(ctx.accounts.get_accounts, **kwargs)
+        kwargs["fields"] = _positions_fields(client.Account.Fields)
+    # Identity enrichment is independent of the account payload; fetch both at once.
+    identity_map, result = await asyncio.gather(
+        _get_identity_map(ctx),
+        call(client.get_accounts, rate_limiter=ctx.schwab.rate_limiter, **kwargs),
+    )
     pruned = result if verbose else _prune_account_response(result)
     return _enrich_with_identity(pruned, identity_map)
 
 
 async def get_account(
     ctx: SchwabContext,
-    account_hash: Annotated[str, "Account hash for the Schwab account (from get_accounts)"],
+    account_hash: AccountHash,
     include_positions: Annotated[
         bool,
         "Request holdings/positions. In compact mode (default) positions are pruned to symbol, quantity, marketValue, averagePrice, unrealizedPL; verbose=True returns the raw, unpruned position fields instead.",
     ] = False,
-    verbose: Annotated[
-        bool,
-        "Return the full raw payload (all balance types, and full position fields if include_positions=True) instead of the compact default.",
-    ] = False,
+    verbose: Verbose = False,
 ) -> JSONType:
     """Returns balance/info for a specific account via account_hash (from get_accounts); pass include_positions=True to also include holdings. Includes funds, cash, margin info.
     Includes the account's accountHash, nickname, and isDefault for self-describing output.
     By default returns compact fields only (account type/number, equity/buyingPower/cashBalance/cashAvailableForTrading/liquidationValue from currentBalances; initialBalances and projectedBalances are dropped; positions if included are reduced to symbol, net quantity (positive=long/negative=short), marketValue, averagePrice, unrealizedPL); pass verbose=True for the full raw payload (positions unpruned if include_positions=True).
     """
-    identity_map = await _get_identity_map(ctx)
+    client = ctx.accounts
     kwargs: dict[str, Any] = {}
     if include_positions:
-        kwargs["fields"] = [ctx.accounts.Account.Fields.POSITIONS]
-    result = await call(ctx.accounts.get_account, account_hash, **kwargs)
+        kwargs["fields"] = _positions_fields(client.Account.Fields)
+    try:
+        identity_map, result = await asyncio.gather(
+            _get_identity_map(ctx),
+            call(client.get_account, account_hash, rate_limiter=ctx.schwab.rate_limiter, **kwargs),
+        )
+    except SchwabAPIError:
+        # The hash may belong to a newly linked/unlinked account.
+        invalidate_account_numbers(ctx)
+        raise
     pruned = result if verbose else _prune_account_response(result)
     return _enrich_with_identity(pruned, identity_map, fallback_hash=account_hash)
 
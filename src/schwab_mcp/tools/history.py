@@ -1,38 +1,184 @@
 """Price history tools for retrieving OHLCV candle data from Schwab."""
 
+import datetime
 from collections.abc import Callable
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeAlias
 
 from mcp.server.fastmcp import FastMCP
 
-from schwab_mcp.context import SchwabContext
+from schwab_mcp.cache import MISSING
+from schwab_mcp.context import SchwabContext, SchwabServerContext
 from schwab_mcp.tools._registration import register_tool
-from schwab_mcp.tools.utils import JSONType, call, parse_datetime
+from schwab_mcp.tools.utils import JSONType, call, enum_member, gather_keyed, parse_symbols
+
+Symbol: TypeAlias = Annotated[str, "Symbol of the security"]
+
+StartDateTime: TypeAlias = Annotated[
+    str | None,
+    "Start date for history (ISO format, e.g., '2023-01-01T09:30:00')",
+]
+
+EndDateTime: TypeAlias = Annotated[
+    str | None,
+    "End date for history (ISO format, e.g., '2023-01-31T16:00:00')",
+]
+
+ExtendedHours: TypeAlias = Annotated[bool | None, "Include extended hours data"]
+
+PreviousClose: TypeAlias = Annotated[bool | None, "Include previous close data"]
+
+PeriodType: TypeAlias = Annotated[str | None, "Period type: DAY, MONTH, YEAR, YEAR_TO_DATE"]
+
+Period: TypeAlias = Annotated[
+    str | None,
+    (
+        "Number of periods (e.g., TEN_DAYS, ONE_MONTH, FIVE_YEARS). Varies by period_type. "
+        "Ignored if start/end datetimes provided."
+    ),
+]
+
+FrequencyType: TypeAlias = Annotated[
+    str | None,
+    "Frequency type: MINUTE (for DAY), DAILY/WEEKLY (for MONTH/YTD), DAILY/WEEKLY/MONTHLY (for YEAR)",
+]
+
+Frequency: TypeAlias = Annotated[
+    int | str | None,
+    "Number of frequencyType per candle (e.g., 1, 5, 10 for MINUTE). Strings are coerced to int.",
+]
+
+# Symbols fetched concurrently per round; larger batches run in several
+# rounds so one call cannot flood the shared rate limiter at once.
+_BATCH_CHUNK_SIZE = 15
+
+# Schwab has no candles past the current session, so an end far in the
+# future is always a caller mistake rather than a valid request.
+_MAX_END_LEAD = datetime.timedelta(days=1)
+
+# Bars that closed before today never change; an open-ended window still
+# includes the live bar, so it is only cached briefly.
+_OPEN_BARS_TTL = 300.0
+_CLOSED_BARS_TTL = 86400.0
+
+_fromisoformat = datetime.datetime.fromisoformat
+_now = datetime.datetime.now
+
+
+def _parse_history_datetime(name: str, value: str | None) -> datetime.datetime | None:
+    if value is None:
+        return None
+    try:
+        return _fromisoformat(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid {name}: {value!r}. Expected ISO format, e.g. '2023-01-01T09:30:00'") from exc
+
+
+def _validate_history_window(
+    start_dt: datetime.datetime | None,
+    end_dt: datetime.datetime | None,
+) -> None:
+    """Reject impossible start/end windows locally instead of via a Schwab 400."""
+    if end_dt is not None and end_dt > _now(tz=end_dt.tzinfo) + _MAX_END_LEAD:
+        raise ValueError(f"end_datetime {end_dt.isoformat()} is more than one day in the future")
+    if (
+        start_dt is not None
+        and end_dt is not None
+        and (start_dt.tzinfo is None) == (end_dt.tzinfo is None)
+        and start_dt > end_dt
+    ):
+        raise ValueError("start_datetime must not be after end_datetime")
+
+
+def _history_cache_ttl(
+    period_type: str | None,
+    frequency_type: str | None,
+    end_dt: datetime.datetime | None,
+) -> float | None:
+    """Return how long a price-history response may be cached; None for intraday bars."""
+    if frequency_type is None:
+        # Schwab defaults to DAY/MINUTE when neither is given.
+        intraday = period_type is None or period_type.upper() == "DAY"
+    else:
+        intraday = frequency_type.upper() == "MINUTE"
+    if intraday:
+        return None
+    if end_dt is not None and end_dt.date() < _now(tz=end_dt.tzinfo).date():
+        return _CLOSED_BARS_TTL
+    return _OPEN_BARS_TTL
+
+
+def _history_params(
+    client: Any,
+    *,
+    period_type: str | None,
+    period: str | None,
+    frequency_type: str | None,
+    frequency: int | str | None,
+    start_datetime: str | None,
+    end_datetime: str | None,
+    extended_hours: bool | None,
+    previous_close: bool | None,
+) -> tuple[dict[str, Any], float | None]:
+    """Parse and validate tool arguments into get_price_history kwargs and a cache TTL."""
+    if start_datetime is None and end_datetime is None:
+        # Common period/frequency-only call: nothing to parse or validate.
+        start_dt = end_dt = None
+    else:
+        start_dt = _parse_history_datetime("start_datetime", start_datetime)
+        end_dt = _parse_history_datetime("end_datetime", end_datetime)
+        _validate_history_window(start_dt, end_dt)
+
+    params = {
+        # Normalize enum-like strings
+        "period_type": enum_member(client.PriceHistory.PeriodType, period_type) if period_type else None,
+        "period": enum_member(client.PriceHistory.Period, period) if period else None,
+        "frequency_type": enum_member(client.PriceHistory.FrequencyType, frequency_type) if frequency_type else None,
+        # int() is a no-op for ints and also coerces numeric strings.
+        "frequency": None if frequency is None else int(frequency),
+        "start_datetime": start_dt,
+        "end_datetime": end_dt,
+        "need_extended_hours_data": extended_hours,
+        "need_previous_close": previous_close,
+    }
+    return params, _history_cache_ttl(period_type, frequency_type, end_dt)
+
+
+async def _fetch_price_history(
+    schwab: SchwabServerContext,
+    symbol: str,
+    params: dict[str, Any],
+    ttl: float | None,
+) -> JSONType:
+    cache = schwab.response_cache
+    cache_key = ("get_price_history", symbol, *params.values())
+    if ttl is not None:
+        cached = cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+    result = await call(
+        schwab.price_history.get_price_history,
+        symbol,
+        rate_limiter=schwab.rate_limiter,
+        coalesce=True,
+        **params,
+    )
+    if ttl is not None:
+        cache.put(cache_key, result, ttl)
+    return result
 
 
 async def get_advanced_price_history(
     ctx: SchwabContext,
-    symbol: Annotated[str, "Symbol of the security"],
-    period_type: Annotated[str | None, "Period type: DAY, MONTH, YEAR, YEAR_TO_DATE"] = None,
-    period: Annotated[
-        str | None,
-        (
-            "Number of periods (e.g., TEN_DAYS, ONE_MONTH, FIVE_YEARS). Varies by period_type. "
-            "Ignored if start/end datetimes provided."
-        ),
-    ] = None,
-    frequency_type: Annotated[
-        str | None,
-        "Frequency type: MINUTE (for DAY), DAILY/WEEKLY (for MONTH/YTD), DAILY/WEEKLY/MONTHLY (for YEAR)",
-    ] = None,
-    frequency: Annotated[
-        int | str | None,
-        "Number of frequencyType per candle (e.g., 1, 5, 10 for MINUTE). Strings are coerced to int.",
-    ] = None,
-    start_datetime: Annotated[str | None, "Start date for history (ISO format, e.g., '2023-01-01T09:30:00')"] = None,
-    end_datetime: Annotated[str | None, "End date for history (ISO format, e.g., '2023-01-31T16:00:00')"] = None,
-    extended_hours: Annotated[bool | None, "Include extended hours data"] = None,
-    previous_close: Annotated[bool | None, "Include previous close data"] = None,
+    symbol: Symbol,
+    period_type: PeriodType = None,
+    period: Period = None,
+    frequency_type: FrequencyType = None,
+    frequency: Frequency = None,
+    start_datetime: StartDateTime = None,
+    end_datetime: EndDateTime = None,
+    extended_hours: ExtendedHours = None,
+    previous_close: PreviousClose = None,
 ) -> JSONType:
     """Get price history with advanced period/frequency options. Specify period/frequency OR start/end datetimes.
 
@@ -51,35 +197,67 @@ async def get_advanced_price_history(
       YEAR_TO_DATE: DAILY, WEEKLY (default)
     Dates must be in ISO format.
     """
-    client = ctx.price_history
-
-    start_dt = parse_datetime(start_datetime)
-    end_dt = parse_datetime(end_datetime)
+    schwab = ctx.schwab
+    params, ttl = _history_params(
+        schwab.price_history,
+        period_type=period_type,
+        period=period,
+        frequency_type=frequency_type,
+        frequency=frequency,
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        extended_hours=extended_hours,
+        previous_close=previous_close,
+    )
+    return await _fetch_price_history(schwab, symbol, params, ttl)
 
-    # Normalize enum-like strings
-    period_type_enum = client.PriceHistory.PeriodType[period_type.upper()] if period_type else None
-    period_enum = client.PriceHistory.Period[period.upper()] if period else None
-    frequency_type_enum = client.PriceHistory.FrequencyType[frequency_type.upper()] if frequency_type else None
 
-    # Coerce frequency to int if provided as string
-    if isinstance(frequency, str):
-        frequency = int(frequency)
+async def get_price_history_batch(
+    ctx: SchwabContext,
+    symbols: Annotated[
+        list[str] | str,
+        "Symbols to fetch as a list or comma-separated string, e.g. ['SPY', 'QQQ'] or 'SPY,QQQ' (duplicates are ignored)",
+    ],
+    period_type: PeriodType = None,
+    period: Period = None,
+    frequency_type: FrequencyType = None,
+    frequency: Frequency = None,
+    start_datetime: StartDateTime = None,
+    end_datetime: EndDateTime = None,
+    extended_hours: ExtendedHours = None,
+    previous_close: PreviousClose = None,
+) -> JSONType:
+    """Get price history for several symbols at once with the same period/frequency options as get_advanced_price_history.
+    Returns an object keyed by symbol; a symbol whose request failed maps to {"error": message} instead of candles.
+    Requests run concurrently, so a watchlist costs roughly one round-trip instead of one per symbol.
+    """
+    unique = parse_symbols(symbols)
+    if not unique:
+        raise ValueError("symbols must contain at least one symbol")
 
-    return await call(
-        client.get_price_history,
-        symbol,
-        period_type=period_type_enum,
-        period=period_enum,
-        frequency_type=frequency_type_enum,
+    schwab = ctx.schwab
+    params, ttl = _history_params(
+        schwab.price_history,
+        period_type=period_type,
+        period=period,
+        frequency_type=frequency_type,
         frequency=frequency,
-        start_datetime=start_dt,
-        end_datetime=end_dt,
-        need_extended_hours_data=extended_hours,
-        need_previous_close=previous_close,
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        extended_hours=extended_hours,
+        previous_close=previous_close,
+    )
+    return await gather_keyed(
+        unique,
+        lambda symbol: _fetch_price_history(schwab, symbol, params, ttl),
+        chunk_size=_BATCH_CHUNK_SIZE,
     )
 
 
-_READ_ONLY_TOOLS = (get_advanced_price_history,)
+_READ_ONLY_TOOLS = (
+    get_advanced_price_history,
+    get_price_history_batch,
+)
 
 
 def register(
@@ -1,44 +1,102 @@
-"""Option chain and expiration tools for the Schwab MCP server."""
+"""Option chain and expiration tools for the Schwab MCP server.
+
+Every tool shares the server's pooled Schwab session, so independent chain
+and expiration requests can be awaited concurrently (``asyncio.gather``)
+without paying a new connection setup per request.
+"""
 
 import datetime
 from collections.abc import Callable
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeAlias
 
 from mcp.server.fastmcp import FastMCP
 
+from schwab_mcp.cache import MISSING
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
-from schwab_mcp.tools.utils import JSONType, call, parse_date
+from schwab_mcp.tools.utils import (
+    JSONType,
+    RateLimiter,
+    call,
+    enum_member,
+    gather_keyed,
+    parse_date,
+    parse_symbols,
+)
+
+UnderlyingSymbol: TypeAlias = Annotated[str, "Symbol of the underlying security (e.g., 'AAPL', 'SPY')"]
+
+ContractType: TypeAlias = Annotated[str | None, "Type of option contracts: CALL, PUT, or ALL (default)"]
+
+StrikeCount: TypeAlias = Annotated[
+    int,
+    "Number of strikes above/below the at-the-money price (default: 25)",
+]
+
+IncludeQuotes: TypeAlias = Annotated[bool | None, "Include underlying and option market quotes"]
+
+FromDate: TypeAlias = Annotated[
+    str | datetime.date | None,
+    "Start date for option expiration ('YYYY-MM-DD' or datetime.date)",
+]
+
+ToDate: TypeAlias = Annotated[
+    str | datetime.date | None,
+    "End date for option expiration ('YYYY-MM-DD' or datetime.date)",
+]
+
+Verbose: TypeAlias = Annotated[
+    bool,
+    "Return all raw contract fields instead of the compact default. Compact mode keeps price/greeks/liquidity fields only.",
+]
 
 _EXPIRATION_WINDOW_DAYS = 60
+_EXPIRATION_WINDOW = datetime.timedelta(days=_EXPIRATION_WINDOW_DAYS)
+_date = datetime.date
+
+# Listed expirations change at most once per trading day.
+_EXPIRATION_CHAIN_TTL = 3600.0
 
-_COMPACT_CONTRACT_FIELDS = frozenset(
-    {
-        "strike",
-        "bid",
-        "ask",
-        "last",
-        "mark",
-        "bidSize",
-        "askSize",
-        "volume",
-        "openInterest",
-        "delta",
-        "gamma",
-        "theta",
-        "vega",
-        "rho",
-        "impliedVolatility",
-        "inTheMoney",
-        "expirationDate",
-        "daysToExpiration",
-        "expirationType",
-    }
+# Full chains are large; keep fewer of them in flight than history batches do.
+_BATCH_CHUNK_SIZE = 8
+
+# get_option_chain keyword -> attribute holding its enum on ``client.Options``.
+_CHAIN_ENUM_PARAMS = {
+    "contract_type": "ContractType",
+    "strategy": "Strategy",
+    "strike_range": "StrikeRange",
+    "exp_month": "ExpirationMonth",
+    "option_type": "Type",
+}
+
+# Ordered so pruned contracts list fields consistently.
+_COMPACT_CONTRACT_FIELD_ORDER = (
+    "strike",
+    "bid",
+    "ask",
+    "last",
+    "mark",
+    "bidSize",
+    "askSize",
+    "volume",
+    "openInterest",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "impliedVolatility",
+    "inTheMoney",
+    "expirationDate",
+    "daysToExpiration",
+    "expirationType",
 )
+_COMPACT_CONTRACT_FIELDS = frozenset(_COMPACT_CONTRACT_FIELD_ORDER)
 
 
 def _prune_contract(contract: dict[str, JSONType]) -> dict[str, JSONType]:
-    return {k: v for k, v in contract.items() if k in _COMPACT_CONTRACT_FIELDS}
+    # Probe the ~19 kept fields rather than scanning every raw contract key.
+    return {k: contract[k] for k in _COMPACT_CONTRACT_FIELD_ORDER if k in contract}
 
 
 def _prune_option_chain(payload: JSONType) -> JSONType:
@@ -61,50 +119,113 @@ def _prune_option_chain(payload: JSONType) -> JSONType:
     return payload
 
 
+def _window_between(
+    from_date: datetime.date, to_date: datetime.date, _: datetime.date | None
+) -> tuple[datetime.date, datetime.date]:
+    return from_date, max(from_date, to_date)
+
+
+def _window_after(from_date: datetime.date, _: None, __: datetime.date | None) -> tuple[datetime.date, datetime.date]:
+    return from_date, from_date + _EXPIRATION_WINDOW
+
+
+def _window_until(_: None, to_date: datetime.date, today: datetime.date | None) -> tuple[datetime.date, datetime.date]:
+    return min(datetime.date.today() if today is None else today, to_date), to_date
+
+
+def _window_from_today(_: None, __: None, today: datetime.date | None) -> tuple[datetime.date, datetime.date]:
+    today = datetime.date.today() if today is None else today
+    return today, today + _EXPIRATION_WINDOW
+
+
+# Indexed by (from_date is None) << 1 | (to_date is None).
+_WINDOW_HANDLERS: tuple[Callable[[Any, Any, datetime.date | None], tuple[datetime.date, datetime.date]], ...] = (
+    _window_between,
+    _window_after,
+    _window_until,
+    _window_from_today,
+)
+
+
 def _normalize_expiration_window(
     from_date: datetime.date | None,
     to_date: datetime.date | None,
     *,
     today: datetime.date | None = None,
+) -> tuple[datetime.date | None, datetime.date | None]:
+    """Fill in an open-ended expiration window and keep it ordered.
+
+    Missing bounds default to today and a 60-day span; a to_date earlier than
+    from_date is clamped up to from_date.
+    """
+    return _WINDOW_HANDLERS[(from_date is None) << 1 | (to_date is None)](from_date, to_date, today)
+
+
+def _expiration_window(
+    from_date: str | datetime.date | None,
+    to_date: str | datetime.date | None,
 ) -> tuple[datetime.date | None, datetime.date | None]:
     if from_date is None and to_date is None:
-        today = datetime.date.today() if today is None else today
-        return today, today + datetime.timedelta(days=_EXPIRATION_WINDOW_DAYS)
+        # Common default path: skip parsing and go straight to the 60-day window.
+        return _normalize_expiration_window(None, None)
+    if type(from_date) is _date and type(to_date) is _date:
+        # Both bounds already dates (programmatic callers): only the ordering
+        # clamp of _normalize_expiration_window can apply.
+        return from_date, max(from_date, to_date)
+    return _normalize_expiration_window(parse_date(from_date), parse_date(to_date))
 
-    if from_date is None and to_date is not None:
-        today = datetime.date.today() if today is None else today
-        from_date = min(today, to_date)
 
-    if from_date is not None and to_date is None:
-        to_date = from_date + datetime.timedelta(days=_EXPIRATION_WINDOW_DAYS)
+def _chain_kwargs(client: Any, **params: Any) -> dict[str, Any]:
+    """Build ``get_option_chain`` keywords, omitting parameters left unset.
 
-    if from_date is not None and to_date is not None and to_date < from_date:
-        to_date = from_date
+    Parameters named in ``_CHAIN_ENUM_PARAMS`` are resolved from their
+    case-insensitive names to the client's ``Options`` enum members.
+    """
+    kwargs = {name: value for name, value in params.items() if value is not None}
+    for name, enum_name in _CHAIN_ENUM_PARAMS.items():
+        value = kwargs.pop(name, None)
+        if value:
+            kwargs[name] = enum_member(getattr(client.Options, enum_name), value)
+    return kwargs
+
+
+async def _fetch_option_chain(
+    client: Any,
+    symbol: str,
+    from_date: str | datetime.date | None,
+    to_date: str | datetime.date | None,
+    *,
+    rate_limiter: RateLimiter | None,
+    verbose: bool,
+    **kwargs: Any,
+) -> JSONType:
+    """Fetch an option chain over the normalized expiration window.
 
-    return from_date, to_date
+    Shared by the standard and advanced chain tools; *kwargs* are passed
+    through to ``get_option_chain`` unchanged.
+    """
+    from_date_obj, to_date_obj = _expiration_window(from_date, to_date)
+    result = await call(
+        client.get_option_chain,
+        symbol,
+        from_date=from_date_obj,
+        to_date=to_date_obj,
+        rate_limiter=rate_limiter,
+        coalesce=True,
+        **kwargs,
+    )
+    return result if verbose else _prune_option_chain(result)
 
 
 async def get_option_chain(
     ctx: SchwabContext,
-    symbol: Annotated[str, "Symbol of the underlying security (e.g., 'AAPL', 'SPY')"],
-    contract_type: Annotated[str | None, "Type of option contracts: CALL, PUT, or ALL (default)"] = None,
-    strike_count: Annotated[
-        int,
-        "Number of strikes above/below the at-the-money price (default: 25)",
-    ] = 25,
-    include_quotes: Annotated[bool | None, "Include underlying and option market quotes"] = None,
-    from_date: Annotated[
-        str | datetime.date | None,
-        "Start date for option expiration ('YYYY-MM-DD' or datetime.date)",
-    ] = None,
-    to_date: Annotated[
-        str | datetime.date | None,
-        "End date for option expiration ('YYYY-MM-DD' or datetime.date)",
-    ] = None,
-    verbose: Annotated[
-        bool,
-        "Return all raw contract fields instead of the compact default. Compact mode keeps price/greeks/liquidity fields only.",
-    ] = False,
+    symbol: UnderlyingSymbol,
+    contract_type: ContractType = None,
+    strike_count: StrikeCount = 25,
+    include_quotes: IncludeQuotes = None,
+    from_date: FromDate = None,
+    to_date: ToDate = None,
+    verbose: Verbose = False,
 ) -> JSONType:
     """Returns option chain data (strikes, expirations, prices) for a symbol. Use for standard chains.
     Params: symbol, contract_type (CALL/PUT/ALL), strike_count (default 25), include_quotes (bool), from_date (YYYY-MM-DD), to_date (YYYY-MM-DD).
@@ -112,33 +233,28 @@ async def get_option_chain(
     By default returns compact per-contract fields only; pass verbose=True for the full raw payload.
     """
     client = ctx.options
-
-    from_date_obj, to_date_obj = _normalize_expiration_window(
-        parse_date(from_date),
-        parse_date(to_date),
-    )
-
-    result = await call(
-        client.get_option_chain,
+    return await _fetch_option_chain(
+        client,
         symbol,
-        contract_type=client.Options.ContractType[contract_type.upper()] if contract_type else None,
-        strike_count=strike_count,
-        include_underlying_quote=include_quotes,
-        from_date=from_date_obj,
-        to_date=to_date_obj,
+        from_date,
+        to_date,
+        rate_limiter=ctx.schwab.rate_limiter,
+        verbose=verbose,
+        **_chain_kwargs(
+            client,
+            contract_type=contract_type,
+            strike_count=strike_count,
+            include_underlying_quote=include_quotes,
+        ),
     )
-    return result if verbose else _prune_option_chain(result)
 
 
 async def get_advanced_option_chain(
     ctx: SchwabContext,
-    symbol: Annotated[str, "Symbol of the underlying security"],
-    contract_type: Annotated[str | None, "Type of contracts: CALL, PUT, or ALL (default)"] = None,
-    strike_count: Annotated[
-        int,
-        "Number of strikes above/below the at-the-money price (default: 25)",
-    ] = 25,
-    include_quotes: Annotated[bool | None, "Include quotes for the options"] = None,
+    symbol: UnderlyingSymbol,
+    contract_type: ContractType = None,
+    strike_count: StrikeCount = 25,
+    include_quotes: IncludeQuotes = None,
     strategy: Annotated[
         str | None,
         (
@@ -152,24 +268,15 @@ async def get_advanced_option_chain(
         str | None,
         "Filter strikes: IN_THE_MONEY, NEAR_THE_MONEY, OUT_OF_THE_MONEY, STRIKES_ABOVE_MARKET, STRIKES_BELOW_MARKET, STRIKES_NEAR_MARKET, ALL (default)",
     ] = None,
-    from_date: Annotated[
-        str | datetime.date | None,
-        "Start date for options ('YYYY-MM-DD' or datetime.date)",
-    ] = None,
-    to_date: Annotated[
-        str | datetime.date | None,
-        "End date for options ('YYYY-MM-DD' or datetime.date)",
-    ] = None,
+    from_date: FromDate = None,
+    to_date: ToDate = None,
     volatility: Annotated[float | None, "Volatility for ANALYTICAL strategy"] = None,
     underlying_price: Annotated[float | None, "Underlying price for ANALYTICAL strategy"] = None,
     interest_rate: Annotated[float | None, "Interest rate for ANALYTICAL strategy"] = None,
     days_to_expiration: Annotated[int | None, "Days to expiration for ANALYTICAL strategy"] = None,
     exp_month: Annotated[str | None, "Expiration month (e.g., JAN) for ANALYTICAL strategy"] = None,
     option_type: Annotated[str | None, "Filter option type: STANDARD, NON_STANDARD, ALL (default)"] = None,
-    verbose: Annotated[
-        bool,
-        "Return all raw contract fields instead of the compact default. Compact mode keeps price/greeks/liquidity fields only.",
-    ] = False,
+    verbose: Verbose = False,
 ) -> JSONType:
     """Returns advanced option chain data with strategies, filters, and theoretical calculations. Use for complex analysis.
     Params: symbol, contract_type, strike_count, include_quotes, strategy (SINGLE/ANALYTICAL/etc.), interval, strike, strike_range (ITM/NTM/etc.), from/to_date, volatility/underlying_price/interest_rate/days_to_expiration (for ANALYTICAL), exp_month, option_type (STANDARD/NON_STANDARD/ALL).
@@ -177,48 +284,93 @@ async def get_advanced_option_chain(
     By default returns compact per-contract fields only; pass verbose=True for the full raw payload.
     """
     client = ctx.options
-
-    from_date_obj = parse_date(from_date)
-    to_date_obj = parse_date(to_date)
-    from_date_obj, to_date_obj = _normalize_expiration_window(
-        from_date_obj,
-        to_date_obj,
+    return await _fetch_option_chain(
+        client,
+        symbol,
+        from_date,
+        to_date,
+        rate_limiter=ctx.schwab.rate_limiter,
+        verbose=verbose,
+        **_chain_kwargs(
+            client,
+            contract_type=contract_type,
+            strike_count=strike_count,
+            include_underlying_quote=include_quotes,
+            strategy=strategy,
+            interval=interval,
+            strike=strike,
+            strike_range=strike_range,
+            volatility=volatility,
+            underlying_price=underlying_price,
+            interest_rate=interest_rate,
+            days_to_expiration=days_to_expiration,
+            exp_month=exp_month,
+            option_type=option_type,
+        ),
     )
 
-    result = await call(
-        client.get_option_chain,
-        symbol,
-        contract_type=client.Options.ContractType[contract_type.upper()] if contract_type else None,
+
+async def get_option_chain_batch(
+    ctx: SchwabContext,
+    symbols: Annotated[
+        list[str] | str,
+        "Underlying symbols as a list or comma-separated string, e.g. ['SPY', 'QQQ'] or 'SPY,QQQ' (duplicates are ignored)",
+    ],
+    contract_type: ContractType = None,
+    strike_count: StrikeCount = 25,
+    include_quotes: IncludeQuotes = None,
+    from_date: FromDate = None,
+    to_date: ToDate = None,
+    verbose: Verbose = False,
+) -> JSONType:
+    """Returns option chains for several underlyings at once with the same filters as get_option_chain.
+    Returns an object keyed by symbol; a symbol whose request failed maps to {"error": message} instead of a chain.
+    Requests run concurrently, so a watchlist costs roughly one round-trip instead of one per symbol. Keep strike_count and the date window tight: every chain counts toward the response size.
+    """
+    unique = parse_symbols(symbols)
+    if not unique:
+        raise ValueError("symbols must contain at least one symbol")
+
+    client = ctx.options
+    # Resolve the shared window and enum filters once, not per symbol.
+    from_date_obj, to_date_obj = _expiration_window(from_date, to_date)
+    kwargs = _chain_kwargs(
+        client,
+        contract_type=contract_type,
         strike_count=strike_count,
         include_underlying_quote=include_quotes,
-        strategy=client.Options.Strategy[strategy.upper()] if strategy else None,
-        interval=interval,
-        strike=strike,
-        strike_range=client.Options.StrikeRange[strike_range.upper()] if strike_range else None,
-        from_date=from_date_obj,
-        to_date=to_date_obj,
-        volatility=volatility,
-        underlying_price=underlying_price,
-        interest_rate=interest_rate,
-        days_to_expiration=days_to_expiration,
-        exp_month=client.Options.ExpirationMonth[exp_month.upper()] if exp_month else None,
-        option_type=client.Options.Type[option_type.upper()] if option_type else None,
     )
-    return result if verbose else _prune_option_chain(result)
+    rate_limiter = ctx.schwab.rate_limiter
+    return await gather_keyed(
+        unique,
+        lambda symbol: _fetch_option_chain(
+            client, symbol, from_date_obj, to_date_obj, rate_limiter=rate_limiter, verbose=verbose, **kwargs
+        ),
+        chunk_size=_BATCH_CHUNK_SIZE,
+    )
 
 
 async def get_option_expiration_chain(
     ctx: SchwabContext,
-    symbol: Annotated[str, "Symbol of the underlying security"],
+    symbol: UnderlyingSymbol,
 ) -> JSONType:
     """Returns available option expiration dates for a symbol, without contract details. Lightweight call to find available cycles. Param: symbol."""
-    client = ctx.options
-    return await call(client.get_option_expiration_chain, symbol)
+    schwab = ctx.schwab
+    client = schwab.options
+    cache = schwab.response_cache
+    cache_key = ("get_option_expiration_chain", symbol)
+    cached = cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+    result = await call(client.get_option_expiration_chain, symbol, rate_limiter=schwab.rate_limiter, coalesce=True)
+    cache.put(cache_key, result, _EXPIRATION_CHAIN_TTL)
+    return result
 
 
 _READ_ONLY_TOOLS = (
     get_option_chain,
     get_advanced_option_chain,
+    get_option_chain_batch,
     get_option_expiration_chain,
 )
 
@@ -1,9 +1,10 @@
 """Order placement, management, and preview tools for the Schwab MCP server."""
 
+import datetime
 import uuid
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Annotated, Any, cast
+from typing import Annotated, Any, NoReturn, cast
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
@@ -19,6 +20,7 @@ from typing_extensions import TypedDict
 
 from schwab_mcp.approvals import ApprovalDecision, ApprovalRequest
 from schwab_mcp.context import SchwabContext
+from schwab_mcp.previews import PreviewEntry
 from schwab_mcp.tools._registration import register_tool, run_approval
 from schwab_mcp.tools.order_helpers import (
     equity_buy_limit,
@@ -39,7 +41,15 @@ from schwab_mcp.tools.order_helpers import (
     option_sell_to_open_limit,
     option_sell_to_open_market,
 )
-from schwab_mcp.tools.utils import JSONType, ResponseHandler, SchwabAPIError, call, parse_date
+from schwab_mcp.tools.utils import (
+    JSONType,
+    ResponseHandler,
+    SchwabAPIError,
+    call,
+    enum_member,
+    gather_keyed,
+    parse_date,
+)
 
 _COMPACT_ORDER_TOP_FIELDS = frozenset(
     {
@@ -138,16 +148,31 @@ def _normalize_duration(duration: str | Duration) -> str:
     return candidate
 
 
+# Session/duration every pre-filled schwab-py (and order_helpers) builder
+# already carries, so re-applying them is a no-op.
+_DEFAULT_SESSION = "NORMAL"
+_DEFAULT_DURATION = "DAY"
+
+
 # Internal helper function to apply session and duration settings
-def _apply_order_settings(order_spec, session: str | None, duration: str | None):
-    """Internal helper to apply session and duration to an order spec builder."""
-    if session:
+def _apply_order_settings(order_spec, session: str | None, duration: str | None, *, prefilled: bool = True):
+    """Internal helper to apply session and duration to an order spec builder.
+
+    Pre-filled builders already carry the default session and duration, so
+    those values are only set explicitly on a bare builder (``prefilled=False``).
+    """
+    if session and (session != _DEFAULT_SESSION or not prefilled):
         order_spec = order_spec.set_session(session)
-    if duration is not None:
+    if duration is not None and (duration != _DEFAULT_DURATION or not prefilled):
         order_spec = order_spec.set_duration(_normalize_duration(duration))
     return order_spec
 
 
+def _finalize(builder, session: str | None, duration: str | None) -> dict[str, Any]:
+    """Apply session/duration to a pre-filled builder and build its order spec."""
+    return cast(dict[str, Any], _apply_order_settings(builder, session, duration).build())
+
+
 _EQUITY_ORDER_BUILDERS: dict[tuple[str, str], tuple[Any, bool, bool]] = {
     ("MARKET", "BUY"): (equity_buy_market, False, False),
     ("MARKET", "SELL"): (equity_sell_market, False, False),
@@ -159,6 +184,9 @@ _EQUITY_ORDER_BUILDERS: dict[tuple[str, str], tuple[Any, bool, bool]] = {
     ("STOP_LIMIT", "SELL"): (equity_sell_stop_limit, True, True),
 }
 
+# Keeps every summary readable in a single approval message.
+_MAX_PLACE_BATCH = 8
+
 _EQUITY_ORDER_TYPES = frozenset({"MARKET", "LIMIT", "STOP", "STOP_LIMIT"})
 _BRACKET_LOSS_TYPES = frozenset({"STOP", "STOP_LIMIT", "LIMIT"})
 _EQUITY_INSTRUCTIONS = frozenset({"BUY", "SELL"})
@@ -254,15 +282,19 @@ def _build_trailing_stop_order_spec(
     return equity_trailing_stop(symbol, quantity, instruction, trail_offset, trail_type)
 
 
-_OPTION_ORDER_BUILDERS: dict[str, tuple[Any, Any]] = {
-    "BUY_TO_OPEN": (option_buy_to_open_market, option_buy_to_open_limit),
-    "SELL_TO_OPEN": (option_sell_to_open_market, option_sell_to_open_limit),
-    "BUY_TO_CLOSE": (option_buy_to_close_market, option_buy_to_close_limit),
-    "SELL_TO_CLOSE": (option_sell_to_close_market, option_sell_to_close_limit),
+_OPTION_ORDER_BUILDERS: dict[tuple[str, str], tuple[Any, bool]] = {
+    ("MARKET", "BUY_TO_OPEN"): (option_buy_to_open_market, False),
+    ("MARKET", "SELL_TO_OPEN"): (option_sell_to_open_market, False),
+    ("MARKET", "BUY_TO_CLOSE"): (option_buy_to_close_market, False),
+    ("MARKET", "SELL_TO_CLOSE"): (option_sell_to_close_market, False),
+    ("LIMIT", "BUY_TO_OPEN"): (option_buy_to_open_limit, True),
+    ("LIMIT", "SELL_TO_OPEN"): (option_sell_to_open_limit, True),
+    ("LIMIT", "BUY_TO_CLOSE"): (option_buy_to_close_limit, True),
+    ("LIMIT", "SELL_TO_CLOSE"): (option_sell_to_close_limit, True),
 }
 
 _OPTION_ORDER_TYPES = frozenset({"MARKET", "LIMIT"})
-_OPTION_INSTRUCTIONS = frozenset(_OPTION_ORDER_BUILDERS.keys())
+_OPTION_INSTRUCTIONS = frozenset({"BUY_TO_OPEN", "SELL_TO_OPEN", "BUY_TO_CLOSE", "SELL_TO_CLOSE"})
 
 
 def _build_option_order_spec(
@@ -285,16 +317,14 @@ def _build_option_order_spec(
             "Use BUY_TO_OPEN, SELL_TO_OPEN, BUY_TO_CLOSE, or SELL_TO_CLOSE."
         )
 
-    market_builder, limit_builder = _OPTION_ORDER_BUILDERS[instruction]
-
-    if order_type == "MARKET":
-        if price is not None:
-            raise ValueError("MARKET orders should not include a price parameter")
-        return market_builder(symbol, quantity)
-    else:
+    builder_func, needs_price = _OPTION_ORDER_BUILDERS[(order_type, instruction)]
+    if needs_price:
         if price is None:
-            raise ValueError("LIMIT orders require a price parameter")
-        return limit_builder(symbol, quantity, price)
+            raise ValueError(f"{order_type} orders require a price parameter")
+        return builder_func(symbol, quantity, price)
+    if price is not None:
+        raise ValueError(f"{order_type} orders should not include a price parameter")
+    return builder_func(symbol, quantity)
 
 
 class _OrderDescInputRequired(TypedDict):
@@ -510,8 +540,7 @@ def _prepare_equity_order(
     duration: str | None = "DAY",
 ) -> dict[str, Any]:
     builder = _build_equity_order_spec(symbol, quantity, instruction, order_type, price, stop_price)
-    builder = _apply_order_settings(builder, session, duration)
-    return cast(dict[str, Any], builder.build())
+    return _finalize(builder, session, duration)
 
 
 def _prepare_option_order(
@@ -524,8 +553,7 @@ def _prepare_option_order(
     duration: str | None = "DAY",
 ) -> dict[str, Any]:
     builder = _build_option_order_spec(symbol, quantity, instruction, order_type, price)
-    builder = _apply_order_settings(builder, session, duration)
-    return cast(dict[str, Any], builder.build())
+    return _finalize(builder, session, duration)
 
 
 def _prepare_trailing_stop_order(
@@ -538,8 +566,7 @@ def _prepare_trailing_stop_order(
     duration: str | None = "DAY",
 ) -> dict[str, Any]:
     builder = _build_trailing_stop_order_spec(symbol, quantity, instruction, trail_offset, trail_type or "VALUE")
-    builder = _apply_order_settings(builder, session, duration)
-    return cast(dict[str, Any], builder.build())
+    return _finalize(builder, session, duration)
 
 
 def _prepare_oco_order(
@@ -645,7 +672,7 @@ def _prepare_option_combo_order(
     if not legs or len(legs) < 2:
         raise ValueError("Provide at least two option legs for a combo order")
     builder = OrderBuilder(enforce_enums=False).set_order_strategy_type("SINGLE")
-    builder = _apply_order_settings(builder, session, duration)
+    builder = _apply_order_settings(builder, session, duration, prefilled=False)
     if complex_order_strategy_type:
         builder = builder.set_complex_order_strategy_type(complex_order_strategy_type.upper())
     builder = builder.set_order_type(order_type.upper())
@@ -700,10 +727,20 @@ async def get_order(
     the full raw payload. Params: account_hash, order_id.
     """
     client = ctx.orders
-    result = await call(client.get_order, order_id=order_id, account_hash=account_hash)
+    result = await call(
+        client.get_order, order_id=order_id, account_hash=account_hash, rate_limiter=ctx.schwab.rate_limiter
+    )
     return result if verbose else _prune_order(result)
 
 
+def _parse_order_date(name: str, value: str | None) -> datetime.date | None:
+    """Parse a get_orders date filter, naming the parameter on failure."""
+    try:
+        return parse_date(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value!r}. Must be YYYY-MM-DD") from None
+
+
 async def get_orders(
     ctx: SchwabContext,
     account_hash: Annotated[str, "Account hash for the Schwab account (from get_accounts)"],
@@ -733,34 +770,36 @@ async def get_orders(
     """
     client = ctx.orders
 
-    from_date_obj = parse_date(from_date)
-    to_date_obj = parse_date(to_date)
-
     kwargs: dict[str, Any] = {
         "max_results": max_results,
-        "from_entered_datetime": from_date_obj,
-        "to_entered_datetime": to_date_obj,
+        "from_entered_datetime": _parse_order_date("from_date", from_date),
+        "to_entered_datetime": _parse_order_date("to_date", to_date),
     }
 
     if status:
         if isinstance(status, str):
             # Single status: direct API call
-            kwargs["status"] = client.Order.Status[status.upper()]
+            kwargs["status"] = enum_member(client.Order.Status, status)
             result: JSONType = await call(
                 client.get_orders_for_account,
                 account_hash,
+                rate_limiter=ctx.schwab.rate_limiter,
                 **kwargs,
             )
         else:
             # Multiple statuses: make separate calls and merge results
             # The underlying schwab-py API only supports single status queries
+            # Resolve every status before the first request so a bad name
+            # fails fast instead of after some pages were fetched.
+            status_enums = [enum_member(client.Order.Status, s) for s in status]
             all_orders: list[Any] = []
             seen_order_ids: set[str] = set()
-            for s in status:
-                kwargs["status"] = client.Order.Status[s.upper()]
+            for status_enum in status_enums:
+                kwargs["status"] = status_enum
                 partial = await call(
                     client.get_orders_for_account,
                     account_hash,
+                    rate_limiter=ctx.schwab.rate_limiter,
                     **kwargs,
                 )
                 if partial:
@@ -774,6 +813,7 @@ async def get_orders(
         result = await call(
             client.get_orders_for_account,
             account_hash,
+            rate_limiter=ctx.schwab.rate_limiter,
             **kwargs,
         )
 
@@ -787,6 +827,7 @@ async def cancel_order(
 ) -> JSONType:
     """Cancels a pending order. Cannot cancel executed/terminal orders. Params: account_hash, order_id. Returns updated order details (compact/pruned, same shape as get_order) after cancellation; falls back to a minimal {orderId, status, note} payload if the post-cancel status fetch fails or returns no data. *Write operation.*"""
     client = ctx.orders
+    # Writes skip the market-data rate limiter; Schwab meters orders separately.
     await call(client.cancel_order, order_id=order_id, account_hash=account_hash)
     fallback: JSONType = {
         "orderId": order_id,
@@ -794,7 +835,9 @@ async def cancel_order(
         "note": "Cancel submitted; status fetch failed",
     }
     try:
-        result = await call(client.get_order, order_id=order_id, account_hash=account_hash)
+        result = await call(
+            client.get_order, order_id=order_id, account_hash=account_hash, rate_limiter=ctx.schwab.rate_limiter
+        )
     except SchwabAPIError:
         return fallback
     if not isinstance(result, dict):
@@ -901,7 +944,12 @@ async def preview_equity_order(
     order_spec_dict = _prepare_equity_order(
         symbol, quantity, instruction, order_type, price, stop_price, session, duration
     )
-    preview = await call(ctx.orders.preview_order, account_hash=account_hash, order_spec=order_spec_dict)
+    preview = await call(
+        ctx.orders.preview_order,
+        account_hash=account_hash,
+        order_spec=order_spec_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
+    )
     summary = _order_summary_equity(instruction, quantity, symbol, order_type, price, stop_price)
     preview_id = ctx.previews.put(account_hash, order_spec_dict, "preview_equity_order", summary)
     return {
@@ -934,7 +982,12 @@ async def preview_option_order(
     exact order. Params: same as this order shape's fields below.
     """
     order_spec_dict = _prepare_option_order(symbol, quantity, instruction, order_type, price, session, duration)
-    preview = await call(ctx.orders.preview_order, account_hash=account_hash, order_spec=order_spec_dict)
+    preview = await call(
+        ctx.orders.preview_order,
+        account_hash=account_hash,
+        order_spec=order_spec_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
+    )
     summary = _order_summary_equity(instruction, quantity, symbol, order_type, price)
     preview_id = ctx.previews.put(account_hash, order_spec_dict, "preview_option_order", summary)
     return {
@@ -972,7 +1025,12 @@ async def preview_equity_trailing_stop_order(
     order_spec_dict = _prepare_trailing_stop_order(
         symbol, quantity, instruction, trail_offset, trail_type, session, duration
     )
-    preview = await call(ctx.orders.preview_order, account_hash=account_hash, order_spec=order_spec_dict)
+    preview = await call(
+        ctx.orders.preview_order,
+        account_hash=account_hash,
+        order_spec=order_spec_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
+    )
     eff_trail_type = (trail_type or "VALUE").upper()
     summary = f"{instruction.upper()} {quantity} {symbol} TRAILING_STOP offset={trail_offset} {eff_trail_type}"
     preview_id = ctx.previews.put(account_hash, order_spec_dict, "preview_equity_trailing_stop_order", summary)
@@ -1016,7 +1074,12 @@ async def preview_oco_order(
         session,
         duration,
     )
-    preview = await call(ctx.orders.preview_order, account_hash=account_hash, order_spec=order_spec_dict)
+    preview = await call(
+        ctx.orders.preview_order,
+        account_hash=account_hash,
+        order_spec=order_spec_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
+    )
     summary = f"OCO: {first_order['instruction']} {first_order['quantity']} {first_order['symbol']} + 1 other"
     preview_id = ctx.previews.put(account_hash, order_spec_dict, "preview_oco_order", summary)
     return {
@@ -1062,7 +1125,12 @@ async def preview_trigger_order(
         session,
         duration,
     )
-    preview = await call(ctx.orders.preview_order, account_hash=account_hash, order_spec=order_spec_dict)
+    preview = await call(
+        ctx.orders.preview_order,
+        account_hash=account_hash,
+        order_spec=order_spec_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
+    )
     summary = (
         f"TRIGGER: {entry_order['instruction']} {entry_order['quantity']} "
         f"{entry_order['symbol']} + {len(exit_orders)} exit(s)"
@@ -1147,6 +1215,7 @@ async def preview_bracket_order(
         ctx.orders.preview_order,
         account_hash=account_hash,
         order_spec=bracket_order_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
     )
     summary = (
         f"BRACKET: {entry_instruction.upper()} {quantity} {symbol} {entry_type.upper()}"
@@ -1198,7 +1267,12 @@ async def preview_option_combo_order(
     order_spec_dict = _prepare_option_combo_order(
         legs, order_type, price, session, duration, complex_order_strategy_type
     )
-    preview = await call(ctx.orders.preview_order, account_hash=account_hash, order_spec=order_spec_dict)
+    preview = await call(
+        ctx.orders.preview_order,
+        account_hash=account_hash,
+        order_spec=order_spec_dict,
+        rate_limiter=ctx.schwab.rate_limiter,
+    )
     summary = f"COMBO: {len(legs)} option legs, {order_type.upper()}"
     preview_id = ctx.previews.put(account_hash, order_spec_dict, "preview_option_combo_order", summary)
     return {
@@ -1238,30 +1312,94 @@ async def place_previewed_order(
     )
 
     decision = await run_approval(ctx, request)
-    if decision is ApprovalDecision.APPROVED:
-        placed = await call(
-            ctx.orders.place_order,
-            account_hash=account_hash,
-            order_spec=entry.order_spec,
-            response_handler=_order_response_handler(ctx, account_hash),
+    if decision is not ApprovalDecision.APPROVED:
+        await _reject_placement(ctx, decision)
+    return await _place_preview_entry(ctx, account_hash, entry)
+
+
+async def place_previewed_orders(
+    ctx: SchwabContext,
+    account_hash: Annotated[str, "Account hash for the Schwab account"],
+    preview_ids: Annotated[
+        list[str],
+        f"Preview IDs returned by preview_* tools for this account (at most {_MAX_PLACE_BATCH})",
+    ],
+) -> JSONType:
+    """Places several previously previewed orders for one account behind a
+    single approval that lists every order summary. All previews are
+    validated before the approval request (one bad ID leaves the others
+    untouched) and are consumed once it is sent, even if denied. Approved
+    orders are submitted concurrently; returns an object keyed by preview_id
+    whose values match place_previewed_order's result, or {"error": message}
+    for an order that failed. *Write operation.*
+    """
+    if not preview_ids:
+        raise ValueError("preview_ids must contain at least one preview ID")
+    if len(preview_ids) > _MAX_PLACE_BATCH:
+        raise ValueError(f"At most {_MAX_PLACE_BATCH} previews can be placed at once, got {len(preview_ids)}")
+    entries = ctx.previews.pop_many(preview_ids, account_hash)
+
+    arguments = {
+        "order_count": str(len(entries)),
+        "account_hash": account_hash,
+    }
+    for preview_id, entry in zip(preview_ids, entries, strict=True):
+        arguments[preview_id] = f"{entry.summary} (from {entry.tool_name})"
+    request = ApprovalRequest(
+        id=str(uuid.uuid4()),
+        tool_name="place_previewed_orders",
+        request_id=ctx.request_id,
+        client_id=ctx.client_id,
+        arguments=arguments,
+    )
+
+    decision = await run_approval(ctx, request)
+    if decision is not ApprovalDecision.APPROVED:
+        await _reject_placement(ctx, decision)
+
+    # pop_many rejects repeated ids, so each preview id keys exactly one entry.
+    entries_by_id = dict(zip(preview_ids, entries, strict=True))
+    return await gather_keyed(
+        preview_ids,
+        lambda preview_id: _place_preview_entry(ctx, account_hash, entries_by_id[preview_id]),
+    )
+
+
+async def _place_preview_entry(ctx: SchwabContext, account_hash: str, entry: PreviewEntry) -> JSONType:
+    """Submit an approved preview's cached spec and return the placed order.
+
+    Falls back to a minimal {orderId, accountHash, note} payload if the
+    post-placement status fetch fails or returns no data.
+    """
+    # Writes skip the market-data rate limiter; Schwab meters orders separately.
+    placed = await call(
+        ctx.orders.place_order,
+        account_hash=account_hash,
+        order_spec=entry.order_spec,
+        response_handler=_order_response_handler(ctx, account_hash),
+    )
+    order_id = placed.get("orderId") if isinstance(placed, dict) else None
+    if order_id is None:
+        return placed
+    order_id = str(order_id)
+    fallback: JSONType = {
+        "orderId": order_id,
+        "accountHash": account_hash,
+        "note": "Order placed; status fetch failed",
+    }
+    try:
+        result = await call(
+            ctx.orders.get_order, order_id=order_id, account_hash=account_hash, rate_limiter=ctx.schwab.rate_limiter
         )
-        order_id = placed.get("orderId") if isinstance(placed, dict) else None
-        if order_id is None:
-            return placed
-        order_id = str(order_id)
-        fallback: JSONType = {
-            "orderId": order_id,
-            "accountHash": account_hash,
-            "note": "Order placed; status fetch failed",
-        }
-        try:
-            result = await call(ctx.orders.get_order, order_id=order_id, account_hash=account_hash)
-        except (SchwabAPIError, ValueError):
-            return fallback
-        if not isinstance(result, dict):
-            return fallback
-        return _prune_order(result)
+    except (SchwabAPIError, ValueError):
+        return fallback
+    if not isinstance(result, dict):
+        return fallback
+    return _prune_order(result)
+
 
+async def _reject_placement(ctx: SchwabContext, decision: ApprovalDecision) -> NoReturn:
+    """Warn the client about a denied/expired placement approval and raise."""
     message = (
         "Order placement denied by reviewer."
         if decision is ApprovalDecision.DENIED
@@ -1305,13 +1443,14 @@ def register(
     for func in _WRITE_TOOLS:
         register_tool(server, func, write=True, result_transform=result_transform)
 
-    # place_previewed_order builds its own ApprovalRequest (with the
-    # cached human-readable summary) instead of a raw argument dump, so
-    # it must bypass register_tool's automatic write=True wrapping.
-    register_tool(
-        server,
-        place_previewed_order,
-        write=False,
-        annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True),
-        result_transform=result_transform,
-    )
+    # The place_previewed_* tools build their own ApprovalRequest (with the
+    # cached human-readable summaries) instead of a raw argument dump, so
+    # they must bypass register_tool's automatic write=True wrapping.
+    for func in (place_previewed_order, place_previewed_orders):
+        register_tool(
+            server,
+            func,
+            write=False,
+            annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+            result_transform=result_transform,
+        )
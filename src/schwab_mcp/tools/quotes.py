@@ -7,7 +7,7 @@ from mcp.server.fastmcp import FastMCP
 
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
-from schwab_mcp.tools.utils import JSONType, call
+from schwab_mcp.tools.utils import JSONType, call, enum_member, parse_list
 
 _COMPACT_QUOTE_FIELDS = (
     "lastPrice",
@@ -60,20 +60,18 @@ async def get_quotes(
     """
     client = ctx.quotes
 
-    if isinstance(symbols, str):
-        symbols = [s.strip() for s in symbols.split(",")]
+    symbols = parse_list(symbols)
 
     field_enums = None
     if fields:
-        if isinstance(fields, str):
-            fields = [f.strip() for f in fields.split(",")]
-        field_enums = [client.Quote.Fields[f.upper()] for f in fields]
+        field_enums = [enum_member(client.Quote.Fields, f) for f in parse_list(fields)]
 
     result = await call(
         client.get_quotes,
         symbols,
         fields=field_enums,
         indicative=indicative if indicative is not None else None,
+        rate_limiter=ctx.schwab.rate_limiter,
     )
     return result if verbose else _prune_quotes(result)
 
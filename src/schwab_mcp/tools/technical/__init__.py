@@ -3,22 +3,21 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import logging
 from collections.abc import Callable
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
-try:
-    import pandas_ta_classic as _pandas_ta
-except ModuleNotFoundError:
-    _pandas_ta = None
-
-pandas_ta = cast(Any, _pandas_ta)
+# Only probe for the optional dependency here: importing pandas_ta_classic
+# (and with it pandas) takes hundreds of milliseconds, so it is left to the
+# indicator modules, which register() loads only when technical tools are on.
+_HAS_PANDAS_TA = importlib.util.find_spec("pandas_ta_classic") is not None
 
 
 def register(
@@ -30,7 +29,7 @@ def register(
     """Register optional technical analysis tools if dependencies are available."""
     _ = allow_write
 
-    if _pandas_ta is None:
+    if not _HAS_PANDAS_TA:
         logger.debug("Skipping technical analysis tools because pandas_ta_classic is not installed.")
         return
 
@@ -0,0 +1,235 @@
+"""NumPy kernels for indicators computed straight from candle arrays.
+
+pandas-ta builds these through pandas ``rolling``/``ewm`` objects, whose
+per-call overhead dominates for the few hundred bars a tool fetches.
+Each kernel takes a float64 array and returns a same-length float64 array
+with NaN in the warm-up slots, matching pandas-ta's output.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+__all__ = ["BBANDS_MODES", "bbands", "ema", "macd", "rsi", "sma", "stoch", "vwap", "wma"]
+
+# pandas-ta substitutes epsilon for zero-width ranges so %B never divides by 0.
+_EPSILON = sys.float_info.epsilon
+
+
+def sma(values: np.ndarray, length: int) -> np.ndarray:
+    """Return the *length*-period simple moving average of *values*.
+
+    Each window is averaged on its own rather than from a running sum, so
+    long price series do not accumulate cancellation error.
+    """
+    out = np.full(values.shape[0], np.nan)
+    if 0 < length <= values.shape[0]:
+        out[length - 1 :] = sliding_window_view(values, length).mean(axis=1)
+    return out
+
+
+def _seeded_ewm(values: np.ndarray, length: int, alpha: float) -> np.ndarray:
+    """Return an SMA-seeded, ``adjust=False`` exponential average of *values*.
+
+    The first *length* valid values are replaced by their mean as the seed,
+    then ``ewm(alpha=alpha, adjust=False)`` runs over the rest. The recursion
+    itself stays in pandas' compiled ``ewm``; what is skipped is pandas-ta's
+    Series validation and ``iloc`` seeding.
+    """
+    n = values.shape[0]
+    valid = np.flatnonzero(~np.isnan(values))
+    if length <= 0 or valid.size == 0 or valid[0] + length > n:
+        return np.full(n, np.nan)
+
+    first = valid[0]
+    seed = first + length - 1
+    seeded = values.copy()
+    seeded[:seed] = np.nan
+    seeded[seed] = np.nanmean(values[first : seed + 1])
+    return pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def ema(values: np.ndarray, length: int) -> np.ndarray:
+    """Return the *length*-period exponential moving average of *values*.
+
+    Matches ``pandas_ta.ema``: an SMA seed, then smoothing with
+    ``alpha = 2 / (length + 1)`` (``span=length``).
+    """
+    return _seeded_ewm(values, length, 2.0 / (length + 1.0))
+
+
+def _anchored_ema(values: np.ndarray, length: int, seed: int) -> np.ndarray:
+    """Return the *length*-period EMA of *values* seeded at index *seed*.
+
+    The seed is the mean of the *length* values ending at *seed*, as TA-Lib
+    places it. A later NaN carries forward, like the recursion it replaces;
+    ``ewm`` alone would step over it.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if seed < length - 1 or seed >= n:
+        return out
+
+    seeded = values[seed:].copy()
+    seeded[0] = values[seed - length + 1 : seed + 1].mean()
+    out[seed:] = pd.Series(seeded).ewm(span=length, adjust=False).mean().to_numpy()
+    gaps = np.flatnonzero(np.isnan(seeded))
+    if gaps.size:
+        out[seed + gaps[0] :] = np.nan
+    return out
+
+
+def macd(close: np.ndarray, fast: int, slow: int, signal: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the MACD of *close* as ``(macd, histogram, signal)``.
+
+    Matches ``pandas_ta.macd``: after any leading non-finite run, the fast
+    and slow EMAs are seeded at their own lookbacks (TA-Lib alignment) and
+    the signal EMA of the MACD line at ``slow + signal - 2``. pandas-ta
+    runs each EMA as a per-bar Python loop; here each is one ``ewm`` pass.
+    """
+    n = close.shape[0]
+    line, signal_line = np.full((2, n), np.nan)
+    finite = np.flatnonzero(np.isfinite(close))
+    if finite.size:
+        values = close[finite[0] :]
+        tail = slice(finite[0], None)
+        line[tail] = _anchored_ema(values, fast, fast - 1) - _anchored_ema(values, slow, slow - 1)
+        signal_line[tail] = _anchored_ema(line[tail], signal, slow + signal - 2)
+    return line, line - signal_line, signal_line
+
+
+def rsi(close: np.ndarray, length: int) -> np.ndarray:
+    """Return the *length*-period Relative Strength Index of *close*.
+
+    Matches ``pandas_ta.rsi``: one-bar changes split into gains and losses,
+    each smoothed with Wilder's SMA-seeded ``alpha = 1 / length`` average.
+    The split is two branchless ``maximum`` passes rather than pandas-ta's
+    masked assignments into Series copies.
+    """
+    delta = np.empty_like(close)
+    delta[0] = np.nan
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    alpha = 1.0 / length if length > 0 else 0.0
+    gain = _seeded_ewm(np.maximum(delta, 0.0), length, alpha)
+    loss = _seeded_ewm(np.maximum(-delta, 0.0), length, alpha)
+    # A flat window has no gains or losses; like pandas-ta it yields NaN.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 * gain / (gain + loss)
+
+
+def _sliding_weighted_ma(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Return the moving average of *values* under *weights* (oldest bar first).
+
+    Every window is reduced in one matrix-vector product over a window view.
+    """
+    size = weights.shape[0]
+    out = np.full(values.shape[0], np.nan)
+    if 0 < size <= values.shape[0]:
+        out[size - 1 :] = sliding_window_view(values, size) @ weights / weights.sum()
+    return out
+
+
+def wma(values: np.ndarray, length: int) -> np.ndarray:
+    """Return the *length*-period weighted moving average of *values*.
+
+    Matches ``pandas_ta.wma``: linear weights 1..*length*, heaviest on the
+    newest bar. pandas-ta reduces each window through ``rolling().apply``,
+    a Python call per bar.
+    """
+    return _sliding_weighted_ma(values, np.arange(1.0, length + 1.0))
+
+
+# Middle-band modes bbands() computes itself; pandas-ta handles the rest.
+BBANDS_MODES = frozenset({"sma", "wma"})
+
+
+def bbands(values: np.ndarray, length: int, std: float, mamode: str = "sma") -> tuple[np.ndarray, ...]:
+    """Return Bollinger Bands of *values* as ``(lower, mid, upper, bandwidth, percent)``.
+
+    Matches ``pandas_ta.bbands`` for a *mamode* in ``BBANDS_MODES``:
+    population (ddof=0) standard deviation, bandwidth in percent of the
+    middle band, and %B. The mean and deviation come from one window view
+    instead of separate rolling passes.
+    """
+    n = values.shape[0]
+    lower, mid, upper, bandwidth, percent = np.full((5, n), np.nan)
+    if 0 < length <= n:
+        windows = sliding_window_view(values, length)
+        mean = windows.mean(axis=1)
+        deviation = windows - mean[:, np.newaxis]
+        offset = std * np.sqrt((deviation * deviation).mean(axis=1))
+
+        tail = slice(length - 1, None)
+        mid[tail] = mean if mamode == "sma" else wma(values, length)[tail]
+        lower[tail] = mid[tail] - offset
+        upper[tail] = mid[tail] + offset
+        width = upper[tail] - lower[tail]
+        width[width == 0] = _EPSILON
+        bandwidth[tail] = 100 * width / mid[tail]
+        below = values[tail] - lower[tail]
+        below[below == 0] = _EPSILON
+        percent[tail] = below / width
+    return lower, mid, upper, bandwidth, percent
+
+
+def stoch(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    k: int,
+    d: int,
+    smooth_k: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the slow stochastic ``(%K, %D)`` of the bars.
+
+    Matches ``pandas_ta.stoch`` with SMA smoothing: the *k*-bar fast %K
+    (a zero high-low range counts as epsilon), smoothed over *smooth_k*
+    bars into %K and again over *d* bars into %D. The rolling extremes
+    are reduced over window views; at tool-sized *k* that beats an O(n)
+    monotonic-deque scan, which would need a per-bar Python loop.
+    """
+    n = close.shape[0]
+    fast = np.full(n, np.nan)
+    if 0 < k <= n:
+        lowest = sliding_window_view(low, k).min(axis=1)
+        width = sliding_window_view(high, k).max(axis=1) - lowest
+        width[width == 0] = _EPSILON
+        fast[k - 1 :] = 100 * (close[k - 1 :] - lowest) / width
+    slow_k = sma(fast, smooth_k)
+    return slow_k, sma(slow_k, d)
+
+
+def vwap(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    days: np.ndarray,
+) -> np.ndarray:
+    """Return the VWAP of the bars, restarting at each new value of *days*.
+
+    Matches ``pandas_ta.vwap`` with its default daily anchor: cumulative
+    typical-price x volume over cumulative volume within each session. The
+    per-session cumulative sums come from one running sum per column with
+    the previous sessions' totals subtracted, instead of two groupby passes.
+    *days* must be sorted, as a time-ordered index is.
+    """
+    weighted = (high + low + close) / 3.0 * volume
+    cum_weighted = np.nancumsum(weighted)
+    cum_volume = np.nancumsum(volume)
+
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    if starts.size > 1:
+        sessions = np.diff(np.r_[starts, days.shape[0]])
+        cum_weighted -= np.repeat(np.r_[0.0, cum_weighted[starts[1:] - 1]], sessions)
+        cum_volume -= np.repeat(np.r_[0.0, cum_volume[starts[1:] - 1]], sessions)
+
+    # Like a pandas cumsum, a missing input is skipped but yields NaN in place.
+    cum_weighted[np.isnan(weighted)] = np.nan
+    cum_volume[np.isnan(volume)] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cum_weighted / cum_volume
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
 from typing import Annotated, Any, Final, TypeAlias, cast
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
+from schwab_mcp.cache import MISSING
 from schwab_mcp.context import SchwabContext
-from schwab_mcp.tools.utils import JSONType, call
+from schwab_mcp.tools.utils import JSONType, RateLimiter, call
 
-from . import pandas_ta as _pandas_ta
+try:
+    import pandas_ta_classic as _pandas_ta
+except ModuleNotFoundError:
+    _pandas_ta = None
 
 __all__ = [
     "normalize_interval",
@@ -106,24 +113,124 @@ _INTERVAL_CONFIGS: dict[str, _IntervalConfig] = {
 
 def normalize_interval(value: str) -> str:
     """Return canonical short form (e.g., 1d, 15m) for the supplied interval."""
+    if value in _INTERVAL_CONFIGS:
+        # Already canonical (the common case): skip the strip/lower copies.
+        return value
     normalized = value.strip().lower()
     if normalized in _INTERVAL_CONFIGS:
         return normalized
     raise ValueError(f"Unsupported interval '{value}'. Choose from: {', '.join(sorted(_INTERVAL_CONFIGS))}")
 
 
-def _add_utc_timezone(value: _dt.datetime) -> _dt.datetime:
-    if value.tzinfo is None:
-        return value.replace(tzinfo=_dt.timezone.utc)
-    return value.astimezone(_dt.timezone.utc)
+_UTC: Final = _dt.timezone.utc
 
 
-def _parse_timestamp(value: str | _dt.datetime | None) -> _dt.datetime | None:
+def _parse_utc(value: str | _dt.datetime | None) -> _dt.datetime | None:
+    """Return *value* as an aware UTC datetime; naive values are taken as UTC."""
     if value is None:
         return None
-    if isinstance(value, _dt.datetime):
-        return _add_utc_timezone(value)
-    return _add_utc_timezone(_dt.datetime.fromisoformat(value))
+    parsed = value if isinstance(value, _dt.datetime) else _dt.datetime.fromisoformat(value)
+    tzinfo = parsed.tzinfo
+    if tzinfo is None:
+        return parsed.replace(tzinfo=_UTC)
+    if tzinfo is _UTC:
+        # "+00:00"/"Z" strings already parse to the UTC singleton.
+        return parsed
+    return parsed.astimezone(_UTC)
+
+
+def _price_history_fetcher(ctx: SchwabContext, method_name: str) -> Callable[..., Awaitable[Any]]:
+    """Return the bound price-history method, resolved once per server context."""
+    fetchers = ctx.schwab.price_history_fetchers
+    fetcher = fetchers.get(method_name)
+    if fetcher is None:
+        fetcher = fetchers[method_name] = getattr(ctx.price_history, method_name)
+    return fetcher
+
+
+# Repeat indicator calls in an interactive session ask for the same window
+# seconds apart; serve those from the response cache instead of refetching.
+_PRICE_FRAME_TTL = 30.0
+
+
+def _default_end() -> _dt.datetime:
+    """Return "now" rounded up to the next whole minute.
+
+    Concurrent indicator calls then request the same end time, which lets
+    their price-history fetches be shared (see ``_fetch_candles``).
+    """
+    now = _dt.datetime.now(tz=_UTC)
+    return now.replace(second=0, microsecond=0) + _dt.timedelta(minutes=1)
+
+
+# Price-history fetches on the wire, keyed by (fetcher, symbol, end), with
+# the start of each pending window so a request whose window is covered by
+# a concurrent fetch can reuse it instead of sending its own.
+_PendingWindow = tuple[_dt.datetime, "asyncio.Future[JSONType]"]
+_PENDING_WINDOWS: dict[tuple[Any, str, _dt.datetime], list[_PendingWindow]] = {}
+
+
+def _trim_candles(response: JSONType, start: _dt.datetime) -> JSONType:
+    """Drop candles before *start* from a price-history payload covering more."""
+    if not isinstance(response, Mapping):
+        return response
+    candles = response.get("candles")
+    if not isinstance(candles, list):
+        return response
+    start_ms = int(start.timestamp() * 1000)
+    kept = [
+        candle
+        for candle in candles
+        if not isinstance(candle, Mapping)
+        or not isinstance(timestamp := candle.get("datetime"), (int, float))
+        or timestamp >= start_ms
+    ]
+    return {**response, "candles": kept}
+
+
+async def _fetch_candles(
+    fetcher: Callable[..., Awaitable[Any]],
+    symbol: str,
+    start: _dt.datetime | None,
+    end: _dt.datetime,
+    rate_limiter: RateLimiter | None,
+) -> JSONType:
+    """Fetch a price-history window, sharing concurrent fetches that cover it.
+
+    Indicators on the same symbol/interval request differently sized warm-up
+    windows ending at the same time; while a wider window is in flight, a
+    narrower one is served from its response. Identical requests are also
+    coalesced by ``call()`` itself.
+    """
+    if start is None:
+        return await call(
+            fetcher, symbol, start_datetime=start, end_datetime=end, rate_limiter=rate_limiter, coalesce=True
+        )
+
+    key = (fetcher, symbol, end)
+    pending = _PENDING_WINDOWS.get(key)
+    if pending is not None:
+        for pending_start, future in pending:
+            if pending_start <= start:
+                # Shield so one caller's cancellation does not abort the shared fetch.
+                response = await asyncio.shield(future)
+                return response if pending_start == start else _trim_candles(response, start)
+    else:
+        pending = _PENDING_WINDOWS[key] = []
+
+    future = asyncio.ensure_future(
+        call(fetcher, symbol, start_datetime=start, end_datetime=end, rate_limiter=rate_limiter, coalesce=True)
+    )
+    entry = (start, future)
+    pending.append(entry)
+
+    def _release(_: asyncio.Future[JSONType]) -> None:
+        pending.remove(entry)
+        if not pending and _PENDING_WINDOWS.get(key) is pending:
+            del _PENDING_WINDOWS[key]
+
+    future.add_done_callback(_release)
+    return await asyncio.shield(future)
 
 
 def _default_start(*, end: _dt.datetime, interval: _IntervalConfig, bars: int | None) -> _dt.datetime | None:
@@ -132,20 +239,52 @@ def _default_start(*, end: _dt.datetime, interval: _IntervalConfig, bars: int |
     return end - (interval.bar_size * bars)
 
 
-def _candles_to_dataframe(candles: Iterable[Mapping[str, Any]]) -> pd.DataFrame:
-    frame = pd.DataFrame.from_records(candles)
-    if frame.empty:
-        return frame
+_CANDLE_COLUMNS: Final = ("open", "high", "low", "close", "volume")
 
-    if "datetime" in frame.columns:
-        frame["datetime"] = pd.to_datetime(frame["datetime"], unit="ms", utc=True, errors="coerce")
-        frame = frame.dropna(subset=["datetime"]).set_index("datetime")
 
-    numeric_columns = [column for column in ("open", "high", "low", "close", "volume") if column in frame.columns]
-    if numeric_columns:
-        frame[numeric_columns] = frame[numeric_columns].apply(pd.to_numeric, errors="coerce")
+def _candle_column(candles: list[Mapping[str, Any]], key: str) -> np.ndarray:
+    values = [candle.get(key) for candle in candles]
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Malformed payloads (e.g. non-numeric strings) coerce to NaN per value.
+        return np.asarray(pd.to_numeric(pd.Series(values, dtype=object), errors="coerce"), dtype=np.float64)
 
-    return frame.sort_index().dropna(how="all")
+
+def _candles_to_dataframe(candles: Iterable[Mapping[str, Any]]) -> pd.DataFrame:
+    """Build an OHLCV frame indexed by UTC candle time.
+
+    Columns are gathered straight into float64 arrays (Schwab candles are
+    already numeric) instead of going through an object-dtype record frame.
+    """
+    records = candles if isinstance(candles, list) else list(candles)
+    if not records:
+        return pd.DataFrame()
+
+    data = {
+        column: _candle_column(records, column)
+        for column in _CANDLE_COLUMNS
+        if any(column in candle for candle in records)
+    }
+
+    if any("datetime" in candle for candle in records):
+        timestamps = _candle_column(records, "datetime")
+        valid = ~np.isnan(timestamps)
+        index = pd.to_datetime(timestamps[valid].astype(np.int64), unit="ms", utc=True)
+        frame = pd.DataFrame({column: values[valid] for column, values in data.items()}, index=index)
+        frame.index.name = "datetime"
+    else:
+        frame = pd.DataFrame(data)
+
+    # Schwab returns candles in chronological order, so the sort (and its
+    # copy) is normally skipped.
+    if not frame.index.is_monotonic_increasing:
+        frame = frame.sort_index()
+    # Every column is float64, so one isnan mask stands in for dropna(how="all").
+    empty_rows = np.isnan(frame.to_numpy(dtype=np.float64)).all(axis=1)
+    if empty_rows.any():
+        frame = frame.loc[~empty_rows]
+    return frame
 
 
 def ensure_columns(frame: pd.DataFrame, columns: Iterable[str]) -> None:
@@ -163,6 +302,57 @@ def compute_window(length: int, *, multiplier: int = 3, min_padding: int = 20) -
 IndicatorFn = Callable[[pd.DataFrame], pd.Series | pd.DataFrame | None]
 
 
+# Finished indicator payloads live as long as the candles they were built
+# from, so re-asking the same question skips the pandas work as well.
+_INDICATOR_TTL = _PRICE_FRAME_TTL
+
+
+def _indicator_cache_key(
+    indicator_name: str,
+    symbol: str,
+    interval: str,
+    start: str | None,
+    end: str | None,
+    bars: int,
+    points: int | None,
+    extra_metadata: Mapping[str, Any] | None,
+) -> tuple[Any, ...]:
+    """Key a computed indicator by every input that shapes its payload.
+
+    Callers pass all of their tuning parameters in *extra_metadata*. An
+    open-ended request is keyed by the same minute-aligned end time that
+    ``fetch_price_frame`` fetches up to.
+    """
+    return (
+        "indicator",
+        indicator_name,
+        symbol.upper(),
+        normalize_interval(interval),
+        start,
+        end if end is not None else _default_end(),
+        bars,
+        points,
+        *(extra_metadata or {}).items(),
+    )
+
+
+def _indicator_response(
+    metadata: Mapping[str, Any],
+    values: list[dict[str, Any]],
+    extra_metadata: Mapping[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the JSON payload shared by every indicator tool in one dict display."""
+    return {
+        "symbol": metadata["symbol"],
+        "interval": metadata["interval"],
+        "start": metadata["start"],
+        "end": metadata["end"],
+        "values": values,
+        "candles": metadata["candles_returned"],
+        **(extra_metadata or {}),
+    }
+
+
 async def compute_series_indicator(
     ctx: SchwabContext,
     symbol: str,
@@ -179,6 +369,12 @@ async def compute_series_indicator(
     extra_metadata: dict[str, Any] | None = None,
 ) -> JSONType:
     """Fetch price history for *symbol* and compute a single-series indicator."""
+    cache = ctx.schwab.response_cache
+    cache_key = _indicator_cache_key(indicator_name, symbol, interval, start, end, bars, points, extra_metadata)
+    cached = cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
     frame, metadata = await fetch_price_frame(ctx, symbol, interval=interval, start=start, end=end, bars=bars)
 
     if required_columns:
@@ -194,26 +390,17 @@ async def compute_series_indicator(
     if isinstance(result, pd.DataFrame):
         raise TypeError(f"Expected Series from {indicator_name}, got DataFrame. Use compute_frame_indicator instead.")
 
-    result = result.dropna()
-    if result.empty:
-        raise ValueError(f"Not enough price history to compute {indicator_name}.")
-
+    # series_to_json drops the warm-up NaNs itself, so no dropna() copy here.
     values = series_to_json(
         result,
         limit=points if points is not None else DEFAULT_POINTS,
         value_key=value_key,
     )
+    if not values:
+        raise ValueError(f"Not enough price history to compute {indicator_name}.")
 
-    response: dict[str, Any] = {
-        "symbol": metadata["symbol"],
-        "interval": metadata["interval"],
-        "start": metadata["start"],
-        "end": metadata["end"],
-        "values": values,
-        "candles": metadata["candles_returned"],
-    }
-    if extra_metadata:
-        response.update(extra_metadata)
+    response = _indicator_response(metadata, values, extra_metadata)
+    cache.put(cache_key, response, _INDICATOR_TTL)
     return response
 
 
@@ -232,6 +419,12 @@ async def compute_frame_indicator(
     extra_metadata: dict[str, Any] | None = None,
 ) -> JSONType:
     """Fetch price history for *symbol* and compute a multi-column indicator."""
+    cache = ctx.schwab.response_cache
+    cache_key = _indicator_cache_key(indicator_name, symbol, interval, start, end, bars, points, extra_metadata)
+    cached = cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
     frame, metadata = await fetch_price_frame(ctx, symbol, interval=interval, start=start, end=end, bars=bars)
 
     if required_columns:
@@ -247,25 +440,16 @@ async def compute_frame_indicator(
     if isinstance(result, pd.Series):
         raise TypeError(f"Expected DataFrame from {indicator_name}, got Series. Use compute_series_indicator instead.")
 
-    result = result.dropna(how="all")
-    if result.empty:
-        raise ValueError(f"Not enough price history to compute {indicator_name}.")
-
+    # frame_to_json skips rows without any value, so no dropna() copy here.
     values = frame_to_json(
         result,
         limit=points if points is not None else DEFAULT_POINTS,
     )
+    if not values:
+        raise ValueError(f"Not enough price history to compute {indicator_name}.")
 
-    response: dict[str, Any] = {
-        "symbol": metadata["symbol"],
-        "interval": metadata["interval"],
-        "start": metadata["start"],
-        "end": metadata["end"],
-        "values": values,
-        "candles": metadata["candles_returned"],
-    }
-    if extra_metadata:
-        response.update(extra_metadata)
+    response = _indicator_response(metadata, values, extra_metadata)
+    cache.put(cache_key, response, _INDICATOR_TTL)
     return response
 
 
@@ -282,18 +466,18 @@ async def fetch_price_frame(
     interval_key = normalize_interval(interval)
     config = _INTERVAL_CONFIGS[interval_key]
 
-    end_dt = _parse_timestamp(end) or _dt.datetime.now(tz=_dt.timezone.utc)
-    start_dt = _parse_timestamp(start) or _default_start(end=end_dt, interval=config, bars=bars)
+    end_dt = _parse_utc(end) or _default_end()
+    start_dt = _parse_utc(start) or _default_start(end=end_dt, interval=config, bars=bars)
 
-    fetcher = getattr(ctx.price_history, config.method_name)
-    response: JSONType = await call(
-        fetcher,
-        symbol,
-        start_datetime=start_dt,
-        end_datetime=end_dt,
-    )
-    if not isinstance(response, Mapping):
-        raise TypeError("Unexpected response type for price history payload")
+    cache = ctx.schwab.response_cache
+    cache_key = ("fetch_price_frame", config.method_name, symbol.upper(), start_dt, end_dt)
+    response = cache.get(cache_key)
+    if response is MISSING:
+        fetcher = _price_history_fetcher(ctx, config.method_name)
+        response = await _fetch_candles(fetcher, symbol, start_dt, end_dt, ctx.schwab.rate_limiter)
+        if not isinstance(response, Mapping):
+            raise TypeError("Unexpected response type for price history payload")
+        cache.put(cache_key, response, _PRICE_FRAME_TTL)
 
     candles = response.get("candles", [])
     frame = _candles_to_dataframe(candles)
@@ -322,26 +506,28 @@ def series_to_json(
     if series.empty:
         return []
 
-    series = series.dropna()
-    if series.empty:
-        return []
-
-    if limit is not None and limit > 0:
-        series = series.tail(limit)
-
     value_key = value_key or (str(series.name) if series.name else "value")
 
-    index = _normalize_index(series.index)
-    values = series.to_numpy()
-
-    rows: list[dict[str, Any]] = []
-    for timestamp, value in zip(index, values, strict=True):
-        if pd.isna(timestamp) or pd.isna(value):
-            continue
+    # Pick the last *limit* non-NaN values by position on one float64
+    # ndarray instead of building dropna()/tail() Series copies.
+    values = series.to_numpy(dtype=np.float64)
+    rows = np.flatnonzero(~np.isnan(values))
+    if limit is not None and limit > 0:
+        rows = rows[-limit:]
+    if rows.size == 0:
+        return []
 
-        rows.append({"timestamp": timestamp.isoformat(), value_key: round(float(value), 6)})
+    index = _normalize_index(series.index.take(rows))
+    isos = _isoformat_index(index)
+    kept = values[rows].tolist()
 
-    return rows
+    if index.hasnans:
+        return [
+            {"timestamp": iso, value_key: round(value, 6)}
+            for iso, value, missing in zip(isos, kept, index.isna().tolist(), strict=True)
+            if not missing
+        ]
+    return [{"timestamp": iso, value_key: round(value, 6)} for iso, value in zip(isos, kept, strict=True)]
 
 
 def frame_to_json(
@@ -353,23 +539,53 @@ def frame_to_json(
     if frame.empty:
         return []
 
-    numeric = frame.apply(pd.to_numeric, errors="coerce")
-    numeric = numeric.dropna(how="all")
-    if numeric.empty:
+    # Indicator outputs are already float64; only coerce mixed/object frames.
+    if all(is_numeric_dtype(dtype) for dtype in frame.dtypes):
+        numeric = frame
+    else:
+        numeric = frame.apply(pd.to_numeric, errors="coerce")
+
+    columns = [str(column) for column in numeric.columns]
+    # Work on one float64 ndarray: pick the last *limit* rows with any value
+    # by position rather than building dropna()/tail() frames first.
+    values = numeric.to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    rows = np.flatnonzero(present.any(axis=1))
+    if rows.size == 0:
         return []
 
     if limit is not None and limit > 0:
-        numeric = numeric.tail(limit)
-
-    index = _normalize_index(numeric.index)
-    rows: list[dict[str, Any]] = []
-    for timestamp, (_, row) in zip(index, numeric.iterrows(), strict=True):
-        valid_items = {str(column): round(float(value), 6) for column, value in row.items() if pd.notna(value)}
-        if not valid_items:
-            continue
-        rows.append({"timestamp": timestamp.isoformat(), **valid_items})
-
-    return rows
+        rows = rows[-limit:]
+
+    isos = _isoformat_index(_normalize_index(numeric.index.take(rows)))
+    values = values[rows]
+    present = present[rows]
+    if present.all():
+        return [
+            {"timestamp": iso, **{column: round(value, 6) for column, value in zip(columns, row, strict=True)}}
+            for iso, row in zip(isos, values.tolist(), strict=True)
+        ]
+    return [
+        {
+            "timestamp": iso,
+            **{column: round(value, 6) for column, value, ok in zip(columns, row, mask, strict=True) if ok},
+        }
+        for iso, row, mask in zip(isos, values.tolist(), present.tolist(), strict=True)
+    ]
+
+
+def _isoformat_index(index: pd.DatetimeIndex) -> list[str]:
+    """Return ``Timestamp.isoformat()`` for each entry of a UTC index.
+
+    Whole-second indexes (every candle interval) are formatted in a single
+    vectorized ``strftime`` pass; anything with sub-second precision or NaT
+    falls back to per-element ``isoformat()`` so the output is identical.
+    """
+    if not index.hasnans:
+        instants = index.tz_localize(None).to_numpy()
+        if (instants == instants.astype("datetime64[s]")).all():
+            return index.strftime("%Y-%m-%dT%H:%M:%S+00:00").tolist()
+    return [timestamp.isoformat() for timestamp in index]
 
 
 def _normalize_index(index: pd.Index) -> pd.DatetimeIndex:
@@ -384,5 +600,5 @@ def _normalize_index(index: pd.Index) -> pd.DatetimeIndex:
     return converted
 
 
-# Re-export the optional dependency so submodules can share the import guard.
+# Export the optional dependency so indicator modules share one import guard.
 pandas_ta = cast(Any, _pandas_ta)
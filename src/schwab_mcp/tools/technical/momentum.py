@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import Annotated, Any
 
+import numpy as np
+import pandas as pd
 from mcp.server.fastmcp import FastMCP
 
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
 from schwab_mcp.tools.utils import JSONType
 
+from . import _kernels
 from .base import (
     EndTime,
     Interval,
@@ -20,12 +24,26 @@ from .base import (
     compute_frame_indicator,
     compute_series_indicator,
     compute_window,
-    pandas_ta,
 )
 
 __all__ = ["register"]
 
 
+# Module-level indicator bodies bound with functools.partial, so each call
+# reuses one code object instead of building a closure over its arguments.
+def _rsi(frame: pd.DataFrame, *, length: int) -> pd.Series:
+    close = frame["close"]
+    return pd.Series(_kernels.rsi(close.to_numpy(dtype=np.float64), length), index=close.index)
+
+
+def _stoch(frame: pd.DataFrame, *, k: int, d: int, smooth_k: int) -> pd.DataFrame:
+    high, low, close = (frame[column].to_numpy(dtype=np.float64) for column in ("high", "low", "close"))
+    slow_k, slow_d = _kernels.stoch(high, low, close, k, d, smooth_k)
+    # Column names match pandas_ta.stoch's output.
+    suffix = f"{k}_{d}_{smooth_k}"
+    return pd.DataFrame({f"STOCHk_{suffix}": slow_k, f"STOCHd_{suffix}": slow_d}, index=frame.index)
+
+
 async def rsi(
     ctx: SchwabContext,
     symbol: Symbol,
@@ -42,7 +60,7 @@ async def rsi(
     return await compute_series_indicator(
         ctx,
         symbol,
-        indicator_fn=lambda frame: pandas_ta.rsi(frame["close"], length=length),
+        indicator_fn=functools.partial(_rsi, length=length),
         indicator_name="rsi",
         interval=interval,
         start=start,
@@ -76,14 +94,7 @@ async def stoch(
     return await compute_frame_indicator(
         ctx,
         symbol,
-        indicator_fn=lambda frame: pandas_ta.stoch(
-            high=frame["high"],
-            low=frame["low"],
-            close=frame["close"],
-            k=k_length,
-            d=d_length,
-            smooth_k=smooth_k,
-        ),
+        indicator_fn=functools.partial(_stoch, k=k_length, d=d_length, smooth_k=smooth_k),
         indicator_name="stoch",
         interval=interval,
         start=start,
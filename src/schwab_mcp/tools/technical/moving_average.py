@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import Annotated, Any
 
+import numpy as np
 import pandas as pd
 from mcp.server.fastmcp import FastMCP
 
@@ -12,6 +14,7 @@ from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
 from schwab_mcp.tools.utils import JSONType
 
+from . import _kernels
 from .base import (
     EndTime,
     Interval,
@@ -20,12 +23,27 @@ from .base import (
     Symbol,
     compute_frame_indicator,
     compute_window,
-    pandas_ta,
 )
 
 __all__ = ["register"]
 
 
+# Bound with functools.partial per call rather than rebuilt as a closure.
+def _moving_averages(frame: pd.DataFrame, *, length: int) -> pd.DataFrame:
+    close = frame["close"]
+    values = close.to_numpy(dtype=np.float64)
+    sma = _kernels.sma(values, length)
+    ema = _kernels.ema(values, length)
+    # Keep only rows where both series have warmed up so every returned
+    # row includes both sma_{length} and ema_{length}. The rows are picked
+    # on the arrays, so no NaN-laden frame is built and then dropna()'d.
+    rows = np.flatnonzero(~(np.isnan(sma) | np.isnan(ema)))
+    return pd.DataFrame(
+        {f"sma_{length}": sma[rows], f"ema_{length}": ema[rows]},
+        index=close.index.take(rows),
+    )
+
+
 async def moving_average(
     ctx: SchwabContext,
     symbol: Symbol,
@@ -39,22 +57,10 @@ async def moving_average(
     if length <= 0:
         raise ValueError("length must be a positive integer")
 
-    def indicator_fn(frame: pd.DataFrame) -> pd.DataFrame:
-        close = frame["close"]
-        combined = pd.DataFrame(
-            {
-                f"sma_{length}": pandas_ta.sma(close, length=length),
-                f"ema_{length}": pandas_ta.ema(close, length=length),
-            }
-        )
-        # Drop rows where either series hasn't warmed up yet so every
-        # returned row includes both sma_{length} and ema_{length}.
-        return combined.dropna(how="any")
-
     return await compute_frame_indicator(
         ctx,
         symbol,
-        indicator_fn=indicator_fn,
+        indicator_fn=functools.partial(_moving_averages, length=length),
         indicator_name="moving_average",
         interval=interval,
         start=start,
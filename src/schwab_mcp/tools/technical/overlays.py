@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import Annotated, Any
 
+import numpy as np
 import pandas as pd
 from mcp.server.fastmcp import FastMCP
 
@@ -12,6 +14,7 @@ from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
 from schwab_mcp.tools.utils import JSONType
 
+from . import _kernels
 from .base import (
     DEFAULT_POINTS,
     EndTime,
@@ -32,8 +35,8 @@ __all__ = ["register"]
 # pandas_ta_classic (the pinned indicator library, aliased as `pandas_ta` in
 # .base) has no `pivot_points` attribute under any version we've run against
 # (confirmed empty on 0.3.59 — no top-level function, no submodule), so the
-# indicator is computed directly below instead. vwap/bbands still use
-# pandas_ta since those genuinely exist there.
+# indicator is computed directly below instead. VWAP and SMA/WMA-mode bbands
+# use the array kernels in ._kernels; other bbands modes still use pandas_ta.
 
 _PIVOT_METHODS = ("standard", "fibonacci", "camarilla", "woodie", "demark")
 
@@ -102,6 +105,31 @@ def _compute_pivot_points(frame: pd.DataFrame, *, method: str, lookback: int | N
     return result
 
 
+def _kernel_bbands(frame: pd.DataFrame, *, length: int, std: float, mamode: str) -> pd.DataFrame:
+    """Compute Bollinger Bands with the fused kernel, named like pandas_ta.bbands."""
+    close = frame["close"]
+    bands = _kernels.bbands(close.to_numpy(dtype=np.float64), length, std, mamode)
+    suffix = f"{length}_{float(std)}"
+    return pd.DataFrame(
+        dict(zip((f"BB{band}_{suffix}" for band in "LMUBP"), bands, strict=True)),
+        index=close.index,
+    )
+
+
+def _pandas_ta_bbands(frame: pd.DataFrame, *, length: int, std: float, mamode: str) -> pd.DataFrame | None:
+    return pandas_ta.bbands(frame["close"], length=length, std=std, mamode=mamode)
+
+
+def _session_days(index: pd.Index) -> np.ndarray:
+    """Return each bar's calendar day in the index's own timezone.
+
+    This is the session pandas_ta.vwap anchors to (``to_period("D")``).
+    """
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        index = index.tz_localize(None)
+    return np.asarray(index, dtype="datetime64[ns]").astype("datetime64[D]")
+
+
 async def vwap(
     ctx: SchwabContext,
     symbol: Symbol,
@@ -121,32 +149,26 @@ async def vwap(
 
     ensure_columns(frame, ("high", "low", "close", "volume"))
 
-    volume = frame["volume"].astype(float)
-    positive_volume_mask = volume.notna() & (volume > 0)
-    if not positive_volume_mask.any():
+    # NaN volume folds into the > 0 test, and the kernel reads only the
+    # selected bars, so the frame itself is never filtered or copied.
+    volume = frame["volume"].to_numpy(dtype=np.float64, na_value=0.0)
+    positive_volume = np.flatnonzero(volume > 0.0)
+    if positive_volume.size == 0:
         raise ValueError("Price history includes no positive volume, so VWAP cannot be computed.")
 
-    frame = frame.loc[positive_volume_mask].copy()
-
-    vwap_series = pandas_ta.vwap(
-        high=frame["high"],
-        low=frame["low"],
-        close=frame["close"],
-        volume=frame["volume"],
-        length=length,
-    )
-    if vwap_series is None:
-        raise RuntimeError("pandas_ta_classic.vwap returned no values.")
-
-    vwap_series = vwap_series.dropna()
-    if vwap_series.empty:
-        raise ValueError("Not enough price history to compute VWAP.")
+    rows = positive_volume if positive_volume.size < volume.size else slice(None)
+    index = frame.index[rows]
+    high, low, close = (frame[column].to_numpy(dtype=np.float64)[rows] for column in ("high", "low", "close"))
+    vwap_values = _kernels.vwap(high, low, close, volume[rows], _session_days(index))
 
+    # series_to_json skips NaN values itself, so no dropna() copy here.
     values = series_to_json(
-        vwap_series,
+        pd.Series(vwap_values, index=index),
         limit=points if points is not None else DEFAULT_POINTS,
         value_key="vwap",
     )
+    if not values:
+        raise ValueError("Not enough price history to compute VWAP.")
 
     return {
         "symbol": metadata["symbol"],
@@ -181,7 +203,7 @@ async def pivot_points(
     return await compute_frame_indicator(
         ctx,
         symbol,
-        indicator_fn=lambda frame: _compute_pivot_points(frame, method=method, lookback=lookback),
+        indicator_fn=functools.partial(_compute_pivot_points, method=method, lookback=lookback),
         indicator_name="pivot_points",
         interval=interval,
         start=start,
@@ -210,15 +232,16 @@ async def bollinger_bands(
     if std_dev <= 0:
         raise ValueError("std_dev must be positive")
 
+    mode = ma_mode.lower()
+    if mode in _kernels.BBANDS_MODES:
+        indicator_fn = functools.partial(_kernel_bbands, length=length, std=std_dev, mamode=mode)
+    else:
+        indicator_fn = functools.partial(_pandas_ta_bbands, length=length, std=std_dev, mamode=ma_mode)
+
     return await compute_frame_indicator(
         ctx,
         symbol,
-        indicator_fn=lambda frame: pandas_ta.bbands(
-            frame["close"],
-            length=length,
-            std=std_dev,
-            mamode=ma_mode,
-        ),
+        indicator_fn=indicator_fn,
         indicator_name="bbands",
         interval=interval,
         start=start,
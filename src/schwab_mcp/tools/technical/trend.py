@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import Annotated, Any
 
+import numpy as np
+import pandas as pd
 from mcp.server.fastmcp import FastMCP
 
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
 from schwab_mcp.tools.utils import JSONType
 
+from . import _kernels
 from .base import (
     EndTime,
     Interval,
@@ -26,6 +30,17 @@ from .base import (
 __all__ = ["register"]
 
 
+def _macd(frame: pd.DataFrame, *, fast: int, slow: int, signal: int) -> pd.DataFrame:
+    close = frame["close"]
+    line, histogram, signal_line = _kernels.macd(close.to_numpy(dtype=np.float64), fast, slow, signal)
+    # Column names and order match pandas_ta.macd's output.
+    suffix = f"{fast}_{slow}_{signal}"
+    return pd.DataFrame(
+        {f"MACD_{suffix}": line, f"MACDh_{suffix}": histogram, f"MACDs_{suffix}": signal_line},
+        index=close.index,
+    )
+
+
 async def macd(
     ctx: SchwabContext,
     symbol: Symbol,
@@ -46,12 +61,7 @@ async def macd(
     return await compute_frame_indicator(
         ctx,
         symbol,
-        indicator_fn=lambda frame: pandas_ta.macd(
-            frame["close"],
-            fast=fast_length,
-            slow=slow_length,
-            signal=signal_length,
-        ),
+        indicator_fn=functools.partial(_macd, fast=fast_length, slow=slow_length, signal=signal_length),
         indicator_name="macd",
         interval=interval,
         start=start,
@@ -294,6 +294,7 @@ async def _fetch_option_chain(ctx: SchwabContext, symbol: str) -> Mapping[str, A
     response = await call(
         ctx.options.get_option_chain,
         symbol,
+        rate_limiter=ctx.schwab.rate_limiter,
         contract_type=None,
         strike_count=10,
         include_underlying_quote=True,
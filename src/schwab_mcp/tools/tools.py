@@ -9,7 +9,7 @@ from mcp.server.fastmcp import FastMCP
 
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
-from schwab_mcp.tools.utils import JSONType, call, parse_date
+from schwab_mcp.tools.utils import JSONType, call, enum_member, parse_date, parse_list
 
 
 async def get_datetime() -> str:
@@ -32,14 +32,11 @@ async def get_market_hours(
     """Get market hours for specified markets (EQUITY, OPTION, etc.) on a given date (YYYY-MM-DD, default today)."""
     client = ctx.tools
 
-    if isinstance(markets, str):
-        markets = [m.strip() for m in markets.split(",")]
-
-    market_enums = [client.MarketHours.Market[m.upper()] for m in markets]
+    market_enums = [enum_member(client.MarketHours.Market, m) for m in parse_list(markets)]
 
     date_obj = parse_date(date)
 
-    return await call(client.get_market_hours, market_enums, date=date_obj)
+    return await call(client.get_market_hours, market_enums, date=date_obj, rate_limiter=ctx.schwab.rate_limiter)
 
 
 async def get_movers(
@@ -61,9 +58,10 @@ async def get_movers(
 
     return await call(
         client.get_movers,
-        client.Movers.Index[index.upper()],
-        sort_order=client.Movers.SortOrder[sort.upper()] if sort else None,
-        frequency=client.Movers.Frequency[frequency.upper()] if frequency else None,
+        enum_member(client.Movers.Index, index),
+        sort_order=enum_member(client.Movers.SortOrder, sort) if sort else None,
+        frequency=enum_member(client.Movers.Frequency, frequency) if frequency else None,
+        rate_limiter=ctx.schwab.rate_limiter,
     )
 
 
@@ -111,6 +109,7 @@ async def get_instruments(
         client.get_instruments,
         symbol,
         projection=client.Instrument.Projection[proj_enum_name],
+        rate_limiter=ctx.schwab.rate_limiter,
     )
 
 
@@ -7,7 +7,7 @@ from mcp.server.fastmcp import FastMCP
 
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools._registration import register_tool
-from schwab_mcp.tools.utils import JSONType, call, parse_date
+from schwab_mcp.tools.utils import JSONType, call, enum_member, parse_date, parse_list
 
 
 async def get_transactions(
@@ -35,14 +35,15 @@ async def get_transactions(
 
     transaction_type_enums = None
     if transaction_type is not None:
-        if isinstance(transaction_type, str):
-            transaction_type = [t.strip() for t in transaction_type.split(",")]
-        transaction_type_enums = [client.Transactions.TransactionType[t.upper()] for t in transaction_type]
+        transaction_type_enums = [
+            enum_member(client.Transactions.TransactionType, t) for t in parse_list(transaction_type)
+        ]
 
     # Corrected function name to client.get_transactions and keyword arg to transaction_types
     return await call(
         client.get_transactions,
         account_hash,
+        rate_limiter=ctx.schwab.rate_limiter,
         start_date=start_date_obj,
         end_date=end_date_obj,
         transaction_types=transaction_type_enums,  # Corrected keyword argument
@@ -59,7 +60,7 @@ async def get_transaction(
     Params: account_hash, transaction_id (from get_transactions).
     """
     client = ctx.transactions
-    return await call(client.get_transaction, account_hash, transaction_id)
+    return await call(client.get_transaction, account_hash, transaction_id, rate_limiter=ctx.schwab.rate_limiter)
 
 
 _READ_ONLY_TOOLS = (
@@ -2,9 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
 import datetime
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeAlias
+import enum
+import functools
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any, TypeAlias, TypeVar
+
+import httpx
+import pydantic_core
+
+try:  # Optional: orjson decodes/encodes large payloads such as option chains several times faster.
+    from orjson import OPT_NON_STR_KEYS as _ORJSON_OPTIONS, dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _ORJSON_OPTIONS = 0
+    _json_dumps = None
+    _json_loads = None
 
 JSONPrimitive = str | int | float | bool | None
 JSONType: TypeAlias = JSONPrimitive | dict[str, Any] | list[Any]
@@ -12,6 +27,8 @@ JSONType: TypeAlias = JSONPrimitive | dict[str, Any] | list[Any]
 
 ResponseHandler: TypeAlias = Callable[[Any], tuple[bool, JSONType]]
 
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
 
 class SchwabAPIError(Exception):
     """Represents an error response returned from the Schwab API."""
@@ -26,23 +43,189 @@ class SchwabAPIError(Exception):
         super().__init__(f"Schwab API request failed; status={status_code}; url={url}; body={body}")
 
 
+class RateLimiter:
+    """Sliding-window limiter for outbound Schwab API requests.
+
+    Remembers the send times of the last ``max_rate`` requests; a new
+    request goes out once the oldest of them is ``time_period`` seconds old,
+    so no ``time_period``-long window ever holds more than ``max_rate``
+    requests. Slots are reserved synchronously before sleeping, so
+    concurrent callers on one event loop never need a lock.
+    """
+
+    __slots__ = ("_max_rate", "_sent", "_time_period")
+
+    def __init__(self, max_rate: int, time_period: float) -> None:
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        self._max_rate = max_rate
+        self._time_period = time_period
+        self._sent: collections.deque[float] = collections.deque()
+
+    def reserve(self) -> float:
+        """Reserve the next request slot and return seconds to wait for it."""
+        now = time.monotonic()
+        slot = now
+        if len(self._sent) == self._max_rate:
+            slot = max(now, self._sent.popleft() + self._time_period)
+        self._sent.append(slot)
+        return slot - now
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Requests currently on the wire, keyed by endpoint and arguments, so
+# identical concurrent reads can share a single HTTP round-trip.
+_IN_FLIGHT: dict[Hashable, asyncio.Future[Any]] = {}
+
+_NO_CONTENT_STATUSES = frozenset({201, 204})
+
+
+async def _send(
+    func: Callable[..., Awaitable[Any]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    rate_limiter: RateLimiter | None,
+) -> Any:
+    if rate_limiter is not None:
+        await rate_limiter.acquire()
+    return await func(*args, **kwargs)
+
+
+async def _send_coalesced(
+    func: Callable[..., Awaitable[Any]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    rate_limiter: RateLimiter | None,
+) -> Any:
+    try:
+        key = (func, args, frozenset(kwargs.items()))
+        pending = _IN_FLIGHT.get(key)
+    except TypeError:
+        # Unhashable arguments (e.g. lists) cannot be keyed; send directly.
+        return await _send(func, args, kwargs, rate_limiter)
+    if pending is None:
+        pending = asyncio.ensure_future(_send(func, args, kwargs, rate_limiter))
+        _IN_FLIGHT[key] = pending
+        pending.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+    # Shield so one caller's cancellation does not abort the shared request.
+    return await asyncio.shield(pending)
+
+
+@functools.lru_cache(maxsize=512)
+def enum_member(enum_cls: type[enum.Enum], name: str) -> Any:
+    """Look up an enum member by case-insensitive name.
+
+    Memoized per ``(enum_cls, name)`` so repeated tool calls skip the
+    ``str.upper()`` allocation and enum ``__getitem__``. Enum classes are
+    immutable, so cached members never go stale.
+
+    Raises:
+        ValueError: If ``name`` is not a member; the message lists the valid
+            names. Failed lookups are not cached.
+    """
+    try:
+        return enum_cls[name.upper()]
+    except KeyError:
+        choices = ", ".join(enum_cls.__members__)
+        raise ValueError(f"Invalid {enum_cls.__name__}: {name!r}. Must be one of: {choices}") from None
+
+
+_fromisoformat = datetime.datetime.fromisoformat
+_date_fromisoformat = datetime.date.fromisoformat
+
+
+def _parse_date_string(value: str) -> datetime.date:
+    # date.fromisoformat() also takes basic ("20240315") and week ("2024-W11-5")
+    # forms on 3.11+, so only hand it strings already shaped like YYYY-MM-DD.
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return _date_fromisoformat(value)
+        except ValueError:
+            pass
+    # Slow path keeps accepting non-padded dates such as "2024-3-5", building
+    # the date directly instead of via a throwaway strptime() datetime.
+    parts = value.split("-")
+    if (
+        len(parts) == 3
+        and len(parts[0]) == 4
+        and 1 <= len(parts[1]) <= 2
+        and 1 <= len(parts[2]) <= 2
+        and all(part.isascii() and part.isdigit() for part in parts)
+    ):
+        return datetime.date(int(parts[0]), int(parts[1]), int(parts[2]))
+    raise ValueError(f"Invalid date: {value!r}. Must be YYYY-MM-DD")
+
+
+def _none_date(_: None) -> None:
+    return None
+
+
+def _same_date(value: datetime.date) -> datetime.date:
+    return value
+
+
+# Exact-type dispatch: one dict lookup instead of a chain of isinstance
+# checks. datetime must map separately because it subclasses date.
+_DATE_PARSERS: dict[type, Callable[[Any], datetime.date | None]] = {
+    type(None): _none_date,
+    datetime.date: _same_date,
+    datetime.datetime: datetime.datetime.date,
+    str: _parse_date_string,
+}
+
+
 def parse_date(value: str | datetime.date | None) -> datetime.date | None:
     """Parse a date from string, date, datetime, or None.
 
     Args:
-        value: A date string in YYYY-MM-DD format, a date object,
-               a datetime object, or None.
+        value: An ISO 8601 date string (YYYY-MM-DD; unpadded month/day
+               is also accepted), a date object, a datetime object, or None.
 
     Returns:
         A date object, or None if the input was None.
+
+    Raises:
+        ValueError: If a string is not a valid YYYY-MM-DD date.
+        TypeError: If the value is not a string, date, datetime, or None.
     """
-    if value is None:
-        return None
-    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
-        return value
+    parser = _DATE_PARSERS.get(type(value))
+    if parser is not None:
+        return parser(value)
+    # Subclasses such as pandas.Timestamp miss the exact-type table.
     if isinstance(value, datetime.datetime):
         return value.date()
-    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str):
+        return _parse_date_string(value)
+    raise TypeError(f"Unsupported date value: {value!r}")
+
+
+def parse_list(value: str | list[str]) -> list[str]:
+    """Normalize a list parameter given as a list or a comma-separated string.
+
+    Strings are split on commas with surrounding whitespace and empty entries
+    dropped (inner spaces are kept: OCC option symbols are space-padded).
+    Duplicates are removed, preserving first-seen order.
+    """
+    if isinstance(value, str):
+        return list(dict.fromkeys(item for item in map(str.strip, value.split(",")) if item))
+    return list(dict.fromkeys(value))
+
+
+def parse_symbols(value: str | list[str]) -> list[str]:
+    """Normalize a symbol list parameter as :func:`parse_list` does, upper-cased.
+
+    List items are stripped as well and blank entries dropped, so ``" spy"``
+    and ``"SPY"`` de-duplicate to a single ``"SPY"``.
+    """
+    symbols = (symbol.strip().upper() for symbol in parse_list(value))
+    return list(dict.fromkeys(symbol for symbol in symbols if symbol))
 
 
 def parse_datetime(value: str | None) -> datetime.datetime | None:
@@ -54,7 +237,18 @@ def parse_datetime(value: str | None) -> datetime.datetime | None:
     Returns:
         A datetime object, or None if the input was None.
     """
-    return datetime.datetime.fromisoformat(value) if value is not None else None
+    return _fromisoformat(value) if value is not None else None
+
+
+def encode_json(data: JSONType) -> str:
+    """Serialize *data* as compact JSON text.
+
+    Uses ``orjson`` when installed and pydantic-core's encoder otherwise;
+    values neither understands natively are encoded via ``str()``.
+    """
+    if _json_dumps is not None:
+        return _json_dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+    return pydantic_core.to_json(data, fallback=str).decode()
 
 
 def strip_noise(data: JSONType) -> JSONType:
@@ -92,6 +286,8 @@ async def call(
     func: Callable[..., Awaitable[Any]],
     *args: Any,
     response_handler: ResponseHandler | None = None,
+    rate_limiter: RateLimiter | None = None,
+    coalesce: bool = False,
     **kwargs: Any,
 ) -> JSONType:
     """Call a Schwab client endpoint and return its JSON payload.
@@ -99,8 +295,21 @@ async def call(
     When ``response_handler`` is provided, it can opt to handle the response
     by returning ``(True, payload)``. Returning ``(False, _)`` delegates back to
     the default JSON parsing behavior.
+
+    Pass the server context's ``rate_limiter`` to pace the request so
+    concurrent tool fan-out stays under Schwab's per-minute request ceiling.
+    Order placement and cancellation omit it: Schwab meters
+    orders separately, and they should not queue behind bulk market data.
+
+    Pass ``coalesce=True`` for idempotent reads: concurrent calls with the
+    same endpoint and arguments then share one HTTP request. Each caller
+    still parses its own copy of the JSON body, so callers may mutate the
+    result freely. Never set it for order placement or other writes.
     """
-    response = await func(*args, **kwargs)
+    if coalesce:
+        response = await _send_coalesced(func, args, kwargs, rate_limiter)
+    else:
+        response = await _send(func, args, kwargs, rate_limiter)
     try:
         response.raise_for_status()
     except Exception as exc:
@@ -118,28 +327,65 @@ async def call(
     # Handle responses with no content
     # 204 No Content: explicit no-content response
     # 201 Created: order placement endpoints return empty body with Location header
-    status_code = getattr(response, "status_code", None)
-    if status_code in (201, 204):
+    # Not every response is an httpx.Response; tolerate a missing status_code.
+    if getattr(response, "status_code", None) in _NO_CONTENT_STATUSES:
         return None
 
     # Check if response has content before trying to parse JSON
     # Some endpoints (like place_order) return empty bodies even with 2xx status
     content = getattr(response, "content", b"")
-    if not content or len(content) == 0:
+    if not content:
         return None
 
     try:
+        if _json_loads is not None and isinstance(response, httpx.Response):
+            return _json_loads(content)
         return response.json()
     except ValueError as exc:
         raise ValueError("Expected JSON response from Schwab endpoint") from exc
 
 
+async def gather_keyed(
+    keys: Sequence[_KeyT],
+    fn: Callable[[_KeyT], Awaitable[JSONType]],
+    *,
+    chunk_size: int | None = None,
+) -> dict[_KeyT, JSONType]:
+    """Await ``fn(key)`` for every key concurrently and map each key to its result.
+
+    A key whose call raised maps to ``{"error": message}`` so one failure does
+    not sink the batch; non-``Exception`` errors such as cancellation still
+    propagate. With ``chunk_size``, at most that many calls are in flight at
+    once, so a large batch does not queue every request on the rate limiter
+    up front.
+    """
+    payload: dict[_KeyT, JSONType] = {}
+    step = chunk_size or max(len(keys), 1)
+    for offset in range(0, len(keys), step):
+        chunk = keys[offset : offset + step]
+        results = await asyncio.gather(*(fn(key) for key in chunk), return_exceptions=True)
+        for key, result in zip(chunk, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                payload[key] = {"error": str(result)}
+            else:
+                payload[key] = result
+    return payload
+
+
 __all__ = [
     "call",
+    "encode_json",
+    "enum_member",
+    "gather_keyed",
     "JSONType",
+    "RateLimiter",
     "SchwabAPIError",
     "ResponseHandler",
     "parse_date",
     "parse_datetime",
+    "parse_list",
+    "parse_symbols",
     "strip_noise",
 ]
@@ -4,6 +4,7 @@ from enum import Enum
 from types import SimpleNamespace
 from typing import Any
 
+import pytest
 from conftest import make_ctx, run
 
 from schwab_mcp.tools import account
@@ -222,6 +223,72 @@ class TestGetIdentityMap:
         assert result == {}
 
 
+class TestAccountNumbersCache:
+    def _fake_call(self, calls: list[str]):
+        async def fake_call(func, *args, **kwargs):
+            calls.append(func.__name__)
+            if func.__name__ == "get_account_numbers":
+                return [{"accountNumber": "123", "hashValue": "hash_abc"}]
+            return {"accounts": []}
+
+        return fake_call
+
+    def test_account_numbers_reused_across_calls(self, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(account, "call", self._fake_call(calls))
+        ctx = make_ctx(DummyAccountClient())
+
+        first = run(account._get_identity_map(ctx))
+        second = run(account._get_identity_map(ctx))
+
+        assert first == second
+        assert calls.count("get_account_numbers") == 1
+        assert calls.count("get_user_preferences") == 2
+
+    def test_account_numbers_refetched_after_ttl(self, monkeypatch):
+        calls: list[str] = []
+        now = {"value": 1000.0}
+        monkeypatch.setattr(account, "call", self._fake_call(calls))
+        monkeypatch.setattr(account.time, "monotonic", lambda: now["value"])
+        ctx = make_ctx(DummyAccountClient())
+
+        run(account._get_identity_map(ctx))
+        now["value"] += account._ACCOUNT_NUMBERS_TTL + 1
+        run(account._get_identity_map(ctx))
+
+        assert calls.count("get_account_numbers") == 2
+
+    def test_invalidate_forces_refetch(self, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(account, "call", self._fake_call(calls))
+        ctx = make_ctx(DummyAccountClient())
+
+        run(account._get_identity_map(ctx))
+        account.invalidate_account_numbers(ctx)
+        run(account._get_identity_map(ctx))
+
+        assert calls.count("get_account_numbers") == 2
+
+    def test_get_account_error_invalidates_cache(self, monkeypatch):
+        from schwab_mcp.tools.utils import SchwabAPIError
+
+        calls: list[str] = []
+        fake_call = self._fake_call(calls)
+
+        async def failing_call(func, *args, **kwargs):
+            if func.__name__ == "get_account":
+                raise SchwabAPIError(status_code=404, url="https://example.com", body="")
+            return await fake_call(func, *args, **kwargs)
+
+        monkeypatch.setattr(account, "call", failing_call)
+        ctx = make_ctx(DummyAccountClient())
+
+        with pytest.raises(SchwabAPIError):
+            run(account.get_account(ctx, "stale_hash"))
+
+        assert ctx.schwab.account_numbers is None
+
+
 # ---------------------------------------------------------------------------
 # Tests for _enrich_with_identity
 # ---------------------------------------------------------------------------
@@ -319,6 +386,26 @@ class TestGetAccounts:
         assert isinstance(result, list)
         assert captured["func"].__name__ == "get_accounts"
 
+    def test_fetches_identity_and_accounts_concurrently(self, monkeypatch):
+        import asyncio
+
+        in_flight: set[str] = set()
+        overlapped: list[bool] = []
+
+        async def fake_call(func, *args, **kwargs):
+            in_flight.add(func.__name__)
+            await asyncio.sleep(0)
+            overlapped.append(len(in_flight) > 1)
+            await asyncio.sleep(0)
+            in_flight.discard(func.__name__)
+            return [] if func.__name__ != "get_user_preferences" else {}
+
+        monkeypatch.setattr(account, "call", fake_call)
+
+        run(account.get_accounts(make_ctx(DummyAccountClient())))
+
+        assert overlapped and all(overlapped)
+
     def test_compact_default_strips_extra_fields(self, monkeypatch, fake_call_factory):
         _, fake_call = fake_call_factory(return_value=_RAW_LIST_PAYLOAD)
         self._patch_identity(monkeypatch)
@@ -407,7 +494,7 @@ class TestGetAccounts:
 
         assert isinstance(result, list)
         assert captured["func"].__name__ == "get_accounts"
-        assert captured["kwargs"]["fields"] == [client.Account.Fields.POSITIONS]
+        assert captured["kwargs"]["fields"] == (client.Account.Fields.POSITIONS,)
 
     def test_include_positions_compact_default_prunes_positions(self, monkeypatch, fake_call_factory):
         _, fake_call = fake_call_factory(return_value=_RAW_LIST_WITH_POSITIONS)
@@ -568,7 +655,7 @@ class TestGetAccount:
         assert isinstance(result, dict)
         assert captured["func"].__name__ == "get_account"
         assert captured["args"] == ("hash789",)
-        assert captured["kwargs"]["fields"] == [client.Account.Fields.POSITIONS]
+        assert captured["kwargs"]["fields"] == (client.Account.Fields.POSITIONS,)
 
     def test_include_positions_compact_default_prunes_positions(self, monkeypatch, fake_call_factory):
         _, fake_call = fake_call_factory(return_value=_RAW_DICT_WITH_POSITIONS)
@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 from collections.abc import Awaitable
 from contextlib import suppress
 from types import SimpleNamespace
@@ -152,6 +153,26 @@ def test_write_tool_accepts_base_context() -> None:
     assert session.messages == []
 
 
+def test_write_tool_keyword_call_skips_signature_bind(monkeypatch) -> None:
+    """Keyword-only calls (as FastMCP makes them) skip the signature bind."""
+    _, approval_manager, _, request_context = make_ctx(ApprovalDecision.APPROVED)
+    base_ctx = MCPContext.model_construct(
+        _request_context=cast(Any, request_context),
+        _fastmcp=None,
+    )
+    tool = wrapped_tool()
+
+    def fail_bind(*_: Any, **__: Any) -> Any:
+        raise AssertionError("bind_partial should not run for keyword calls")
+
+    monkeypatch.setattr(inspect.Signature, "bind_partial", fail_bind)
+
+    result = await_result(tool(ctx=base_ctx, symbol="spy"))
+
+    assert result == "SPY"
+    assert approval_manager.requests[0].arguments == {"symbol": "'spy'"}
+
+
 def test_progress_notifications_emitted_when_supported() -> None:
     ctx, approval_manager, session, _ = make_ctx(ApprovalDecision.APPROVED, progress_token="token-1")
     tool = wrapped_tool()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import schwab_mcp.cache as cache_module
+from schwab_mcp.cache import MISSING, ResponseCache
+
+
+def test_get_returns_stored_value():
+    cache = ResponseCache()
+    cache.put(("quote", "SPY"), {"last": 1.0}, ttl=60.0)
+    assert cache.get(("quote", "SPY")) == {"last": 1.0}
+
+
+def test_get_unknown_key_returns_missing():
+    assert ResponseCache().get("nope") is MISSING
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    now = {"value": 0.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["value"])
+    cache = ResponseCache()
+    cache.put("key", None, ttl=10.0)
+
+    now["value"] = 9.0
+    assert cache.get("key") is None
+
+    now["value"] = 10.0
+    assert cache.get("key") is MISSING
+    assert len(cache) == 0
+
+
+def test_oldest_entry_is_evicted_when_full():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", 1, ttl=60.0)
+    cache.put("b", 2, ttl=60.0)
+    cache.put("c", 3, ttl=60.0)
+
+    assert cache.get("a") is MISSING
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_clear_removes_everything():
+    cache = ResponseCache()
+    cache.put("a", 1, ttl=60.0)
+    cache.clear()
+    assert len(cache) == 0
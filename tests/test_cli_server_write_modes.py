@@ -77,7 +77,7 @@ def _patch_common(monkeypatch, captured: dict[str, Any]) -> None:
     monkeypatch.setattr(
         cli.anyio,
         "run",
-        lambda func, backend="asyncio": captured.setdefault("anyio_backend", backend),
+        lambda func, backend="asyncio", backend_options=None: captured.setdefault("anyio_backend", backend),
     )
 
 
@@ -463,7 +463,7 @@ def test_server_exits_when_server_run_raises(monkeypatch):
 
     monkeypatch.setattr(cli.schwab_auth, "easy_client", fake_easy_client)
 
-    def fake_run(func, backend="asyncio"):
+    def fake_run(func, backend="asyncio", backend_options=None):
         raise RuntimeError("server exploded during run")
 
     monkeypatch.setattr(cli.anyio, "run", fake_run)
@@ -476,3 +476,24 @@ def test_server_exits_when_server_run_raises(monkeypatch):
 
     assert result.exit_code == 1
     assert "server exploded during run" in result.output
+
+
+def test_asyncio_backend_options_enable_uvloop_when_installed(monkeypatch):
+    monkeypatch.setattr(cli.sys, "platform", "linux")
+    monkeypatch.setattr(cli.importlib.util, "find_spec", lambda name: object())
+
+    assert cli._asyncio_backend_options() == {"use_uvloop": True}
+
+
+def test_asyncio_backend_options_default_loop_without_uvloop(monkeypatch):
+    monkeypatch.setattr(cli.sys, "platform", "linux")
+    monkeypatch.setattr(cli.importlib.util, "find_spec", lambda name: None)
+
+    assert cli._asyncio_backend_options() == {}
+
+
+def test_asyncio_backend_options_skip_uvloop_on_windows(monkeypatch):
+    monkeypatch.setattr(cli.sys, "platform", "win32")
+    monkeypatch.setattr(cli.importlib.util, "find_spec", lambda name: object())
+
+    assert cli._asyncio_backend_options() == {}
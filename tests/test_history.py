@@ -2,6 +2,7 @@ import datetime
 from enum import Enum
 from types import SimpleNamespace
 
+import pytest
 from conftest import make_ctx, run
 
 from schwab_mcp.tools import history
@@ -100,3 +101,156 @@ def test_get_advanced_price_history_intraday(monkeypatch, fake_call_factory):
         )
         assert captured["kwargs"]["frequency_type"] is client.PriceHistory.FrequencyType.MINUTE
         assert captured["kwargs"]["frequency"] == freq
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"start_datetime": "not-a-date"}, "Invalid start_datetime"),
+        ({"end_datetime": "2024-13-01T00:00:00"}, "Invalid end_datetime"),
+        (
+            {"start_datetime": "2024-02-01T00:00:00", "end_datetime": "2024-01-01T00:00:00"},
+            "must not be after end_datetime",
+        ),
+        ({"end_datetime": "2999-01-01T00:00:00"}, "more than one day in the future"),
+    ],
+)
+def test_get_advanced_price_history_rejects_bad_datetimes_before_call(monkeypatch, kwargs, message):
+    calls: list[object] = []
+
+    async def fake_call(func, *args, **kw):
+        calls.append(func)
+        return "ok"
+
+    monkeypatch.setattr(history, "call", fake_call)
+
+    ctx = make_ctx(DummyHistoryClient())
+    with pytest.raises(ValueError, match=message):
+        run(history.get_advanced_price_history(ctx, "SPY", **kwargs))
+
+    assert calls == []
+
+
+def test_get_advanced_price_history_allows_mixed_timezone_awareness(monkeypatch, fake_call_factory):
+    captured, fake_call = fake_call_factory()
+    monkeypatch.setattr(history, "call", fake_call)
+
+    ctx = make_ctx(DummyHistoryClient())
+    run(
+        history.get_advanced_price_history(
+            ctx,
+            "SPY",
+            start_datetime="2024-01-01T09:30:00",
+            end_datetime="2024-01-01T16:00:00+00:00",
+        )
+    )
+
+    assert captured["kwargs"]["end_datetime"] == datetime.datetime(2024, 1, 1, 16, 0, tzinfo=datetime.timezone.utc)
+
+
+def _counting_call(payload):
+    calls: list[dict] = []
+
+    async def fake_call(func, *args, **kwargs):
+        calls.append(kwargs)
+        return payload
+
+    return calls, fake_call
+
+
+def test_get_advanced_price_history_caches_closed_daily_bars(monkeypatch):
+    calls, fake_call = _counting_call({"candles": [1]})
+    monkeypatch.setattr(history, "call", fake_call)
+    ctx = make_ctx(DummyHistoryClient())
+
+    for _ in range(2):
+        result = run(
+            history.get_advanced_price_history(
+                ctx,
+                "SPY",
+                period_type="month",
+                frequency_type="daily",
+                start_datetime="2024-01-01T00:00:00",
+                end_datetime="2024-01-31T00:00:00",
+            )
+        )
+        assert result == {"candles": [1]}
+
+    assert len(calls) == 1
+
+
+def test_get_advanced_price_history_does_not_cache_intraday(monkeypatch):
+    calls, fake_call = _counting_call({"candles": []})
+    monkeypatch.setattr(history, "call", fake_call)
+    ctx = make_ctx(DummyHistoryClient())
+
+    for _ in range(2):
+        run(history.get_advanced_price_history(ctx, "SPY", period_type="day", frequency_type="minute"))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    ("period_type", "frequency_type", "end_dt", "expected"),
+    [
+        (None, None, None, None),
+        ("DAY", None, None, None),
+        ("year", None, None, history._OPEN_BARS_TTL),
+        ("month", "DAILY", datetime.datetime(2020, 1, 1), history._CLOSED_BARS_TTL),
+        ("month", "weekly", datetime.datetime.now() + datetime.timedelta(hours=1), history._OPEN_BARS_TTL),
+    ],
+)
+def test_history_cache_ttl(period_type, frequency_type, end_dt, expected):
+    assert history._history_cache_ttl(period_type, frequency_type, end_dt) == expected
+
+
+def test_get_price_history_batch_fans_out_per_symbol(monkeypatch):
+    calls: list[tuple] = []
+
+    async def fake_call(func, symbol, **kwargs):
+        calls.append((symbol, kwargs))
+        if symbol == "BAD":
+            raise ValueError("boom")
+        return {"symbol": symbol}
+
+    monkeypatch.setattr(history, "call", fake_call)
+    client = DummyHistoryClient()
+    ctx = make_ctx(client)
+
+    result = run(
+        history.get_price_history_batch(
+            ctx,
+            ["SPY", "BAD", "SPY", "QQQ"],
+            period_type="day",
+            frequency_type="minute",
+            start_datetime="2024-01-01T09:30:00",
+        )
+    )
+
+    assert result == {"SPY": {"symbol": "SPY"}, "BAD": {"error": "boom"}, "QQQ": {"symbol": "QQQ"}}
+    assert [symbol for symbol, _ in calls] == ["SPY", "BAD", "QQQ"]
+    for _, kwargs in calls:
+        assert kwargs["period_type"] is client.PriceHistory.PeriodType.DAY
+        assert kwargs["start_datetime"] == datetime.datetime(2024, 1, 1, 9, 30)
+
+
+def test_get_price_history_batch_requires_symbols():
+    with pytest.raises(ValueError, match="at least one symbol"):
+        run(history.get_price_history_batch(make_ctx(DummyHistoryClient()), []))
+    with pytest.raises(ValueError, match="at least one symbol"):
+        run(history.get_price_history_batch(make_ctx(DummyHistoryClient()), " , "))
+
+
+def test_get_price_history_batch_normalizes_symbols(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_call(func, symbol, **kwargs):
+        calls.append(symbol)
+        return {"symbol": symbol}
+
+    monkeypatch.setattr(history, "call", fake_call)
+
+    result = run(history.get_price_history_batch(make_ctx(DummyHistoryClient()), "spy, QQQ,,SPY"))
+
+    assert list(result) == ["SPY", "QQQ"]
+    assert calls == ["SPY", "QQQ"]
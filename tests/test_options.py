@@ -2,6 +2,7 @@ import datetime
 from enum import Enum
 from typing import Any
 
+import pytest
 from conftest import make_ctx, run
 
 from schwab_mcp.tools import options
@@ -213,3 +214,155 @@ def test_prune_option_chain_malformed_exp_map_no_raise():
     # Should not raise, return payload unchanged for bad shapes
     result = options._prune_option_chain(payload)
     assert result is payload
+
+
+def test_get_option_expiration_chain_is_cached(monkeypatch):
+    calls: list[tuple] = []
+
+    async def fake_call(func, *args, **kwargs):
+        calls.append(args)
+        return {"expirationList": []}
+
+    monkeypatch.setattr(options, "call", fake_call)
+    ctx = make_ctx(DummyOptionsClient())
+
+    assert run(options.get_option_expiration_chain(ctx, "SPY")) == {"expirationList": []}
+    assert run(options.get_option_expiration_chain(ctx, "SPY")) == {"expirationList": []}
+    run(options.get_option_expiration_chain(ctx, "QQQ"))
+
+    assert calls == [("SPY",), ("QQQ",)]
+
+
+def test_get_option_chain_rejects_unknown_contract_type(monkeypatch, fake_call_factory):
+    captured, fake_call = fake_call_factory()
+    monkeypatch.setattr(options, "call", fake_call)
+
+    with pytest.raises(ValueError, match="Invalid ContractType: 'straddle'. Must be one of: CALL, PUT, ALL"):
+        run(options.get_option_chain(make_ctx(DummyOptionsClient()), "SPY", contract_type="straddle"))
+
+    assert captured == {}
+
+
+def test_prune_contract_keeps_canonical_field_order():
+    contract = dict(reversed(list(_SAMPLE_CONTRACT.items())))
+
+    pruned = options._prune_contract(contract)
+
+    assert list(pruned) == [k for k in options._COMPACT_CONTRACT_FIELD_ORDER if k in contract]
+
+
+def test_default_expiration_window_starts_today(monkeypatch):
+    class FixedDate(datetime.date):
+        @classmethod
+        def today(cls):
+            return cls(2025, 6, 2)
+
+    monkeypatch.setattr(options.datetime, "date", FixedDate)
+
+    assert options._normalize_expiration_window(None, None) == (FixedDate(2025, 6, 2), FixedDate(2025, 8, 1))
+
+
+def test_get_option_chain_omits_unset_parameters(monkeypatch, fake_call_factory):
+    captured, fake_call = fake_call_factory()
+    monkeypatch.setattr(options, "call", fake_call)
+
+    ctx = make_ctx(DummyOptionsClient())
+    run(options.get_advanced_option_chain(ctx, "SPY", strategy="", from_date="2024-05-01"))
+
+    assert set(captured["kwargs"]) == {"strike_count", "from_date", "to_date", "rate_limiter", "coalesce"}
+
+
+def test_expiration_window_date_inputs_skip_parsing(monkeypatch):
+    def fail_parse(value):
+        raise AssertionError("parse_date should not run for date inputs")
+
+    monkeypatch.setattr(options, "parse_date", fail_parse)
+    start = datetime.date(2024, 5, 1)
+
+    assert options._expiration_window(start, datetime.date(2024, 6, 1)) == (start, datetime.date(2024, 6, 1))
+    assert options._expiration_window(start, datetime.date(2024, 4, 1)) == (start, start)
+
+
+@pytest.mark.parametrize("malformed", [3, "abc", ["strike", 420.0]], ids=["int", "str", "list"])
+def test_prune_option_chain_passes_non_dict_contracts_through(malformed):
+    payload = {"callExpDateMap": {"2024-06-21:30": {"420.0": [dict(_SAMPLE_CONTRACT), malformed]}}}
+
+    options._prune_option_chain(payload)
+
+    pruned, untouched = payload["callExpDateMap"]["2024-06-21:30"]["420.0"]
+    assert pruned == options._prune_contract(_SAMPLE_CONTRACT)
+    assert untouched == malformed
+
+
+def test_get_option_chain_batch_fans_out_per_symbol(monkeypatch):
+    calls: list[tuple] = []
+
+    async def fake_call(func, symbol, **kwargs):
+        calls.append((symbol, kwargs))
+        if symbol == "BAD":
+            raise ValueError("boom")
+        return {"symbol": symbol}
+
+    monkeypatch.setattr(options, "call", fake_call)
+    client = DummyOptionsClient()
+
+    result = run(
+        options.get_option_chain_batch(
+            make_ctx(client),
+            ["SPY", "BAD", "SPY", "QQQ"],
+            contract_type="call",
+            from_date="2024-05-01",
+        )
+    )
+
+    assert result == {"SPY": {"symbol": "SPY"}, "BAD": {"error": "boom"}, "QQQ": {"symbol": "QQQ"}}
+    assert [symbol for symbol, _ in calls] == ["SPY", "BAD", "QQQ"]
+    for _, kwargs in calls:
+        assert kwargs["contract_type"] is client.Options.ContractType.CALL
+        assert kwargs["from_date"] == datetime.date(2024, 5, 1)
+        assert kwargs["to_date"] == datetime.date(2024, 6, 30)
+
+
+def test_get_option_chain_batch_normalizes_symbols(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_call(func, symbol, **kwargs):
+        calls.append(symbol)
+        return {"symbol": symbol}
+
+    monkeypatch.setattr(options, "call", fake_call)
+
+    result = run(options.get_option_chain_batch(make_ctx(DummyOptionsClient()), "spy, QQQ,,SPY", verbose=True))
+
+    assert list(result) == ["SPY", "QQQ"]
+    assert calls == ["SPY", "QQQ"]
+
+
+def test_get_option_chain_batch_rejects_bad_filters_before_fetching(monkeypatch):
+    async def fail_call(*args, **kwargs):
+        raise AssertionError("no chain should be fetched")
+
+    monkeypatch.setattr(options, "call", fail_call)
+    ctx = make_ctx(DummyOptionsClient())
+
+    with pytest.raises(ValueError, match="at least one symbol"):
+        run(options.get_option_chain_batch(ctx, []))
+    with pytest.raises(ValueError, match="at least one symbol"):
+        run(options.get_option_chain_batch(ctx, " , "))
+    with pytest.raises(ValueError, match="Invalid ContractType"):
+        run(options.get_option_chain_batch(ctx, ["SPY"], contract_type="sideways"))
+
+
+@pytest.mark.parametrize(
+    ("from_date", "to_date", "expected"),
+    [
+        (None, None, (datetime.date(2025, 1, 10), datetime.date(2025, 3, 11))),
+        (datetime.date(2025, 2, 1), None, (datetime.date(2025, 2, 1), datetime.date(2025, 4, 2))),
+        (None, datetime.date(2025, 1, 20), (datetime.date(2025, 1, 10), datetime.date(2025, 1, 20))),
+        (None, datetime.date(2025, 1, 5), (datetime.date(2025, 1, 5), datetime.date(2025, 1, 5))),
+        (datetime.date(2025, 2, 1), datetime.date(2025, 1, 1), (datetime.date(2025, 2, 1), datetime.date(2025, 2, 1))),
+    ],
+)
+def test_normalize_expiration_window(from_date, to_date, expected):
+    today = datetime.date(2025, 1, 10)
+    assert options._normalize_expiration_window(from_date, to_date, today=today) == expected
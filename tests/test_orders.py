@@ -141,6 +141,22 @@ class TestGetOrders:
         order_ids = {order["orderId"] for order in result}
         assert order_ids == {"order_FILLED", "order_CANCELED"}
 
+    def test_rejects_unknown_status_before_any_request(self, monkeypatch):
+        async def fail_call(*args, **kwargs):
+            raise AssertionError("no request should be sent")
+
+        monkeypatch.setattr(orders, "call", fail_call)
+        ctx = make_ctx(DummyOrdersClient())
+
+        with pytest.raises(ValueError, match="Invalid Status: 'bogus'"):
+            run(orders.get_orders(ctx, "xyz789", status=["filled", "bogus"]))
+
+    def test_invalid_date_names_the_parameter(self):
+        ctx = make_ctx(DummyOrdersClient())
+
+        with pytest.raises(ValueError, match="Invalid to_date: '2024/01/31'. Must be YYYY-MM-DD"):
+            run(orders.get_orders(ctx, "xyz789", from_date="2024-01-01", to_date="2024/01/31"))
+
 
 class TestGetOrder:
     def test_calls_client_with_correct_args(self, monkeypatch):
@@ -787,6 +803,94 @@ class TestPlacePreviewedOrder:
         assert req.arguments["account_hash"] == account_hash
 
 
+class TestPlacePreviewedOrders:
+    """Tests for the batched place_previewed_orders tool."""
+
+    ACCOUNT = "acct_abc123"
+
+    def _put(self, ctx, symbol):
+        spec = {
+            "orderType": "MARKET",
+            "orderLegCollection": [{"instruction": "BUY", "quantity": 1, "instrument": {"symbol": symbol}}],
+        }
+        return ctx.previews.put(self.ACCOUNT, spec, "preview_equity_order", f"BUY 1 {symbol} MARKET")
+
+    def test_single_approval_places_each_order(self, monkeypatch):
+        from schwab_mcp.approvals import ApprovalDecision
+        from schwab_mcp.tools import orders as orders_mod
+
+        ctx = make_ctx(DummyPreviewClient())
+        ok_id = self._put(ctx, "AAPL")
+        bad_id = self._put(ctx, "MSFT")
+        requests: list = []
+
+        async def fake_run_approval(ctx, request):
+            requests.append(request)
+            return ApprovalDecision.APPROVED
+
+        async def fake_call(func, *args, **kwargs):
+            if func.__name__ == "get_order":
+                return {"orderId": 7, "status": "WORKING"}
+            symbol = kwargs["order_spec"]["orderLegCollection"][0]["instrument"]["symbol"]
+            if symbol == "MSFT":
+                raise SchwabAPIError(status_code=400, url="/orders", body="rejected")
+            return {"orderId": 7, "accountHash": self.ACCOUNT}
+
+        monkeypatch.setattr(orders_mod, "call", fake_call)
+        monkeypatch.setattr(orders_mod, "run_approval", fake_run_approval)
+
+        result = run(orders.place_previewed_orders(ctx, self.ACCOUNT, [ok_id, bad_id]))
+
+        assert len(requests) == 1
+        arguments = requests[0].arguments
+        assert requests[0].tool_name == "place_previewed_orders"
+        assert arguments["order_count"] == "2"
+        assert arguments[ok_id] == "BUY 1 AAPL MARKET (from preview_equity_order)"
+        assert isinstance(result, dict)
+        assert result[ok_id] == orders._prune_order({"orderId": 7, "status": "WORKING"})
+        assert "rejected" in result[bad_id]["error"]
+
+    def test_denied_raises_and_consumes_previews(self, monkeypatch):
+        from schwab_mcp.approvals import ApprovalDecision
+        from schwab_mcp.tools import orders as orders_mod
+
+        ctx = make_ctx(DummyPreviewClient())
+        preview_ids = [self._put(ctx, "AAPL"), self._put(ctx, "MSFT")]
+
+        async def fake_run_approval(ctx, request):
+            return ApprovalDecision.DENIED
+
+        monkeypatch.setattr(orders_mod, "run_approval", fake_run_approval)
+
+        with pytest.raises(PermissionError, match="denied"):
+            run(orders.place_previewed_orders(ctx, self.ACCOUNT, preview_ids))
+        with pytest.raises(ValueError, match="not found or expired"):
+            ctx.previews.pop(preview_ids[0], self.ACCOUNT)
+
+    def test_unknown_id_consumes_nothing(self, monkeypatch):
+        from schwab_mcp.tools import orders as orders_mod
+
+        ctx = make_ctx(DummyPreviewClient())
+        preview_id = self._put(ctx, "AAPL")
+
+        async def fake_run_approval(ctx, request):
+            raise AssertionError("run_approval must not be called")
+
+        monkeypatch.setattr(orders_mod, "run_approval", fake_run_approval)
+
+        with pytest.raises(ValueError, match="not found or expired"):
+            run(orders.place_previewed_orders(ctx, self.ACCOUNT, [preview_id, "deadbeef"]))
+        assert ctx.previews.pop(preview_id, self.ACCOUNT).summary == "BUY 1 AAPL MARKET"
+
+    @pytest.mark.parametrize("count", [0, orders._MAX_PLACE_BATCH + 1])
+    def test_rejects_empty_or_oversized_batch(self, count):
+        ctx = make_ctx(DummyPreviewClient())
+        preview_ids = [self._put(ctx, f"S{i}") for i in range(count)]
+
+        with pytest.raises(ValueError):
+            run(orders.place_previewed_orders(ctx, self.ACCOUNT, preview_ids))
+
+
 # ---------------------------------------------------------------------------
 # Additional _prepare_* validation coverage (regression net post-Phase 3)
 # The old place_* tests covered these paths; now tested via _prepare_* directly.
@@ -807,6 +911,20 @@ class TestPrepareEquityOrderValidation:
         assert spec["session"] == "AM"
         assert spec["duration"] == "GOOD_TILL_CANCEL"
 
+    def test_default_session_and_duration_kept_without_setters(self, monkeypatch):
+        from schwab.orders.generic import OrderBuilder
+
+        def fail(*_: Any, **__: Any) -> Any:
+            raise AssertionError("default settings should not be re-applied")
+
+        spec_builder = orders._build_equity_order_spec("AAPL", 50, "BUY", "MARKET")
+        monkeypatch.setattr(OrderBuilder, "set_session", fail)
+        monkeypatch.setattr(OrderBuilder, "set_duration", fail)
+
+        spec = orders._finalize(spec_builder, "NORMAL", "DAY")
+        assert spec["session"] == "NORMAL"
+        assert spec["duration"] == "DAY"
+
     def test_limit_order_correct_spec(self):
         spec = orders._prepare_equity_order("SPY", 100, "buy", "limit", price=150.0)
         assert spec["orderType"] == "LIMIT"
@@ -1046,6 +1164,8 @@ class TestPrepareOptionComboOrderValidation:
         assert spec["orderStrategyType"] == "SINGLE"
         assert spec["orderType"] == "NET_DEBIT"
         assert len(spec["orderLegCollection"]) == 2
+        assert spec["session"] == "NORMAL"
+        assert spec["duration"] == "DAY"
 
 
 class TestBuildOrderFromDesc:
@@ -60,6 +60,28 @@ def test_pop_wrong_account_raises_and_does_not_remove():
     assert entry.account_hash == ACCOUNT
 
 
+def test_pop_many_returns_entries_in_order():
+    store = PreviewStore()
+    first = store.put(ACCOUNT, SPEC, TOOL, "first")
+    second = store.put(ACCOUNT, SPEC, TOOL, "second")
+    entries = store.pop_many([second, first], ACCOUNT)
+    assert [entry.summary for entry in entries] == ["second", "first"]
+    with pytest.raises(ValueError, match="not found or expired"):
+        store.pop(first, ACCOUNT)
+
+
+@pytest.mark.parametrize("bad", ["unknown", "repeat"])
+def test_pop_many_is_all_or_nothing(bad):
+    store = PreviewStore()
+    preview_id = store.put(ACCOUNT, SPEC, TOOL, SUMMARY)
+    other = "f" * 16 if bad == "unknown" else preview_id
+
+    with pytest.raises(ValueError):
+        store.pop_many([preview_id, other], ACCOUNT)
+
+    assert store.pop(preview_id, ACCOUNT).summary == SUMMARY
+
+
 def test_pop_expired_raises(monkeypatch):
     store = PreviewStore(ttl=10.0)
     t = 1000.0
@@ -1,5 +1,6 @@
 from enum import Enum
 
+import pytest
 from conftest import make_ctx, run
 
 from schwab_mcp.tools import quotes
@@ -74,6 +75,14 @@ _SAMPLE_RAW_QUOTE_ENTRY = {
 _SAMPLE_PAYLOAD = {"AAPL": _SAMPLE_RAW_QUOTE_ENTRY}
 
 
+def test_get_quotes_rejects_unknown_field(monkeypatch, fake_call_factory):
+    _, fake_call = fake_call_factory()
+    monkeypatch.setattr(quotes, "call", fake_call)
+
+    with pytest.raises(ValueError, match="Invalid Fields: 'greeks'. Must be one of: QUOTE"):
+        run(quotes.get_quotes(make_ctx(DummyQuotesClient()), "AAPL", fields="quote, greeks"))
+
+
 def test_prune_quotes_compact_default(monkeypatch, fake_call_factory):
     _, fake_call = fake_call_factory(return_value=_SAMPLE_PAYLOAD)
     monkeypatch.setattr(quotes, "call", fake_call)
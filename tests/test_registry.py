@@ -60,6 +60,16 @@ def test_register_tool_sets_write_annotations() -> None:
     assert tool.description == (_dummy_tool.__doc__ or "")
 
 
+def test_register_tool_rejects_duplicate_names() -> None:
+    server = FastMCP(name="dupes")
+    register_tool(server, _dummy_tool)
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_tool(server, _dummy_tool, write=True)
+
+    assert len(_registered_tools(server)) == 1
+
+
 def test_register_tools_always_registers_write_tools(monkeypatch) -> None:
     async def read_tool(ctx: SchwabContext) -> str:  # noqa: ARG001
         """read tool"""
@@ -283,6 +293,34 @@ def test_ensure_schwab_context_converts_mcp_context() -> None:
     assert isinstance(received[0], SchwabContext)
 
 
+def test_ensure_schwab_context_converts_keyword_context_without_binding(monkeypatch) -> None:
+    """Keyword-only calls (as FastMCP makes them) skip the signature bind."""
+    request_context = _make_request_context()
+    received: list[Any] = []
+
+    async def tool(ctx: SchwabContext, symbol: str) -> str:
+        received.append((ctx, symbol))
+        return "ok"
+
+    wrapped = _registration._ensure_schwab_context(tool)
+
+    def fail_bind(*_: Any, **__: Any) -> Any:
+        raise AssertionError("bind_partial should not run for keyword calls")
+
+    monkeypatch.setattr(inspect.Signature, "bind_partial", fail_bind)
+    base_ctx = MCPContext.model_construct(
+        _request_context=cast(Any, request_context),
+        _fastmcp=None,
+    )
+
+    async def runner() -> str:
+        return await wrapped(ctx=base_ctx, symbol="SPY")
+
+    assert asyncio.run(runner()) == "ok"
+    assert isinstance(received[0][0], SchwabContext)
+    assert received[0][1] == "SPY"
+
+
 def test_ensure_schwab_context_rejects_invalid_type() -> None:
     """A non-context argument raises TypeError."""
 
@@ -5,12 +5,17 @@ import logging
 import sys
 from typing import Any, cast
 
+import httpx
+import mcp.types as types
 import pytest
 from schwab.client import AsyncClient
 
+from schwab_mcp import server as server_module
 from schwab_mcp.approvals import ApprovalDecision, ApprovalManager, ApprovalRequest
 from schwab_mcp.context import SchwabServerContext
 from schwab_mcp.server import SchwabMCPServer, send_error_response
+from schwab_mcp.tools._registration import register_tool
+from schwab_mcp.tools.utils import JSONType, RateLimiter
 
 
 class DummyApprovalManager(ApprovalManager):
@@ -56,6 +61,7 @@ def test_server_configures_client_lifespan() -> None:
         async with lifespan_factory(server._server) as context:
             assert isinstance(context, SchwabServerContext)
             assert context.client is client
+            assert isinstance(context.rate_limiter, RateLimiter)
             assert dummy_client.closed is False
             assert approval_manager.started is True
 
@@ -65,6 +71,54 @@ def test_server_configures_client_lifespan() -> None:
     assert approval_manager.stopped is True
 
 
+class SessionAsyncClient(DummyAsyncClient):
+    def __init__(self, session: httpx.AsyncClient) -> None:
+        super().__init__()
+        self.session = session
+
+
+def test_lifespan_swaps_session_transport_for_tuned_pool(monkeypatch) -> None:
+    tuned = httpx.AsyncHTTPTransport()
+    monkeypatch.setattr(server_module, "_http_transport", lambda: tuned)
+
+    session = httpx.AsyncClient()
+    original = session._transport
+    server = SchwabMCPServer(
+        "schwab-mcp",
+        cast(AsyncClient, SessionAsyncClient(session)),
+        approval_manager=DummyApprovalManager(),
+        allow_write=False,
+    )
+
+    lifespan_factory = server._server.settings.lifespan
+    assert callable(lifespan_factory)
+
+    async def runner() -> None:
+        async with lifespan_factory(server._server):
+            assert session._transport is tuned
+            assert session._transport is not original
+
+    asyncio.run(runner())
+
+
+def test_tune_connection_pool_logs_when_transport_is_not_exposed(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(server_module, "_http_transport", lambda: pytest.fail("transport should not be built"))
+    session = httpx.AsyncClient()
+    del session._transport
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(server_module._tune_connection_pool(cast(AsyncClient, SessionAsyncClient(session))))
+
+    assert "keeping the default connection pool" in caplog.text
+
+
+def test_http_transport_uses_tuned_limits() -> None:
+    transport = server_module._http_transport()
+    assert transport._pool._max_connections == 64
+    assert transport._pool._max_keepalive_connections == 32
+    assert transport._pool._keepalive_expiry == 30.0
+
+
 def test_server_logs_errors_when_closing_client(caplog) -> None:
     class FailingClient:
         def __init__(self) -> None:
@@ -200,9 +254,43 @@ def test_json_strip_transform_returns_string_payload_unchanged(monkeypatch) -> N
     transform = captured_transform["fn"]
     assert transform is not None
     assert transform("already a string") == "already a string"
-    # Non-string payload is passed through strip_noise and returned as-is (dict)
-    result = transform({"key": "value"})
-    assert isinstance(result, dict)
+    # Non-string payload is stripped and returned as a finished tool result
+    result = transform({"key": "value", "empty": None})
+    assert isinstance(result, types.CallToolResult)
+    assert result.structuredContent == {"result": {"key": "value"}}
+    assert [block.text for block in result.content if isinstance(block, types.TextContent)] == ['{"key":"value"}']
+
+
+@pytest.mark.anyio
+async def test_json_mode_tool_result_skips_fastmcp_reencoding(monkeypatch) -> None:
+    """A JSON-mode tool call yields the transform's finished CallToolResult."""
+    captured_transform: dict[str, Any] = {}
+
+    def capturing_register(mcp_server, client, *, result_transform, **kwargs):
+        captured_transform["fn"] = result_transform
+
+    monkeypatch.setattr(server_module, "register_tools", capturing_register)
+    monkeypatch.setattr(server_module, "register_resources", lambda *a, **kw: None)
+
+    server = SchwabMCPServer(
+        "schwab-mcp",
+        cast(AsyncClient, DummyAsyncClient()),
+        approval_manager=DummyApprovalManager(),
+        allow_write=False,
+        use_json=True,
+    )
+
+    async def list_tool() -> JSONType:
+        return [{"symbol": "SPY", "note": ""}, {"symbol": "QQQ"}]
+
+    register_tool(server._server, list_tool, result_transform=captured_transform["fn"])
+    result = await server._server._tool_manager.call_tool("list_tool", {}, convert_result=True)
+
+    assert isinstance(result, types.CallToolResult)
+    assert result.structuredContent == {"result": [{"symbol": "SPY"}, {"symbol": "QQQ"}]}
+    assert len(result.content) == 1
+    text = cast(types.TextContent, result.content[0]).text
+    assert json.loads(text) == [{"symbol": "SPY"}, {"symbol": "QQQ"}]
 
 
 @pytest.mark.anyio
@@ -1,13 +1,20 @@
+import asyncio
 import math
+import os
+import subprocess
+import sys
 from types import SimpleNamespace
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 import pytest
-from conftest import run
+from conftest import make_ctx, run
 
+from schwab_mcp.cache import ResponseCache
 from schwab_mcp.context import SchwabContext
 from schwab_mcp.tools.technical import (
+    _kernels,
     base,
     momentum,
     moving_average,
@@ -27,6 +34,7 @@ def run_tool(coro) -> dict[str, Any]:
 def dummy_ctx() -> SchwabContext:
     ctx = SimpleNamespace()
     ctx.options = SimpleNamespace(get_option_chain=object())
+    ctx.schwab = SimpleNamespace(response_cache=ResponseCache(), rate_limiter=None)
     return cast(SchwabContext, ctx)
 
 
@@ -75,6 +83,16 @@ def ohlcv_data():
     return frame, metadata
 
 
+def _seeded_ema(series: pd.Series, length: int, seed: int | None = None) -> pd.Series:
+    # pandas-ta's EMA: seed with the SMA of the `length` values ending at
+    # `seed` (by default the first `length` values), then recurse.
+    seed = length - 1 if seed is None else seed
+    seeded = series.astype(float)
+    seeded.iloc[seed] = series.iloc[seed - length + 1 : seed + 1].mean()
+    seeded.iloc[:seed] = float("nan")
+    return cast(pd.Series, seeded.ewm(span=length, adjust=False).mean())
+
+
 def test_moving_average_returns_sma_and_ema(monkeypatch, dummy_ctx, price_data):
     frame, metadata = price_data
 
@@ -84,18 +102,7 @@ def test_moving_average_returns_sma_and_ema(monkeypatch, dummy_ctx, price_data):
         assert kwargs["interval"] == "1d"
         return frame, metadata
 
-    def fake_sma(series, *, length):
-        return series.rolling(length, min_periods=1).mean()
-
-    def fake_ema(series, *, length):
-        return series.ewm(span=length, adjust=False).mean()
-
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        moving_average,
-        "pandas_ta",
-        SimpleNamespace(sma=fake_sma, ema=fake_ema),
-    )
 
     result = run_tool(moving_average.moving_average(dummy_ctx, "HOOD", length=3, points=2))
 
@@ -106,35 +113,49 @@ def test_moving_average_returns_sma_and_ema(monkeypatch, dummy_ctx, price_data):
 
     values = result["values"]
     assert len(values) == 2
-    expected_sma = frame["close"].rolling(3, min_periods=1).mean().tail(2).to_numpy()
-    expected_ema = frame["close"].ewm(span=3, adjust=False).mean().tail(2).to_numpy()
+    expected_sma = frame["close"].rolling(3).mean().tail(2).to_numpy()
+    expected_ema = _seeded_ema(frame["close"], 3).tail(2).to_numpy()
     for row, sma_value, ema_value in zip(values, expected_sma, expected_ema):
         assert row["timestamp"].endswith("+00:00")
         assert row["sma_3"] == pytest.approx(float(sma_value))
         assert row["ema_3"] == pytest.approx(float(ema_value))
 
 
+@pytest.mark.parametrize("length", [1, 3, 6, 7])
+def test_sma_kernel_matches_pandas_rolling_mean(length):
+    close = pd.Series([10.0, 11.5, float("nan"), 13.0, 12.25, 15.0])
+    expected = np.asarray(close.rolling(length).mean())
+    np.testing.assert_allclose(_kernels.sma(close.to_numpy(), length), expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("length", [1, 3, 5, 6, 7])
+def test_ema_kernel_matches_sma_seeded_ewm(length):
+    close = pd.Series([float("nan"), 10.0, 11.5, float("nan"), 13.0, 12.25, 15.0])
+    valid = close.iloc[1:]
+    expected = np.full(len(close), np.nan)
+    if length <= len(valid):
+        seeded = valid.copy()
+        seeded.iloc[length - 1] = valid.iloc[:length].mean()
+        seeded.iloc[: length - 1] = float("nan")
+        expected[1:] = seeded.ewm(span=length, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(_kernels.ema(close.to_numpy(), length), expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("length", [1, 3, 6, 7])
+def test_wma_kernel_matches_linearly_weighted_rolling_mean(length):
+    close = pd.Series([10.0, 11.5, float("nan"), 13.0, 12.25, 15.0])
+    weights = np.arange(1, length + 1)
+    expected = close.rolling(length).apply(lambda window: (window * weights).sum() / weights.sum(), raw=True)
+    np.testing.assert_allclose(_kernels.wma(close.to_numpy(), length), expected.to_numpy(), equal_nan=True)
+
+
 def test_moving_average_drops_rows_missing_either_series(monkeypatch, dummy_ctx, price_data):
     frame, metadata = price_data
 
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_sma(series, *, length):
-        # Real warmup behavior: no value until `length` periods have passed.
-        return series.rolling(length, min_periods=length).mean()
-
-    def fake_ema(series, *, length):
-        # EMA warms up immediately, unlike SMA above, so early rows would
-        # otherwise contain ema_{length} with no sma_{length}.
-        return series.ewm(span=length, adjust=False).mean()
-
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        moving_average,
-        "pandas_ta",
-        SimpleNamespace(sma=fake_sma, ema=fake_ema),
-    )
 
     result = run_tool(moving_average.moving_average(dummy_ctx, "HOOD", length=3, points=10))
 
@@ -152,51 +173,75 @@ def test_moving_average_defaults_to_default_points(monkeypatch, dummy_ctx, price
         assert kwargs["bars"] >= 0
         return frame, metadata
 
-    def fake_sma(series, *, length):
-        return series.rolling(length, min_periods=1).mean()
-
-    def fake_ema(series, *, length):
-        return series.ewm(span=length, adjust=False).mean()
-
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        moving_average,
-        "pandas_ta",
-        SimpleNamespace(sma=fake_sma, ema=fake_ema),
-    )
 
-    result = run_tool(moving_average.moving_average(dummy_ctx, "HOOD", length=5))
+    result = run_tool(moving_average.moving_average(dummy_ctx, "HOOD", length=2))
 
     values = result["values"]
     assert len(values) == base.DEFAULT_POINTS
-    last_ema = frame["close"].ewm(span=5, adjust=False).mean().iloc[-1]
-    assert values[-1]["ema_5"] == pytest.approx(float(last_ema))
+    last_ema = _seeded_ema(frame["close"], 2).iloc[-1]
+    assert values[-1]["ema_2"] == pytest.approx(float(last_ema))
+
+
+def _wilder_rsi(close: pd.Series, length: int) -> pd.Series:
+    # pandas-ta's RSI: gains and losses smoothed with an SMA-seeded RMA.
+    def rma(values: pd.Series) -> pd.Series:
+        seeded = values.copy()
+        seeded.iloc[length] = values.iloc[1 : length + 1].mean()
+        seeded.iloc[:length] = float("nan")
+        return cast(pd.Series, seeded.ewm(alpha=1 / length, adjust=False).mean())
+
+    delta = close.astype(float).diff()
+    gain = rma(delta.clip(lower=0))
+    loss = rma(-delta.clip(upper=0))
+    return 100 * gain / (gain + loss)
 
 
 def test_rsi_returns_expected_values(monkeypatch, dummy_ctx, price_data):
-    frame, metadata = price_data
+    _, metadata = price_data
+    index = pd.date_range("2024-01-01", periods=8, freq="D", tz="UTC")
+    close = pd.Series([10.0, 11.0, 10.5, 12.0, 11.0, 11.5, 13.0, 12.5], index=index)
+    frame = pd.DataFrame({"close": close})
 
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_rsi(series, *, length):
-        return pd.Series(
-            [40.0 + idx for idx in range(len(series))],
-            index=series.index,
-        )
-
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        momentum,
-        "pandas_ta",
-        SimpleNamespace(rsi=fake_rsi),
-    )
 
-    result = run_tool(momentum.rsi(dummy_ctx, "HOOD", length=5, points=3))
+    result = run_tool(momentum.rsi(dummy_ctx, "HOOD", length=3, points=3))
 
     values = result["values"]
-    assert len(values) == 3
-    assert values[-1]["rsi_5"] == pytest.approx(40.0 + len(frame) - 1)
+    expected = _wilder_rsi(close, 3).tail(3)
+    assert [row["timestamp"] for row in values] == [ts.isoformat() for ts in index[-3:]]
+    for row, value in zip(values, expected, strict=True):
+        assert row["rsi_3"] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("length", [2, 3, 5])
+def test_rsi_kernel_matches_wilder_smoothing(length):
+    close = pd.Series([10.0, 11.0, 10.5, 12.0, 11.0, 11.5, 13.0, 12.5])
+    expected = _wilder_rsi(close, length).to_numpy()
+    np.testing.assert_allclose(_kernels.rsi(close.to_numpy(), length), expected, equal_nan=True)
+
+
+def test_rsi_serves_repeat_calls_from_indicator_cache(monkeypatch, dummy_ctx, price_data):
+    frame, metadata = price_data
+    fetches: list[dict[str, Any]] = []
+
+    async def fake_fetch(ctx, symbol, **kwargs):
+        fetches.append(kwargs)
+        return frame, metadata
+
+    monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
+
+    first = run_tool(momentum.rsi(dummy_ctx, "HOOD", length=3, points=2))
+    again = run_tool(momentum.rsi(dummy_ctx, "hood", length=3, points=2))
+    other = run_tool(momentum.rsi(dummy_ctx, "HOOD", length=4, points=2))
+
+    assert len(fetches) == 2
+    assert again is first
+    # Closes only rise, so every warmed-up RSI is 100.
+    assert other["values"][-1]["rsi_4"] == pytest.approx(100.0)
 
 
 def test_rsi_rejects_short_length(dummy_ctx):
@@ -210,31 +255,26 @@ def test_stoch_returns_expected_values(monkeypatch, dummy_ctx, ohlcv_data):
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_stoch(high, low, close, *, k, d, smooth_k):
-        values = pd.DataFrame(
-            {
-                "STOCHk": pd.Series([40.0, 50.0, 60.0, 70.0, 80.0, 90.0], index=close.index),
-                "STOCHd": pd.Series([35.0, 45.0, 55.0, 65.0, 75.0, 85.0], index=close.index),
-            }
-        )
-        return values
-
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        momentum,
-        "pandas_ta",
-        SimpleNamespace(
-            stoch=fake_stoch,
-            rsi=momentum.pandas_ta.rsi if hasattr(momentum.pandas_ta, "rsi") else fake_stoch,
-        ),
-    )
 
-    result = run_tool(momentum.stoch(dummy_ctx, "HOOD", k_length=5, d_length=3, smooth_k=3, points=3))
+    result = run_tool(momentum.stoch(dummy_ctx, "HOOD", k_length=2, d_length=2, smooth_k=2, points=3))
+
+    lowest = frame["low"].rolling(2).min()
+    fast = 100 * (frame["close"] - lowest) / (frame["high"].rolling(2).max() - lowest)
+    slow_k = fast.rolling(2).mean()
+    slow_d = slow_k.rolling(2).mean()
 
     values = result["values"]
     assert len(values) == 3
-    for row in values:
-        assert set(row.keys()) == {"timestamp", "STOCHk", "STOCHd"}
+    assert [row["STOCHk_2_2_2"] for row in values] == pytest.approx(slow_k.tail(3).round(6).tolist())
+    assert [row["STOCHd_2_2_2"] for row in values] == pytest.approx(slow_d.tail(3).round(6).tolist())
+
+
+def test_stoch_kernel_treats_flat_range_as_epsilon():
+    flat = np.full(4, 10.0)
+    slow_k, slow_d = _kernels.stoch(flat, flat, flat, 2, 1, 1)
+    np.testing.assert_array_equal(slow_k, [np.nan, 0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(slow_d, slow_k)
 
 
 def test_vwap_returns_series(monkeypatch, dummy_ctx, ohlcv_data):
@@ -243,21 +283,50 @@ def test_vwap_returns_series(monkeypatch, dummy_ctx, ohlcv_data):
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_vwap(high, low, close, volume, *, length=None):
-        return pd.Series([100.0 + idx for idx in range(len(close))], index=close.index)
-
     monkeypatch.setattr(overlays, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        overlays,
-        "pandas_ta",
-        SimpleNamespace(vwap=fake_vwap, pivot_points=None, bbands=None),
-    )
 
     result = run_tool(overlays.vwap(dummy_ctx, "HOOD", length=5, points=2))
 
+    # Daily bars each open a new session, so VWAP is the bar's typical price.
+    typical = (frame["high"] + frame["low"] + frame["close"]) / 3
     values = result["values"]
     assert len(values) == 2
-    assert values[-1]["vwap"] == pytest.approx(100.0 + len(frame) - 1)
+    assert [row["vwap"] for row in values] == pytest.approx(typical.tail(2).tolist())
+    assert result["length"] == 5
+
+
+def test_vwap_accumulates_within_each_day(monkeypatch, dummy_ctx):
+    index = pd.DatetimeIndex(
+        ["2024-01-02T14:30", "2024-01-02T15:00", "2024-01-03T14:30", "2024-01-03T15:00"],
+        tz="UTC",
+    )
+    close = [10.0, 20.0, 30.0, 40.0]
+    frame = pd.DataFrame({"high": close, "low": close, "close": close, "volume": [1.0, 3.0, 2.0, 2.0]}, index=index)
+
+    async def fake_fetch(ctx, symbol, **kwargs):
+        return frame, {"symbol": "HOOD", "interval": "30m", "start": None, "end": "", "candles_returned": 4}
+
+    monkeypatch.setattr(overlays, "fetch_price_frame", fake_fetch)
+
+    result = run_tool(overlays.vwap(dummy_ctx, "HOOD", interval="30m", points=10))
+
+    assert [row["vwap"] for row in result["values"]] == pytest.approx([10.0, 17.5, 30.0, 35.0])
+
+
+def test_vwap_drops_zero_and_missing_volume_rows(monkeypatch, dummy_ctx, ohlcv_data):
+    frame, metadata = ohlcv_data
+    frame = frame.copy()
+    frame["volume"] = [100.0, 0.0, float("nan"), 160.0, 180.0, 200.0]
+
+    async def fake_fetch(ctx, symbol, **kwargs):
+        return frame, metadata
+
+    monkeypatch.setattr(overlays, "fetch_price_frame", fake_fetch)
+
+    result = run_tool(overlays.vwap(dummy_ctx, "HOOD", points=10))
+
+    timestamps = [row["timestamp"] for row in result["values"]]
+    assert timestamps == [ts.isoformat() for ts in frame.index[[0, 3, 4, 5]]]
 
 
 def test_vwap_requires_positive_volume(monkeypatch, dummy_ctx, ohlcv_data):
@@ -359,7 +428,7 @@ def test_bollinger_bands_returns_values(monkeypatch, dummy_ctx, price_data):
         ),
     )
 
-    result = run_tool(overlays.bollinger_bands(dummy_ctx, "HOOD", length=3, points=2))
+    result = run_tool(overlays.bollinger_bands(dummy_ctx, "HOOD", length=3, ma_mode="ema", points=2))
 
     values = result["values"]
     assert len(values) == 2
@@ -367,37 +436,83 @@ def test_bollinger_bands_returns_values(monkeypatch, dummy_ctx, price_data):
     assert {"timestamp", "BBL", "BBM", "BBU"}.issubset(last.keys())
 
 
-def test_macd_returns_expected_values(monkeypatch, dummy_ctx, price_data):
+def test_bollinger_bands_sma_uses_fused_kernel(monkeypatch, dummy_ctx, price_data):
     frame, metadata = price_data
 
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_macd(series, *, fast, slow, signal):
-        data = pd.DataFrame(
-            {
-                "MACD": pd.Series(range(len(series)), index=series.index),
-                "MACDs": pd.Series(range(len(series)), index=series.index) + 1,
-            }
-        )
-        return data
+    monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
+    monkeypatch.setattr(overlays, "pandas_ta", SimpleNamespace(bbands=None))
+
+    result = run_tool(overlays.bollinger_bands(dummy_ctx, "HOOD", length=3, points=1))
+
+    close = frame["close"].astype(float)
+    mid = close.rolling(3).mean().iloc[-1]
+    offset = 2.0 * close.rolling(3).std(ddof=0).iloc[-1]
+    (last,) = result["values"]
+    assert last["BBM_3_2.0"] == pytest.approx(mid)
+    assert last["BBL_3_2.0"] == pytest.approx(mid - offset)
+    assert last["BBU_3_2.0"] == pytest.approx(mid + offset)
+    assert last["BBB_3_2.0"] == pytest.approx(100 * 2 * offset / mid, rel=1e-5)
+    assert last["BBP_3_2.0"] == pytest.approx((close.iloc[-1] - (mid - offset)) / (2 * offset), rel=1e-5)
+
+
+def test_bollinger_bands_wma_centers_bands_on_weighted_mean(monkeypatch, dummy_ctx, price_data):
+    frame, metadata = price_data
+
+    async def fake_fetch(ctx, symbol, **kwargs):
+        return frame, metadata
 
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        trend,
-        "pandas_ta",
-        SimpleNamespace(
-            macd=fake_macd,
-            atr=lambda *args, **kwargs: None,
-            adx=lambda *args, **kwargs: None,
-        ),
-    )
+    monkeypatch.setattr(overlays, "pandas_ta", SimpleNamespace(bbands=None))
+
+    result = run_tool(overlays.bollinger_bands(dummy_ctx, "HOOD", length=3, ma_mode="WMA", points=1))
+
+    close = frame["close"].astype(float)
+    mid = (close.iloc[-3:].to_numpy() @ np.array([1.0, 2.0, 3.0])) / 6
+    offset = 2.0 * close.rolling(3).std(ddof=0).iloc[-1]
+    (last,) = result["values"]
+    assert result["ma_mode"] == "WMA"
+    assert last["BBM_3_2.0"] == pytest.approx(mid)
+    assert last["BBL_3_2.0"] == pytest.approx(mid - offset)
+    assert last["BBU_3_2.0"] == pytest.approx(mid + offset)
+    assert last["BBB_3_2.0"] == pytest.approx(100 * 2 * offset / mid, rel=1e-5)
 
-    result = run_tool(trend.macd(dummy_ctx, "HOOD", fast_length=5, slow_length=10, signal_length=3, points=3))
+
+def test_macd_returns_expected_values(monkeypatch, dummy_ctx, price_data):
+    _, metadata = price_data
+    index = pd.date_range("2024-01-01", periods=10, freq="D", tz="UTC")
+    close = pd.Series([10.0, 11.0, 10.5, 12.0, 11.0, 11.5, 13.0, 12.5, 14.0, 13.5], index=index)
+    frame = pd.DataFrame({"close": close})
+
+    async def fake_fetch(ctx, symbol, **kwargs):
+        return frame, metadata
+
+    monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
+    monkeypatch.setattr(trend, "pandas_ta", SimpleNamespace(macd=None))
+
+    result = run_tool(trend.macd(dummy_ctx, "HOOD", fast_length=2, slow_length=4, signal_length=3, points=3))
+
+    # TA-Lib-aligned EMAs: each seeded with the SMA ending at its own lookback.
+    line = _seeded_ema(close, 2, seed=1) - _seeded_ema(close, 4, seed=3)
+    signal = _seeded_ema(line, 3, seed=5)
 
     values = result["values"]
-    assert len(values) == 3
-    assert {"timestamp", "MACD", "MACDs"}.issubset(values[-1].keys())
+    assert [row["timestamp"] for row in values] == [ts.isoformat() for ts in index[-3:]]
+    for row, (ts, expected) in zip(values, line.tail(3).items(), strict=True):
+        assert row["MACD_2_4_3"] == pytest.approx(expected, abs=1e-6)
+        assert row["MACDs_2_4_3"] == pytest.approx(signal[ts], abs=1e-6)
+        assert row["MACDh_2_4_3"] == pytest.approx(expected - signal[ts], abs=1e-6)
+
+
+def test_macd_kernel_waits_for_signal_warmup():
+    close = np.arange(1.0, 7.0)
+    line, histogram, signal = _kernels.macd(close, 2, 4, 3)
+
+    assert np.isnan(line[:3]).all() and not np.isnan(line[3:]).any()
+    assert np.isnan(signal[:5]).all() and not np.isnan(signal[5:]).any()
+    np.testing.assert_allclose(histogram, line - signal, equal_nan=True)
 
 
 def test_atr_returns_series(monkeypatch, dummy_ctx, ohlcv_data):
@@ -741,25 +856,14 @@ def test_moving_average_defaults_to_default_points_not_length(monkeypatch, dummy
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_sma(series, *, length):
-        return series.rolling(length, min_periods=1).mean()
-
-    def fake_ema(series, *, length):
-        return series.ewm(span=length, adjust=False).mean()
-
     monkeypatch.setattr(base, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        moving_average,
-        "pandas_ta",
-        SimpleNamespace(sma=fake_sma, ema=fake_ema),
-    )
 
-    result = run_tool(moving_average.moving_average(dummy_ctx, "HOOD", length=5))
+    result = run_tool(moving_average.moving_average(dummy_ctx, "HOOD", length=2))
 
     values = result["values"]
     assert len(values) == base.DEFAULT_POINTS
-    last_value = frame["close"].rolling(5, min_periods=1).mean().iloc[-1]
-    assert values[-1]["sma_5"] == pytest.approx(float(last_value))
+    last_value = frame["close"].rolling(2).mean().iloc[-1]
+    assert values[-1]["sma_2"] == pytest.approx(float(last_value))
 
 
 def test_atr_defaults_to_default_points_not_length(monkeypatch, dummy_ctx, ohlcv_data):
@@ -795,21 +899,13 @@ def test_vwap_defaults_to_default_points_not_length(monkeypatch, dummy_ctx, ohlc
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
-    def fake_vwap(high, low, close, volume, *, length=None):
-        return pd.Series([100.0 + idx for idx in range(len(close))], index=close.index)
-
     monkeypatch.setattr(overlays, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        overlays,
-        "pandas_ta",
-        SimpleNamespace(vwap=fake_vwap, pivot_points=None, bbands=None),
-    )
 
     result = run_tool(overlays.vwap(dummy_ctx, "HOOD", length=5))
 
     values = result["values"]
     assert len(values) == base.DEFAULT_POINTS
-    assert values[-1]["vwap"] == pytest.approx(100.0 + len(frame) - 1)
+    assert values[-1]["vwap"] == pytest.approx((15 + 13 + 15) / 3)
 
 
 def test_pivot_points_defaults_to_default_points_not_lookback(monkeypatch, dummy_ctx, ohlcv_data):
@@ -831,6 +927,169 @@ def test_pivot_points_defaults_to_default_points_not_lookback(monkeypatch, dummy
 # ---------------------------------------------------------------------------
 
 
+class DummyPriceHistoryClient:
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    def __getattr__(self, name: str):
+        if not name.startswith("get_price_history_every_"):
+            raise AttributeError(name)
+        self.lookups += 1
+
+        async def fetch(symbol, **kwargs):
+            return {"symbol": symbol, "candles": []}
+
+        fetch.__name__ = name
+        return fetch
+
+
+def test_fetch_price_frame_resolves_fetcher_once_per_context(monkeypatch):
+    captured: list[Any] = []
+
+    async def fake_call(func, *args, **kwargs):
+        captured.append(func)
+        return await func(*args, **kwargs)
+
+    monkeypatch.setattr(base, "call", fake_call)
+
+    client = DummyPriceHistoryClient()
+    ctx = make_ctx(client)
+
+    for bars in (5, 6, 7):
+        frame, metadata = run(base.fetch_price_frame(ctx, "spy", interval="1D", bars=bars))
+        assert frame.empty
+        assert metadata["symbol"] == "SPY"
+        assert metadata["interval"] == "1d"
+
+    run(base.fetch_price_frame(ctx, "spy", interval="5m", bars=5))
+
+    assert client.lookups == 2
+    assert [func.__name__ for func in captured] == ["get_price_history_every_day"] * 3 + [
+        "get_price_history_every_five_minutes"
+    ]
+
+
+def test_candles_to_dataframe_builds_sorted_utc_frame():
+    candles = [
+        {"datetime": 1_700_000_060_000, "open": 2, "high": 3, "low": 1, "close": 2.5, "volume": 20},
+        {"datetime": 1_700_000_000_000, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10},
+        {"open": 9, "close": 9},
+    ]
+
+    frame = base._candles_to_dataframe(candles)
+
+    assert list(frame.columns) == ["open", "high", "low", "close", "volume"]
+    # pandas 2 builds a nanosecond index from epoch ms, pandas 3 keeps ms.
+    assert isinstance(frame.index, pd.DatetimeIndex)
+    assert str(frame.index.tz) == "UTC"
+    assert frame.index.is_monotonic_increasing
+    assert frame["close"].tolist() == [1.5, 2.5]
+    assert frame.dtypes.unique().tolist() == [float]
+
+
+def test_candles_to_dataframe_keeps_sorted_order_and_drops_empty_rows():
+    candles = [
+        {"datetime": 1_700_000_000_000, "close": 1.5, "volume": 10},
+        {"datetime": 1_700_000_060_000, "close": None, "volume": None},
+        {"datetime": 1_700_000_120_000, "close": None, "volume": 30},
+    ]
+
+    frame = base._candles_to_dataframe(candles)
+
+    assert frame.index.is_monotonic_increasing
+    assert frame["volume"].tolist() == [10.0, 30.0]
+    assert math.isnan(frame["close"].iloc[1])
+
+
+def test_candles_to_dataframe_coerces_malformed_values_and_omits_missing_columns():
+    candles = [
+        {"datetime": 1_700_000_000_000, "open": 1, "close": "bad"},
+        {"datetime": 1_700_000_060_000, "open": 2, "close": "2.5"},
+    ]
+
+    frame = base._candles_to_dataframe(candles)
+
+    assert list(frame.columns) == ["open", "close"]
+    assert math.isnan(frame["close"].iloc[0])
+    assert frame["close"].iloc[1] == 2.5
+    assert base._candles_to_dataframe([]).empty
+
+
+def test_fetch_price_frame_shares_concurrent_covering_window(monkeypatch):
+    calls: list[dict[str, Any]] = []
+    end = "2024-01-02T00:00:00+00:00"
+    end_ms = 1_704_153_600_000
+    candles = [{"datetime": end_ms - minutes * 60_000, "close": float(minutes)} for minutes in range(10, 0, -1)]
+
+    async def fake_call(func, *args, **kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0)
+        return {"symbol": "SPY", "candles": candles}
+
+    monkeypatch.setattr(base, "call", fake_call)
+    ctx = make_ctx(DummyPriceHistoryClient())
+
+    async def fetch_both():
+        return await asyncio.gather(
+            base.fetch_price_frame(ctx, "SPY", interval="1m", end=end, bars=10),
+            base.fetch_price_frame(ctx, "SPY", interval="1m", end=end, bars=3),
+        )
+
+    (wide, _), (narrow, _) = run(fetch_both())
+
+    assert len(calls) == 1
+    assert len(wide) == 10
+    assert narrow["close"].tolist() == [3.0, 2.0, 1.0]
+    assert base._PENDING_WINDOWS == {}
+
+
+def test_fetch_price_frame_serves_repeat_window_from_cache(monkeypatch):
+    calls: list[dict[str, Any]] = []
+
+    async def fake_call(func, *args, **kwargs):
+        calls.append(kwargs)
+        return {"symbol": "SPY", "candles": [{"datetime": 1_704_153_540_000, "close": 1.0}]}
+
+    monkeypatch.setattr(base, "call", fake_call)
+    ctx = make_ctx(DummyPriceHistoryClient())
+    end = "2024-01-02T00:00:00+00:00"
+
+    first, _ = run(base.fetch_price_frame(ctx, "SPY", interval="1m", end=end, bars=5))
+    second, metadata = run(base.fetch_price_frame(ctx, "spy", interval="1m", end=end, bars=5))
+    run(base.fetch_price_frame(ctx, "SPY", interval="5m", end=end, bars=5))
+
+    assert len(calls) == 2
+    assert second["close"].tolist() == first["close"].tolist() == [1.0]
+    assert metadata["candles_returned"] == 1
+
+
+def test_parse_utc_normalizes_to_utc():
+    utc = base._dt.timezone.utc
+    expected = base._dt.datetime(2024, 1, 2, 15, 30, tzinfo=utc)
+
+    assert base._parse_utc(None) is None
+    assert base._parse_utc("2024-01-02T15:30:00") == expected
+    assert base._parse_utc(base._dt.datetime(2024, 1, 2, 15, 30)) == expected
+    for value in ("2024-01-02T15:30:00+00:00", "2024-01-02T10:30:00-05:00"):
+        parsed = base._parse_utc(value)
+        assert parsed is not None
+        assert parsed == expected
+        assert parsed.tzinfo is utc
+
+
+def test_default_end_is_aligned_to_the_next_minute():
+    end = base._default_end()
+    assert end.second == 0
+    assert end.microsecond == 0
+    assert end > base._dt.datetime.now(tz=base._dt.timezone.utc)
+
+
+def test_importing_tools_does_not_import_pandas_ta():
+    code = "import sys, schwab_mcp.tools; sys.exit('pandas_ta_classic' in sys.modules or 'pandas' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    assert subprocess.run([sys.executable, "-c", code], check=False, env=env).returncode == 0  # noqa: S603
+
+
 def test_normalize_interval_rejects_unknown_interval():
     with pytest.raises(ValueError, match="Unsupported interval"):
         base.normalize_interval("2h")
@@ -876,6 +1135,27 @@ def test_series_to_json_with_limit_none_returns_all_rows():
     assert len(rows) == 5
 
 
+def test_series_to_json_limit_counts_only_non_nan_values():
+    index = pd.date_range("2024-01-01", periods=4, tz="UTC")
+    series = pd.Series([1.0, 2.0, float("nan"), 4.0], index=index)
+
+    assert base.series_to_json(series, limit=2, value_key="v") == [
+        {"timestamp": "2024-01-02T00:00:00+00:00", "v": 2.0},
+        {"timestamp": "2024-01-04T00:00:00+00:00", "v": 4.0},
+    ]
+
+
+def test_series_to_json_skips_unparseable_timestamps_and_returns_python_floats():
+    index = pd.Index(["2024-01-01", "not-a-date", "2024-01-03"])
+    s = pd.Series([1.1234567, 2.0, 3.0], index=index)
+    rows = base.series_to_json(s, value_key="x")
+    assert rows == [
+        {"timestamp": "2024-01-01T00:00:00+00:00", "x": 1.123457},
+        {"timestamp": "2024-01-03T00:00:00+00:00", "x": 3.0},
+    ]
+    assert all(type(row["x"]) is float for row in rows)
+
+
 def test_series_to_json_non_datetime_index_is_normalized():
     # String index → converted via pd.to_datetime path (covers non-DatetimeIndex branch)
     index = pd.Index(["2024-01-01", "2024-01-02"])
@@ -906,6 +1186,63 @@ def test_frame_to_json_with_limit_none_returns_all_rows():
     assert len(rows) == 4
 
 
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.date_range("2024-01-01", periods=3, freq="min", tz="UTC"),
+        pd.DatetimeIndex(["2024-01-01T00:00:00.250", "2024-01-01T00:00:01"], tz="UTC"),
+        pd.DatetimeIndex(["2024-01-01", None], tz="UTC"),
+    ],
+    ids=["whole-seconds", "sub-second", "nat"],
+)
+def test_isoformat_index_matches_timestamp_isoformat(index):
+    assert base._isoformat_index(index) == [timestamp.isoformat() for timestamp in index]
+
+
+def test_frame_to_json_skips_missing_cells_and_empty_rows():
+    index = pd.date_range("2024-01-01", periods=3, tz="UTC")
+    frame = pd.DataFrame({"a": [1.23456789, None, 3.0], "b": [None, None, 4]}, index=index)
+
+    assert base.frame_to_json(frame) == [
+        {"timestamp": "2024-01-01T00:00:00+00:00", "a": 1.234568},
+        {"timestamp": "2024-01-03T00:00:00+00:00", "a": 3.0, "b": 4.0},
+    ]
+
+
+def test_frame_to_json_limit_counts_only_rows_with_values():
+    index = pd.date_range("2024-01-01", periods=4, tz="UTC")
+    frame = pd.DataFrame({"a": [1.0, 2.0, None, None], "b": [5.0, None, 7.0, None]}, index=index)
+
+    assert base.frame_to_json(frame, limit=2) == [
+        {"timestamp": "2024-01-02T00:00:00+00:00", "a": 2.0},
+        {"timestamp": "2024-01-03T00:00:00+00:00", "b": 7.0},
+    ]
+
+
+def test_frame_to_json_only_coerces_non_numeric_frames(monkeypatch):
+    index = pd.date_range("2024-01-01", periods=2, tz="UTC")
+    coerced: list[str] = []
+    to_numeric = pd.to_numeric
+
+    def tracking_to_numeric(values, *args, **kwargs):
+        coerced.append(str(values.name))
+        return to_numeric(values, *args, **kwargs)
+
+    monkeypatch.setattr(base.pd, "to_numeric", tracking_to_numeric)
+
+    assert base.frame_to_json(pd.DataFrame({"a": [1.0, 2.0]}, index=index), limit=1) == [
+        {"timestamp": "2024-01-02T00:00:00+00:00", "a": 2.0}
+    ]
+    assert coerced == []
+
+    mixed = pd.DataFrame({"a": [1.0, 2.0], "b": ["3.5", "x"]}, index=index)
+    assert base.frame_to_json(mixed) == [
+        {"timestamp": "2024-01-01T00:00:00+00:00", "a": 1.0, "b": 3.5},
+        {"timestamp": "2024-01-02T00:00:00+00:00", "a": 2.0},
+    ]
+    assert coerced == ["a", "b"]
+
+
 # ---------------------------------------------------------------------------
 # base.py — compute_series_indicator error branches
 # ---------------------------------------------------------------------------
@@ -1263,43 +1600,15 @@ def test_vwap_rejects_non_positive_length(monkeypatch, dummy_ctx, ohlcv_data):
         run(overlays.vwap(dummy_ctx, "HOOD", length=0))
 
 
-def test_vwap_raises_when_pandas_ta_returns_none(monkeypatch, dummy_ctx, ohlcv_data):
-    frame, metadata = ohlcv_data
-
-    async def fake_fetch(ctx, symbol, **kwargs):
-        return frame, metadata
-
-    monkeypatch.setattr(overlays, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        overlays,
-        "pandas_ta",
-        SimpleNamespace(
-            vwap=lambda *args, **kwargs: None,
-            pivot_points=None,
-            bbands=None,
-        ),
-    )
-
-    with pytest.raises(RuntimeError, match="returned no values"):
-        run(overlays.vwap(dummy_ctx, "HOOD"))
-
-
 def test_vwap_raises_when_result_all_nan(monkeypatch, dummy_ctx, ohlcv_data):
     frame, metadata = ohlcv_data
+    frame = frame.copy()
+    frame["close"] = float("nan")
 
     async def fake_fetch(ctx, symbol, **kwargs):
         return frame, metadata
 
     monkeypatch.setattr(overlays, "fetch_price_frame", fake_fetch)
-    monkeypatch.setattr(
-        overlays,
-        "pandas_ta",
-        SimpleNamespace(
-            vwap=lambda high, low, close, volume, **kw: pd.Series([float("nan")] * len(close), index=close.index),
-            pivot_points=None,
-            bbands=None,
-        ),
-    )
 
     with pytest.raises(ValueError, match="Not enough price history"):
         run(overlays.vwap(dummy_ctx, "HOOD"))
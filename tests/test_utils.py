@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import datetime
+import enum
+
 import pytest
 
+from schwab_mcp.tools import utils
 from schwab_mcp.tools.utils import (
+    JSONType,
+    RateLimiter,
     SchwabAPIError,
     call,
+    enum_member,
+    gather_keyed,
     parse_date,
     parse_datetime,
+    parse_list,
+    parse_symbols,
     strip_noise,
 )
 
@@ -202,6 +212,21 @@ class TestNoContentResponses:
         result = run(call(fake_endpoint))
         assert result is None
 
+    def test_parses_json_when_status_code_is_missing(self):
+        class ResponseWithoutStatus:
+            content = b'{"ok": true}'
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"ok": True}
+
+        async def fake_endpoint():
+            return ResponseWithoutStatus()
+
+        assert run(call(fake_endpoint)) == {"ok": True}
+
 
 class TestJSONParseFailure:
     def test_raises_value_error_on_invalid_json(self):
@@ -229,6 +254,257 @@ class TestJSONParseFailure:
         assert exc_info.value.__cause__ is not None
 
 
+class TestHttpxJSONDecoding:
+    @staticmethod
+    def _endpoint(body: bytes):
+        import httpx
+
+        async def endpoint():
+            return httpx.Response(200, content=body, request=httpx.Request("GET", "https://api.schwabapi.com/x"))
+
+        return endpoint
+
+    def test_decodes_with_fast_loader_when_available(self, monkeypatch):
+        seen: list[bytes] = []
+
+        def fake_loads(data):
+            seen.append(data)
+            return {"fast": True}
+
+        monkeypatch.setattr(utils, "_json_loads", fake_loads)
+
+        assert run(call(self._endpoint(b'{"fast": false}'))) == {"fast": True}
+        assert seen == [b'{"fast": false}']
+
+    def test_falls_back_to_response_json(self, monkeypatch):
+        monkeypatch.setattr(utils, "_json_loads", None)
+
+        assert run(call(self._endpoint(b'{"a": [1, 2]}'))) == {"a": [1, 2]}
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError, match="Expected JSON response"):
+            run(call(self._endpoint(b"not json")))
+
+
+class TestEncodeJSON:
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_encodes_compact_json(self, monkeypatch, fast):
+        if not fast:
+            monkeypatch.setattr(utils, "_json_dumps", None)
+
+        text = utils.encode_json({"symbol": "SPY", "bars": [1, 2.5, None], "when": datetime.date(2024, 1, 2)})
+
+        assert text == '{"symbol":"SPY","bars":[1,2.5,null],"when":"2024-01-02"}'
+
+
+class TestRateLimiter:
+    def test_allows_burst_then_waits_for_window(self, monkeypatch):
+        monkeypatch.setattr(utils.time, "monotonic", lambda: 100.0)
+        limiter = RateLimiter(max_rate=3, time_period=3.0)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        assert delays == [0.0, 0.0, 0.0, 3.0, 3.0]
+
+    def test_refills_after_idle_period(self, monkeypatch):
+        now = {"value": 0.0}
+        monkeypatch.setattr(utils.time, "monotonic", lambda: now["value"])
+        limiter = RateLimiter(max_rate=2, time_period=2.0)
+
+        assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 2.0]
+
+        now["value"] = 10.0
+        assert [limiter.reserve() for _ in range(2)] == [0.0, 0.0]
+
+    def test_no_window_exceeds_max_rate(self, monkeypatch):
+        now = {"value": 0.0}
+        monkeypatch.setattr(utils.time, "monotonic", lambda: now["value"])
+        limiter = RateLimiter(max_rate=120, time_period=60.0)
+
+        # A greedy caller fans out bursts as fast as the clock allows.
+        sent: list[float] = []
+        for step in range(1000):
+            sent.append(now["value"] + limiter.reserve())
+            now["value"] += 0.05 if step % 7 else 3.0
+
+        # Request N and request N + 120 must be a full window apart (give or
+        # take float rounding from rebuilding send times as now + delay).
+        sent.sort()
+        assert all(later - earlier >= 60.0 - 1e-9 for earlier, later in zip(sent, sent[120:]))
+
+    def test_acquire_sleeps_for_reserved_delay(self, monkeypatch):
+        slept: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            slept.append(delay)
+
+        monkeypatch.setattr(utils.time, "monotonic", lambda: 50.0)
+        monkeypatch.setattr(utils.asyncio, "sleep", fake_sleep)
+        limiter = RateLimiter(max_rate=1, time_period=0.5)
+
+        run(limiter.acquire())
+        run(limiter.acquire())
+
+        assert slept == [0.5]
+
+    def test_rejects_non_positive_limits(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            RateLimiter(max_rate=0, time_period=1.0)
+
+    def test_call_acquires_given_limiter(self):
+        acquired: list[bool] = []
+
+        class RecordingLimiter(RateLimiter):
+            async def acquire(self) -> None:
+                acquired.append(True)
+
+        async def fake_endpoint():
+            return MockResponse(json_data={"ok": True}, content=b'{"ok": true}')
+
+        limiter = RecordingLimiter(max_rate=1, time_period=1.0)
+        assert run(call(fake_endpoint, rate_limiter=limiter)) == {"ok": True}
+        assert acquired == [True]
+
+    def test_call_without_limiter_is_unpaced(self, monkeypatch):
+        async def fail_sleep(delay: float) -> None:
+            raise AssertionError("unpaced call should not sleep")
+
+        async def fake_endpoint():
+            return MockResponse(json_data={"ok": True}, content=b'{"ok": true}')
+
+        monkeypatch.setattr(utils.asyncio, "sleep", fail_sleep)
+
+        assert [run(call(fake_endpoint)) for _ in range(3)] == [{"ok": True}] * 3
+
+
+class TestCoalescedCall:
+    @staticmethod
+    def _counting_endpoint(calls: list[tuple]):
+        import asyncio
+
+        async def endpoint(*args, **kwargs):
+            calls.append((args, kwargs))
+            await asyncio.sleep(0)
+            return MockResponse(json_data={"args": list(args)}, content=b"{}")
+
+        return endpoint
+
+    @staticmethod
+    def _gather(*coros):
+        import asyncio
+
+        async def runner():
+            return await asyncio.gather(*coros)
+
+        return run(runner())
+
+    def test_identical_concurrent_reads_share_one_request(self):
+        calls: list[tuple] = []
+        endpoint = self._counting_endpoint(calls)
+
+        results = self._gather(
+            call(endpoint, "SPY", limit=1, coalesce=True),
+            call(endpoint, "SPY", limit=1, coalesce=True),
+        )
+
+        assert len(calls) == 1
+        assert results == [{"args": ["SPY"]}, {"args": ["SPY"]}]
+        assert utils._IN_FLIGHT == {}
+
+    def test_distinct_arguments_are_not_coalesced(self):
+        calls: list[tuple] = []
+        endpoint = self._counting_endpoint(calls)
+
+        self._gather(
+            call(endpoint, "SPY", coalesce=True),
+            call(endpoint, "QQQ", coalesce=True),
+        )
+
+        assert len(calls) == 2
+
+    def test_calls_are_not_coalesced_by_default(self):
+        calls: list[tuple] = []
+        endpoint = self._counting_endpoint(calls)
+
+        self._gather(call(endpoint, "SPY"), call(endpoint, "SPY"))
+
+        assert len(calls) == 2
+
+    def test_unhashable_arguments_fall_back_to_direct_requests(self):
+        calls: list[tuple] = []
+        endpoint = self._counting_endpoint(calls)
+
+        self._gather(
+            call(endpoint, ["SPY"], coalesce=True),
+            call(endpoint, ["SPY"], coalesce=True),
+        )
+
+        assert len(calls) == 2
+
+
+class TestGatherKeyed:
+    def test_maps_keys_to_results_and_errors_in_order(self):
+        async def fetch(key: str) -> JSONType:
+            if key == "BAD":
+                raise ValueError("boom")
+            return {"key": key}
+
+        result = run(gather_keyed(["A", "BAD", "C"], fetch))
+
+        assert result == {"A": {"key": "A"}, "BAD": {"error": "boom"}, "C": {"key": "C"}}
+        assert list(result) == ["A", "BAD", "C"]
+
+    def test_limits_in_flight_calls_to_chunk_size(self):
+        import asyncio
+
+        in_flight = {"current": 0, "peak": 0}
+
+        async def fetch(key: int) -> JSONType:
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0)
+            in_flight["current"] -= 1
+            return key
+
+        keys = list(range(7))
+
+        assert run(gather_keyed(keys, fetch, chunk_size=3)) == {key: key for key in keys}
+        assert in_flight["peak"] == 3
+
+    def test_propagates_non_exception_errors(self):
+        import asyncio
+
+        async def fetch(key: str) -> JSONType:
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            run(gather_keyed(["A"], fetch))
+
+    def test_empty_keys_return_empty_mapping(self):
+        async def fetch(key: str) -> JSONType:
+            raise AssertionError("no call expected")
+
+        assert run(gather_keyed([], fetch)) == {}
+
+
+class TestEnumMember:
+    Color = enum.Enum("Color", "RED GREEN")
+
+    def test_lookup_is_case_insensitive(self):
+        assert enum_member(self.Color, "red") is self.Color.RED
+        assert enum_member(self.Color, "Green") is self.Color.GREEN
+
+    def test_repeated_lookups_hit_cache(self):
+        enum_member.cache_clear()
+        enum_member(self.Color, "RED")
+        enum_member(self.Color, "RED")
+        assert enum_member.cache_info().hits == 1
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(ValueError, match="Invalid Color: 'blue'. Must be one of: RED, GREEN"):
+            enum_member(self.Color, "blue")
+
+
 class TestParseDateFunction:
     def test_parse_date_with_none(self):
         assert parse_date(None) is None
@@ -254,6 +530,52 @@ class TestParseDateFunction:
         result = parse_date(input_datetime)
         assert result == datetime.date(2024, 3, 15)
 
+    def test_parse_date_with_datetime_subclass(self):
+        import datetime
+
+        class Timestamp(datetime.datetime):
+            pass
+
+        assert parse_date(Timestamp(2024, 3, 15, 10, 30)) == datetime.date(2024, 3, 15)
+
+    def test_parse_date_rejects_unsupported_type(self):
+        with pytest.raises(TypeError, match="Unsupported date value"):
+            parse_date(20240315)  # type: ignore[arg-type]
+
+    def test_parse_date_accepts_unpadded_string(self):
+        import datetime
+
+        assert parse_date("2024-3-5") == datetime.date(2024, 3, 5)
+
+    @pytest.mark.parametrize("value", ["03/15/2024", "20240315", "2024-W11-5", "2024-075"])
+    def test_parse_date_rejects_non_iso_string(self, value):
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            parse_date(value)
+
+    @pytest.mark.parametrize("value", ["2024-13-5", "2024-2-30", "24-3-5", "2024-3-5-1", "2024-+3-5"])
+    def test_parse_date_rejects_invalid_unpadded_string(self, value):
+        with pytest.raises(ValueError):
+            parse_date(value)
+
+
+class TestParseList:
+    def test_splits_strips_and_dedupes_strings(self):
+        assert parse_list(" AAPL, msft,,AAPL ,SPY ") == ["AAPL", "msft", "SPY"]
+
+    def test_keeps_inner_spaces_of_option_symbols(self):
+        assert parse_list("AAPL  240119C00150000, SPY") == ["AAPL  240119C00150000", "SPY"]
+
+    def test_dedupes_lists_without_rewriting_items(self):
+        assert parse_list(["SPY", "QQQ", "SPY"]) == ["SPY", "QQQ"]
+
+
+class TestParseSymbols:
+    def test_strips_uppercases_and_dedupes_strings(self):
+        assert parse_symbols(" spy, QQQ,,SPY ") == ["SPY", "QQQ"]
+
+    def test_strips_uppercases_and_dedupes_lists(self):
+        assert parse_symbols([" spy", "SPY", "", "qqq"]) == ["SPY", "QQQ"]
+
 
 class TestStripNoise:
     def test_none_is_stripped_from_dict(self):